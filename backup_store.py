@@ -0,0 +1,248 @@
+"""
+Camera Spoofer - Armazenamento do Backup
+Backup dos nomes originais em um snapshot JSON mais um journal de registros
+anexados (um JSON por linha), compactado periodicamente no snapshot.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+# Número de registros no journal que dispara a compactação
+DEFAULT_COMPACT_AFTER = 200
+
+# Extensão do journal, ao lado do snapshot
+JOURNAL_SUFFIX = ".journal"
+
+OP_PUT = "put"
+OP_DELETE = "delete"
+
+
+def _fsync(f):
+    f.flush()
+    os.fsync(f.fileno())
+
+
+class BackupStore:
+    """
+    Backup persistido como snapshot + journal.
+
+    O snapshot tem o mesmo formato do antigo camera_backup.json (dicionário
+    nome -> registro), então arquivos existentes são importados sem conversão.
+    Cada gravação anexa registros ao journal com um único fsync por lote; a
+    compactação grava um novo snapshot em arquivo temporário e o renomeia de
+    forma atômica antes de esvaziar o journal.
+    """
+
+    def __init__(self, snapshot_path: Path, journal_path: Optional[Path] = None,
+                 compact_after: int = DEFAULT_COMPACT_AFTER):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = Path(journal_path) if journal_path else self.snapshot_path.with_suffix(JOURNAL_SUFFIX)
+        self.compact_after = compact_after
+        self._lock = threading.RLock()
+        # Registros no journal, lido do disco uma vez e mantido pelas gravações
+        self._journal_count: Optional[int] = None
+
+    def _read_snapshot(self) -> Dict:
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _read_journal(self) -> List[Dict]:
+        records = []
+        if not self.journal_path.exists():
+            return records
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Linha incompleta (gravação interrompida)
+                    continue
+        return records
+
+    @staticmethod
+    def _apply(data: Dict, record: Dict):
+        if record.get('op') == OP_PUT:
+            data[record['name']] = record['record']
+        elif record.get('op') == OP_DELETE:
+            data.pop(record['name'], None)
+
+    def load(self) -> Dict:
+        """
+        Carrega o backup completo (snapshot + journal).
+
+        Returns:
+            Dicionário nome original -> registro de backup
+        """
+        with self._lock:
+            data = self._read_snapshot()
+            journal = self._read_journal()
+            for record in journal:
+                self._apply(data, record)
+            self._journal_count = len(journal)
+            return data
+
+    def journal_length(self) -> int:
+        """Número de registros ainda não compactados."""
+        with self._lock:
+            if self._journal_count is None:
+                self._journal_count = len(self._read_journal())
+            return self._journal_count
+
+    def _append(self, records: List[Dict]):
+        if not records:
+            return
+        with self._lock:
+            count = self.journal_length()
+            lines = "".join(
+                json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+                for record in records
+            )
+            with open(self.journal_path, 'a+b') as f:
+                # Isola uma possível linha incompleta deixada por uma queda
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        lines = "\n" + lines
+                f.write(lines.encode('utf-8'))
+                _fsync(f)
+            self._journal_count = count + len(records)
+            if self._journal_count >= self.compact_after:
+                self.compact()
+
+    def put_many(self, records: Dict[str, Dict]):
+        """Grava (ou substitui) os registros de várias câmeras em um único lote."""
+        self._append([
+            {'op': OP_PUT, 'name': name, 'record': record}
+            for name, record in records.items()
+        ])
+
+    def delete_many(self, names: Iterable[str]):
+        """Remove os registros de várias câmeras em um único lote."""
+        self._append([{'op': OP_DELETE, 'name': name} for name in names])
+
+    def compact(self):
+        """Incorpora o journal em um novo snapshot gravado de forma atômica."""
+        with self._lock:
+            data = self.load()
+            tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                _fsync(f)
+            os.replace(tmp_path, self.snapshot_path)
+
+            # Reaplicar o journal sobre o novo snapshot não muda o resultado,
+            # então uma falha antes desta linha não perde dados
+            with open(self.journal_path, 'w', encoding='utf-8') as f:
+                _fsync(f)
+            self._journal_count = 0
+
+
+class BackupRepository:
+    """
+    Backup mantido em memória sobre um BackupStore.
+
+    O conteúdo só é relido quando o snapshot ou o journal mudam no disco
+    (verificado por mtime, tamanho e inode), ou seja, quando outro processo
+    gravou o backup. Mantém índices por nome original e por caminho do registro.
+    """
+
+    def __init__(self, store: BackupStore):
+        self.store = store
+        self._lock = threading.RLock()
+        self._signature = None
+        self._data: Dict[str, Dict] = {}
+        self._by_path: Dict[str, List[str]] = {}
+
+    @staticmethod
+    def _stat(path: Path):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _current_signature(self):
+        return (self._stat(self.store.snapshot_path), self._stat(self.store.journal_path))
+
+    def _rebuild_path_index(self):
+        self._by_path = {}
+        for name, record in self._data.items():
+            self._index_record(name, record)
+
+    def _index_record(self, name: str, record: Dict):
+        for entry in record.get('registry_entries', []):
+            names = self._by_path.setdefault(entry['path'].lower(), [])
+            if name not in names:
+                names.append(name)
+
+    def _unindex_record(self, name: str, record: Dict):
+        for entry in record.get('registry_entries', []):
+            names = self._by_path.get(entry['path'].lower())
+            if names and name in names:
+                names.remove(name)
+                if not names:
+                    del self._by_path[entry['path'].lower()]
+
+    def _revalidate(self):
+        signature = self._current_signature()
+        if signature != self._signature:
+            self._data = self.store.load()
+            self._signature = signature
+            self._rebuild_path_index()
+
+    def data(self) -> Dict[str, Dict]:
+        """Retorna o backup completo (cópia rasa do cache)."""
+        with self._lock:
+            self._revalidate()
+            return dict(self._data)
+
+    def names(self) -> List[str]:
+        """Retorna os nomes originais das câmeras com backup."""
+        with self._lock:
+            self._revalidate()
+            return list(self._data.keys())
+
+    def get(self, name: str) -> Optional[Dict]:
+        """Retorna o registro de backup de uma câmera pelo nome original."""
+        with self._lock:
+            self._revalidate()
+            return self._data.get(name)
+
+    def find_by_path(self, path: str) -> List[str]:
+        """Retorna os nomes originais cujo backup inclui a chave do registro."""
+        with self._lock:
+            self._revalidate()
+            return list(self._by_path.get(path.lower(), []))
+
+    def put_many(self, records: Dict[str, Dict]):
+        """Grava registros no store e atualiza o cache sem reler o arquivo."""
+        with self._lock:
+            self._revalidate()
+            self.store.put_many(records)
+            for name, record in records.items():
+                if name in self._data:
+                    self._unindex_record(name, self._data[name])
+                self._data[name] = record
+                self._index_record(name, record)
+            self._signature = self._current_signature()
+
+    def delete_many(self, names: Iterable[str]):
+        """Remove registros do store e do cache."""
+        names = list(names)
+        with self._lock:
+            self._revalidate()
+            self.store.delete_many(names)
+            for name in names:
+                record = self._data.pop(name, None)
+                if record is not None:
+                    self._unindex_record(name, record)
+            self._signature = self._current_signature()
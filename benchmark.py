@@ -0,0 +1,375 @@
+"""
+Camera Spoofer - Benchmark
+Mede busca, indexação, renomeação e listagem sobre registros sintéticos em
+memória (MemoryRegistry), sem tocar no registro real, e a busca incremental
+sobre um catálogo sintético de câmeras, e compara o resultado com uma linha de
+base gravada anteriormente.
+
+Uso:
+    python -m benchmark                         # árvores de 10k e 100k chaves
+    python -m benchmark --sizes 10k 100k 1m     # inclui a árvore de 1 milhão
+    python -m benchmark --save-baseline         # grava benchmark_baseline.json
+    python -m benchmark --baseline base.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from registry_backend import REG_MULTI_SZ, MemoryRegistry, use_backend
+
+
+# Tamanhos das árvores sintéticas (número aproximado de chaves)
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_SIZES = ["10k", "100k"]
+
+# Linha de base usada quando existe ao lado do módulo
+DEFAULT_BASELINE = Path(__file__).parent / "benchmark_baseline.json"
+
+# Aumento relativo tolerado antes de considerar regressão (0.25 = 25%)
+DEFAULT_TOLERANCE = 0.25
+
+# Modelos do catálogo sintético usado na busca incremental
+CATALOG_SIZE = 50_000
+
+# Fração dos dispositivos sintéticos que são câmeras
+DEFAULT_CAMERA_DENSITY = 0.02
+
+# Câmera plantada em cada raiz e usada nas medidas de busca e renomeação
+TARGET_CAMERA = "OBS Virtual Camera"
+RENAMED_CAMERA = "Logitech HD Webcam C920"
+
+_DEVICE_CLASSES = r"SYSTEM\CurrentControlSet\Control\DeviceClasses"
+_ENUM = r"SYSTEM\CurrentControlSet\Enum"
+_CLSID = r"SOFTWARE\Classes\CLSID"
+_VIDEO_CAMERA_CATEGORY = "{e5323777-f976-4f5b-9b55-b94699c46e44}"
+
+_OTHER_DEVICES = [
+    "USB Root Hub", "HID Keyboard Device", "HID-compliant mouse", "USB Composite Device",
+    "Generic USB Hub", "USB Mass Storage Device", "Realtek High Definition Audio",
+    "Intel(R) Wireless Bluetooth(R)", "PCI Express Root Port", "Standard SATA AHCI Controller",
+]
+_VIRTUAL_CAMERAS = [
+    "vMix Video", "ManyCam Virtual Webcam", "XSplit VCam", "Snap Camera", "NDI Webcam Input",
+]
+
+
+def _guid(rng: random.Random) -> str:
+    h = f"{rng.getrandbits(128):032x}"
+    return f"{{{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}}}".upper()
+
+
+def _device_name(rng: random.Random, camera_density: float, real_cameras: List[str]) -> str:
+    if rng.random() < camera_density:
+        return rng.choice(real_cameras + _VIRTUAL_CAMERAS)
+    return f"{rng.choice(_OTHER_DEVICES)} #{rng.randrange(1000)}"
+
+
+def build_synthetic_registry(n_keys: int, camera_density: float = DEFAULT_CAMERA_DENSITY,
+                             seed: int = 0) -> MemoryRegistry:
+    """
+    Cria um registro em memória com o formato das raízes de busca reais.
+
+    Cerca de 20% das chaves ficam em DeviceClasses (interfaces com
+    "#\\Device Parameters"), 50% em Enum (instâncias USB com Device Parameters
+    e Properties) e 30% em CLSID (classe + InprocServer32). A câmera
+    TARGET_CAMERA é plantada uma vez em cada raiz.
+
+    Args:
+        n_keys: Número aproximado de chaves
+        camera_density: Fração dos dispositivos que são câmeras
+        seed: Semente do gerador (a mesma semente gera a mesma árvore)
+
+    Returns:
+        MemoryRegistry preenchido
+    """
+    from real_cameras import get_all_real_camera_names
+
+    rng = random.Random(seed)
+    real_cameras = get_all_real_camera_names()
+    registry = MemoryRegistry()
+
+    # DeviceClasses: 3 chaves por interface (interface, "#", "#\Device Parameters")
+    categories = [_VIDEO_CAMERA_CATEGORY] + [_guid(rng) for _ in range(15)]
+    for i in range(n_keys * 20 // 100 // 3):
+        category = rng.choice(categories)
+        vid, pid = rng.randrange(0x10000), rng.randrange(0x10000)
+        interface = f"##?#USB#VID_{vid:04X}&PID_{pid:04X}&MI_00#{i:x}&0&0000#{category}"
+        path = f"{_DEVICE_CLASSES}\\{category}\\{interface}"
+        registry.set(path, "DeviceInstance", f"USB\\VID_{vid:04X}&PID_{pid:04X}\\{i:x}")
+        registry.set(f"{path}\\#\\Device Parameters", "FriendlyName",
+                     _device_name(rng, camera_density, real_cameras))
+
+    # Enum: 4 chaves por dispositivo (VID/PID, instância, Device Parameters, Properties)
+    for i in range(n_keys * 50 // 100 // 4):
+        vid, pid = rng.randrange(0x10000), rng.randrange(0x10000)
+        hardware_id = f"USB\\VID_{vid:04X}&PID_{pid:04X}"
+        path = f"{_ENUM}\\USB\\VID_{vid:04X}&PID_{pid:04X}\\{i:x}"
+        name = _device_name(rng, camera_density, real_cameras)
+        registry.set(path, "FriendlyName", name)
+        registry.set(path, "DeviceDesc", f"@oem{rng.randrange(100)}.inf,%device%;{name}")
+        registry.set(path, "HardwareID", [hardware_id, "USB\\Class_0E"], REG_MULTI_SZ)
+        registry.set(path, "Mfg", "(Generic USB Device)")
+        registry.set(f"{path}\\Device Parameters", "SymbolicName", f"\\??\\{hardware_id}#{i:x}")
+        registry.add_key(f"{path}\\Properties")
+
+    # CLSID: 2 chaves por classe (classe e InprocServer32)
+    for i in range(n_keys * 30 // 100 // 2):
+        path = f"{_CLSID}\\{_guid(rng)}"
+        registry.set(path, "", f"Component {i}")
+        registry.set(f"{path}\\InprocServer32", "", f"C:\\Windows\\System32\\comp{i}.dll")
+
+    registry.set(f"{_DEVICE_CLASSES}\\{_VIDEO_CAMERA_CATEGORY}\\##?#ROOT#IMAGE#0000#{_VIDEO_CAMERA_CATEGORY}"
+                 r"\#\Device Parameters", "FriendlyName", TARGET_CAMERA)
+    registry.set(f"{_ENUM}\\ROOT\\IMAGE\\0000", "FriendlyName", TARGET_CAMERA)
+    registry.set(f"{_CLSID}\\{{A3FCE0F5-3493-419F-958A-ABA1250EC20B}}", "", TARGET_CAMERA)
+    return registry
+
+
+def build_synthetic_catalog(n_models: int, seed: int = 0):
+    """Cria um catálogo de câmeras com n_models modelos fictícios."""
+    from camera_catalog import CameraCatalog, CameraModel
+
+    rng = random.Random(seed)
+    words = ["HD", "Pro", "Webcam", "Camera", "4K", "FHD", "Stream", "Ultra", "Conference",
+             "USB", "Cam", "Vision", "Lite", "Plus", "Max"]
+    models = []
+    for i in range(n_models):
+        vendor = f"Vendor{i % 700}"
+        model = f"{vendor} {' '.join(rng.sample(words, 3))} {rng.choice('CWXZ')}{rng.randint(10, 9999)}"
+        models.append(CameraModel(vendor, model, 0x1000 + i % 700, i & 0xFFFF))
+    return CameraCatalog(models)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Percentil pelo método do posto mais próximo."""
+    ordered = sorted(samples)
+    rank = max(1, min(len(ordered), round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+def _measure(operation: Callable[[], object], repeat: int, items: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+
+    # Memória medida em uma execução separada: o tracemalloc distorce os tempos
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    p50 = percentile(samples, 50)
+    return {
+        'p50_ms': p50 * 1000,
+        'p95_ms': percentile(samples, 95) * 1000,
+        'p99_ms': percentile(samples, 99) * 1000,
+        'per_s': items / p50 if p50 > 0 else 0.0,
+        'peak_kib': peak / 1024,
+    }
+
+
+def run_size(size: str, repeat: int = 5, workers: Optional[int] = None,
+             seed: int = 0, camera_density: float = DEFAULT_CAMERA_DENSITY) -> Dict[str, Dict[str, float]]:
+    """
+    Executa todos os cenários sobre uma árvore sintética.
+
+    Returns:
+        Dicionário "tamanho/cenário" -> métricas
+    """
+    import camera_utils
+
+    start = time.perf_counter()
+    registry = build_synthetic_registry(SIZES[size], camera_density, seed)
+    keys = registry.key_count()
+    results = {f"{size}/build": {'seconds': time.perf_counter() - start, 'keys': keys}}
+
+    def index_build():
+        camera_utils.invalidate_registry_index()
+        camera_utils.find_camera_registry_entries(TARGET_CAMERA)
+
+    def rename_restore():
+        success, message = camera_utils.rename_camera_in_registry(TARGET_CAMERA, RENAMED_CAMERA)
+        if not success:
+            raise RuntimeError(message)
+        success, message = camera_utils.restore_camera_name(TARGET_CAMERA)
+        if not success:
+            raise RuntimeError(message)
+
+    # (nome, operação, itens por execução): a vazão é em chaves/s nas
+    # varreduras e em operações/s nos demais cenários
+    scenarios = [
+        ('full_walk', lambda: camera_utils.find_camera_registry_entries(TARGET_CAMERA, use_index=False), keys),
+        ('index_build', index_build, keys),
+        ('index_query', lambda: camera_utils.find_camera_registry_entries(TARGET_CAMERA), 1),
+        ('rename_restore', rename_restore, 1),
+        ('list_cameras', camera_utils.get_cameras_via_registry, 1),
+    ]
+
+    # Os cenários do índice e da renomeação medem o uso da interface (índice ligado)
+    previous_workers = camera_utils.SCAN_WORKERS
+    previous_use_index = camera_utils.USE_REGISTRY_INDEX
+    with tempfile.TemporaryDirectory() as tmp, use_backend(registry):
+        camera_utils.set_backup_path(Path(tmp) / camera_utils.BACKUP_FILE)
+        camera_utils.USE_REGISTRY_INDEX = True
+        if workers is not None:
+            camera_utils.SCAN_WORKERS = workers
+        try:
+            camera_utils.invalidate_registry_index()
+            for name, operation, items in scenarios:
+                # Buscas pelo índice são rápidas demais para poucas amostras (se
+                # o índice estourou o orçamento de memória, cada busca é uma varredura)
+                scenario_repeat = repeat
+                if name == 'index_query' and camera_utils.get_registry_index().is_ready:
+                    scenario_repeat = repeat * 20
+                results[f"{size}/{name}"] = _measure(operation, scenario_repeat, items)
+                results[f"{size}/{name}"]['unit'] = 'chaves/s' if items > 1 else 'ops/s'
+            results[f"{size}/index_build"]['index_ready'] = camera_utils.get_registry_index().is_ready
+        finally:
+            camera_utils.SCAN_WORKERS = previous_workers
+            camera_utils.USE_REGISTRY_INDEX = previous_use_index
+            camera_utils.set_backup_path(None)
+            camera_utils.invalidate_registry_index()
+    return results
+
+
+def run_catalog(repeat: int = 5, seed: int = 0, n_models: int = CATALOG_SIZE) -> Dict[str, Dict[str, float]]:
+    """
+    Mede a construção do índice do catálogo, a busca incremental (digitando
+    letra a letra o início de nomes do catálogo) e as sugestões de nome.
+
+    Returns:
+        Dicionário "catalog/cenário" -> métricas
+    """
+    from camera_catalog import CatalogIndex, Typeahead
+    from name_suggestions import SuggestionIndex
+
+    catalog = build_synthetic_catalog(n_models, seed)
+    index = CatalogIndex(catalog)
+    rng = random.Random(seed)
+    typed = [name[:12] for name in rng.sample(catalog.names(), 50)]
+    keystrokes = sum(len(text) for text in typed)
+
+    def typeahead():
+        for text in typed:
+            search = Typeahead(index)
+            for end in range(1, len(text) + 1):
+                search.update(text[:end])
+
+    suggestion_index = SuggestionIndex(catalog)
+    cameras = [TARGET_CAMERA, *_VIRTUAL_CAMERAS, *(name[:20] for name in rng.sample(catalog.names(), 44))]
+
+    results = {
+        # As construções são lentas demais para muitas repetições
+        'catalog/index_build': _measure(lambda: CatalogIndex(catalog), max(1, repeat // 5), n_models),
+        'catalog/typeahead': _measure(typeahead, repeat, keystrokes),
+        'catalog/suggest_build': _measure(lambda: SuggestionIndex(catalog), max(1, repeat // 5), n_models),
+        'catalog/suggest': _measure(lambda: suggestion_index.suggest_many(cameras), repeat, len(cameras)),
+    }
+    for name, unit in (('index_build', 'modelos/s'), ('typeahead', 'teclas/s'),
+                       ('suggest_build', 'modelos/s'), ('suggest', 'câmeras/s')):
+        results[f'catalog/{name}']['unit'] = unit
+    return results
+
+
+def compare_to_baseline(results: Dict, baseline: Dict, tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """
+    Compara latência (p50) e pico de memória com a linha de base.
+
+    Returns:
+        Lista de regressões (vazia se tudo estiver dentro da tolerância)
+    """
+    regressions = []
+    for key, metrics in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        for metric in ('p50_ms', 'peak_kib'):
+            if metric not in metrics or not base.get(metric):
+                continue
+            limit = base[metric] * (1 + tolerance)
+            if metrics[metric] > limit:
+                regressions.append(f"{key} {metric}: {metrics[metric]:.2f} > {limit:.2f} "
+                                   f"(base {base[metric]:.2f})")
+    return regressions
+
+
+def _print_results(results: Dict):
+    for key, metrics in results.items():
+        if 'seconds' in metrics:
+            print(f"{key:<24} {metrics['keys']:>9} chaves em {metrics['seconds']:.2f} s")
+            continue
+        print(f"{key:<24} p50 {metrics['p50_ms']:9.2f} ms  p95 {metrics['p95_ms']:9.2f} ms  "
+              f"p99 {metrics['p99_ms']:9.2f} ms  {metrics['per_s']:12.0f} {metrics['unit']:<8}  "
+              f"pico {metrics['peak_kib']:10.1f} KiB", flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmark",
+                                     description="Benchmark do Camera Spoofer sobre registros sintéticos.")
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=DEFAULT_SIZES,
+                        help="Tamanhos das árvores sintéticas")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições de cada cenário")
+    parser.add_argument("--workers", type=int, help="Threads da varredura (padrão: SCAN_WORKERS)")
+    parser.add_argument("--seed", type=int, default=0, help="Semente da árvore sintética")
+    parser.add_argument("--camera-density", type=float, default=DEFAULT_CAMERA_DENSITY,
+                        help="Fração dos dispositivos que são câmeras")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="Linha de base para comparação")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Grava os resultados como nova linha de base")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Aumento relativo tolerado (0.25 = 25%%)")
+    parser.add_argument("--json", action="store_true", help="Imprime os resultados em JSON")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for size in args.sizes:
+        size_results = run_size(size, args.repeat, args.workers, args.seed, args.camera_density)
+        if not args.json:
+            _print_results(size_results)
+        results.update(size_results)
+
+    catalog_results = run_catalog(args.repeat, args.seed)
+    if not args.json:
+        _print_results(catalog_results)
+    results.update(catalog_results)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Linha de base gravada em {args.baseline}", file=sys.stderr)
+        return 0
+
+    # A linha de base é de cada máquina: sem ela não há com o que comparar
+    if not args.baseline.exists():
+        print(f"ERRO: linha de base {args.baseline} não encontrada "
+              f"(grave uma nesta máquina com --save-baseline)", file=sys.stderr)
+        return 1
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSÃO: {regression}", file=sys.stderr)
+    if regressions:
+        return 1
+    print(f"OK: dentro de {args.tolerance:.0%} da linha de base", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,6 +33,7 @@ pyinstaller --onefile ^
     --name "Camera Spoofer" ^
     --icon "assets\icon.ico" ^
     --add-data "real_cameras.py;." ^
+    --add-data "assets\camera_catalog.csv;assets" ^
     --hidden-import wmi ^
     --hidden-import win32com ^
     --hidden-import win32api ^
@@ -0,0 +1,416 @@
+"""
+Camera Spoofer - Catálogo de Câmeras Reais
+Catálogo de modelos de câmeras reais (fabricante, nome e VID/PID USB) carregado
+sob demanda em arrays compactos, com um índice de sufixos ordenados para a
+busca incremental por prefixo ou trecho do nome.
+
+Formato do arquivo (CSV com cabeçalho): vendor,model,vid,pid
+VID e PID em hexadecimal (vazios quando desconhecidos).
+"""
+
+import csv
+import hashlib
+import re
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from registry_index import fold_text
+
+PathLike = Union[str, Path]
+
+# Catálogo distribuído com o programa (no executável do PyInstaller fica em _MEIPASS)
+DEFAULT_CATALOG = Path(getattr(sys, "_MEIPASS", Path(__file__).parent)) / "assets" / "camera_catalog.csv"
+
+# Resultados por consulta da busca incremental
+TYPEAHEAD_LIMIT = 20
+
+# Caracteres de cada sufixo usados na ordenação (consultas maiores são conferidas no texto)
+_SUFFIX_KEY_LENGTH = 24
+
+# Separador dos nomes no texto do catálogo (não aparece em nomes nem em consultas)
+_SEPARATOR = "\n"
+
+# VID/PID desconhecido
+_NO_ID = -1
+
+
+class CameraModel(NamedTuple):
+    """Um modelo do catálogo."""
+    vendor: str
+    model: str            # Nome como aparece no Windows (usado na renomeação)
+    vid: Optional[int] = None
+    pid: Optional[int] = None
+
+
+class CameraCatalog:
+    """
+    Modelos de câmeras em armazenamento compacto.
+
+    Os nomes ficam concatenados em um único texto, com a posição de cada um
+    em um array; fabricante, VID e PID são arrays de inteiros. Nomes
+    repetidos (sem diferenciar maiúsculas) são descartados, mantendo o
+    primeiro.
+    """
+
+    def __init__(self, models: Iterable[CameraModel]):
+        self.vendors: List[str] = []
+        vendor_ids: Dict[str, int] = {}
+        seen = set()
+        names = []
+        self._starts = array('I', [0])
+        self._vendor = array('H')
+        self._vid = array('i')
+        self._pid = array('i')
+
+        position = 0
+        for vendor, model, vid, pid in models:
+            model = model.strip().replace(_SEPARATOR, " ")
+            folded = fold_text(model)
+            if not model or folded in seen:
+                continue
+            seen.add(folded)
+            vendor_id = vendor_ids.get(vendor)
+            if vendor_id is None:
+                vendor_id = vendor_ids[vendor] = len(self.vendors)
+                self.vendors.append(vendor)
+            names.append(model)
+            position += len(model) + 1
+            self._starts.append(position)
+            self._vendor.append(vendor_id)
+            self._vid.append(_NO_ID if vid is None else vid)
+            self._pid.append(_NO_ID if pid is None else pid)
+
+        self._text = _SEPARATOR.join(names) + _SEPARATOR
+
+    def __len__(self) -> int:
+        return len(self._vendor)
+
+    def name(self, index: int) -> str:
+        """Nome do modelo na posição index."""
+        return self._text[self._starts[index]:self._starts[index + 1] - 1]
+
+    def vendor(self, index: int) -> str:
+        return self.vendors[self._vendor[index]]
+
+    def __getitem__(self, index: int) -> CameraModel:
+        vid, pid = self._vid[index], self._pid[index]
+        return CameraModel(self.vendor(index), self.name(index),
+                           None if vid == _NO_ID else vid, None if pid == _NO_ID else pid)
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+
+    def names(self) -> List[str]:
+        """Todos os nomes, na ordem do catálogo."""
+        return self._text.split(_SEPARATOR)[:-1]
+
+    def names_by_vendor(self) -> Dict[str, List[str]]:
+        """Nomes agrupados por fabricante, na ordem do catálogo."""
+        grouped: Dict[str, List[str]] = {vendor: [] for vendor in self.vendors}
+        for index, name in enumerate(self.names()):
+            grouped[self.vendors[self._vendor[index]]].append(name)
+        return grouped
+
+    def fingerprint(self) -> str:
+        """Hash do conteúdo do catálogo (nomes, fabricantes e VID/PID)."""
+        digest = hashlib.sha256(self._text.encode('utf-8'))
+        digest.update(_SEPARATOR.join(self.vendors).encode('utf-8'))
+        for values in (self._vendor, self._vid, self._pid):
+            digest.update(values.tobytes())
+        return digest.hexdigest()[:32]
+
+    def find_usb(self, vid: int, pid: Optional[int] = None) -> List[int]:
+        """Posições dos modelos com o VID (e o PID, se informado)."""
+        return [
+            index for index in range(len(self))
+            if self._vid[index] == vid and (pid is None or self._pid[index] == pid)
+        ]
+
+
+def _parse_hex(text: str) -> Optional[int]:
+    text = text.strip()
+    return int(text, 16) if text else None
+
+
+def read_catalog_file(path: PathLike) -> List[CameraModel]:
+    """Lê um arquivo de catálogo (CSV vendor,model,vid,pid)."""
+    models = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            models.append(CameraModel(row['vendor'], row['model'],
+                                      _parse_hex(row.get('vid') or ''), _parse_hex(row.get('pid') or '')))
+    return models
+
+
+def write_catalog_file(models: Iterable[CameraModel], path: PathLike):
+    """Grava um arquivo de catálogo no formato lido por read_catalog_file."""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['vendor', 'model', 'vid', 'pid'])
+        for vendor, model, vid, pid in models:
+            writer.writerow([vendor, model,
+                             '' if vid is None else f"{vid:04x}", '' if pid is None else f"{pid:04x}"])
+
+
+def _sorted_suffixes(text: str, positions: Iterable[int]) -> array:
+    """
+    Ordena posições do texto pelo sufixo que começa em cada uma.
+
+    As posições são separadas pelos dois primeiros caracteres e cada grupo é
+    ordenado à parte: apenas as chaves de um grupo ficam na memória de cada vez.
+    """
+    buckets: Dict[str, array] = {}
+    for position in positions:
+        bucket = buckets.get(text[position:position + 2])
+        if bucket is None:
+            bucket = buckets[text[position:position + 2]] = array('I')
+        bucket.append(position)
+
+    def sort_key(position: int) -> str:
+        return text[position:position + _SUFFIX_KEY_LENGTH]
+
+    result = array('I')
+    for prefix in sorted(buckets):
+        result.extend(sorted(buckets.pop(prefix), key=sort_key))
+    return result
+
+
+class CatalogIndex:
+    """
+    Índice de sufixos ordenados dos nomes do catálogo.
+
+    Cada consulta é uma busca binária por faixa em três arrays de posições no
+    texto normalizado: inícios de nome, inícios de palavra e todas as
+    posições. Os resultados vêm nessa ordem de prioridade (o nome começa com
+    a consulta, uma palavra começa com ela, ela aparece no meio do nome) e,
+    dentro de cada uma, em ordem alfabética do trecho encontrado.
+    """
+
+    def __init__(self, catalog: CameraCatalog):
+        self.catalog = catalog
+        folded = [fold_text(catalog.name(index)) for index in range(len(catalog))]
+        self._text = _SEPARATOR.join(folded) + _SEPARATOR
+        self._starts = array('I', [0])
+        for name in folded:
+            self._starts.append(self._starts[-1] + len(name) + 1)
+
+        text = self._text
+        positions = (position for position, char in enumerate(text) if char != _SEPARATOR)
+        words = (position for position, char in enumerate(text)
+                 if char != _SEPARATOR and (position == 0 or not text[position - 1].isalnum()))
+
+        # Faixas de prioridade: nome, palavra, qualquer posição
+        self._tiers = (
+            _sorted_suffixes(text, self._starts[:-1]),
+            _sorted_suffixes(text, words),
+            _sorted_suffixes(text, positions),
+        )
+
+    def _name_index(self, position: int) -> int:
+        return bisect_right(self._starts, position) - 1
+
+    def ranges(self, query: str, bounds: Optional[Tuple[Tuple[int, int], ...]] = None) -> Tuple[Tuple[int, int], ...]:
+        """
+        Faixas de cada array cujos sufixos começam com a consulta normalizada.
+
+        Args:
+            query: Consulta já normalizada com fold_text
+            bounds: Faixas de uma consulta que é prefixo desta (restringem a busca)
+        """
+        key_query = query[:_SUFFIX_KEY_LENGTH]
+        length = len(key_query)
+        text = self._text
+
+        def key(position: int) -> str:
+            return text[position:position + length]
+
+        result = []
+        for tier, suffixes in enumerate(self._tiers):
+            lo, hi = bounds[tier] if bounds is not None else (0, len(suffixes))
+            lo = bisect_left(suffixes, key_query, lo, hi, key=key)
+            hi = bisect_right(suffixes, key_query, lo, hi, key=key)
+            result.append((lo, hi))
+        return tuple(result)
+
+    def collect(self, query: str, ranges: Tuple[Tuple[int, int], ...], limit: int = TYPEAHEAD_LIMIT) -> List[int]:
+        """Posições no catálogo dos primeiros nomes encontrados nas faixas, sem repetição."""
+        text = self._text
+        check = len(query) > _SUFFIX_KEY_LENGTH
+        found: List[int] = []
+        seen = set()
+        for suffixes, (lo, hi) in zip(self._tiers, ranges):
+            for i in range(lo, hi):
+                position = suffixes[i]
+                if check and not text.startswith(query, position):
+                    continue
+                index = self._name_index(position)
+                if index not in seen:
+                    seen.add(index)
+                    found.append(index)
+                    if len(found) >= limit:
+                        return found
+        return found
+
+    def search(self, query: str, limit: int = TYPEAHEAD_LIMIT) -> List[str]:
+        """Nomes que contêm a consulta (sem diferenciar maiúsculas), em ordem de prioridade."""
+        query = fold_text(query.strip()).replace(_SEPARATOR, " ")
+        if not query:
+            return [self.catalog.name(index) for index in range(min(limit, len(self.catalog)))]
+        return [self.catalog.name(index) for index in self.collect(query, self.ranges(query), limit)]
+
+
+class Typeahead:
+    """
+    Busca incremental sobre um CatalogIndex.
+
+    Quando o texto digitado estende a consulta anterior, a busca binária é
+    feita apenas dentro das faixas da consulta anterior.
+    """
+
+    def __init__(self, index: CatalogIndex, limit: int = TYPEAHEAD_LIMIT):
+        self.index = index
+        self.limit = limit
+        self._query = ""
+        self._ranges: Optional[Tuple[Tuple[int, int], ...]] = None
+
+    def update(self, text: str) -> List[str]:
+        """Retorna as sugestões para o texto digitado até agora."""
+        query = fold_text(text.strip()).replace(_SEPARATOR, " ")
+        if not query:
+            self._query, self._ranges = "", None
+            return self.index.search("", self.limit)
+
+        bounds = None
+        if self._ranges is not None and query.startswith(self._query):
+            bounds = self._ranges
+        self._ranges = self.index.ranges(query, bounds)
+        self._query = query
+        catalog = self.index.catalog
+        return [catalog.name(index) for index in self.index.collect(query, self._ranges, self.limit)]
+
+
+_catalog: Optional[CameraCatalog] = None
+_catalog_index: Optional[CatalogIndex] = None
+_catalog_lock = threading.Lock()
+
+
+def load_catalog(path: Optional[PathLike] = None) -> CameraCatalog:
+    """
+    Carrega um catálogo. Sem caminho, usa DEFAULT_CATALOG; se ele não existir,
+    o catálogo tem apenas os nomes de real_cameras.REAL_CAMERA_NAMES.
+    """
+    models: List[CameraModel] = []
+    if path is not None or DEFAULT_CATALOG.exists():
+        models = read_catalog_file(path if path is not None else DEFAULT_CATALOG)
+    if path is None:
+        from real_cameras import REAL_CAMERA_NAMES
+        models.extend(CameraModel(vendor, name) for vendor, names in REAL_CAMERA_NAMES.items() for name in names)
+    return CameraCatalog(models)
+
+
+def get_catalog() -> CameraCatalog:
+    """Retorna o catálogo padrão (carregado no primeiro uso)."""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = load_catalog()
+        return _catalog
+
+
+def get_catalog_index() -> CatalogIndex:
+    """Retorna o índice do catálogo padrão (construído no primeiro uso)."""
+    global _catalog_index
+    catalog = get_catalog()
+    with _catalog_lock:
+        if _catalog_index is None or _catalog_index.catalog is not catalog:
+            _catalog_index = CatalogIndex(catalog)
+        return _catalog_index
+
+
+def set_catalog(catalog: Optional[CameraCatalog]):
+    """Substitui o catálogo padrão (None volta a carregar DEFAULT_CATALOG no próximo uso)."""
+    global _catalog, _catalog_index
+    with _catalog_lock:
+        _catalog = catalog
+        _catalog_index = None
+
+
+# Dispositivos do usb.ids considerados câmeras
+_USB_IDS_CAMERA = re.compile(r"web\s?cam|camera|facecam|lifecam|quickcam|streamcam|\bbrio\b|\bkiyo\b", re.IGNORECASE)
+
+# Sufixos societários removidos do nome do fabricante
+_VENDOR_SUFFIX = re.compile(
+    r"[,.]?\s+(inc|corp|corporation|co|ltd|limited|llc|gmbh|ag|s\.?a|technology|technologies|electronics)\.?\s*$",
+    re.IGNORECASE)
+
+
+def _short_vendor(vendor: str) -> str:
+    previous = None
+    while previous != vendor:
+        previous = vendor
+        vendor = _VENDOR_SUFFIX.sub("", vendor).strip(" ,")
+    return vendor
+
+
+def import_usb_ids(path: PathLike) -> List[CameraModel]:
+    """
+    Extrai as câmeras de um arquivo usb.ids (http://www.linux-usb.org/usb.ids).
+
+    São mantidos os dispositivos cujo nome indica uma câmera; o nome do
+    modelo recebe o nome curto do fabricante quando ainda não o contém.
+    """
+    models = []
+    vendor, vid = None, None
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line.startswith('#') or not line.strip():
+                continue
+            if line.startswith('C '):
+                # Início da lista de classes: não há mais fabricantes
+                break
+            if not line.startswith('\t'):
+                code, _, name = line.strip().partition(' ')
+                vid, vendor = int(code, 16), _short_vendor(name.strip())
+                continue
+            if line.startswith('\t\t') or vendor is None:
+                continue
+            code, _, name = line.strip().partition(' ')
+            name = name.strip()
+            if not _USB_IDS_CAMERA.search(name):
+                continue
+            if not fold_text(name).startswith(fold_text(vendor.split()[0])):
+                name = f"{vendor} {name}"
+            models.append(CameraModel(vendor, name, vid, int(code, 16)))
+    return models
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m camera_catalog",
+                                     description="Gera ou consulta o catálogo de câmeras reais.")
+    parser.add_argument("--from-usb-ids", type=Path, metavar="USB_IDS",
+                        help="Acrescenta ao catálogo as câmeras de um arquivo usb.ids")
+    parser.add_argument("-o", "--output", type=Path, default=DEFAULT_CATALOG,
+                        help="Arquivo de catálogo gerado")
+    parser.add_argument("--search", help="Consulta o catálogo (como a busca da interface)")
+    args = parser.parse_args(argv)
+
+    if args.from_usb_ids:
+        models = read_catalog_file(args.output) if args.output.exists() else []
+        models.extend(import_usb_ids(args.from_usb_ids))
+        catalog = CameraCatalog(models)
+        write_catalog_file(catalog, args.output)
+        print(f"{len(catalog)} modelos gravados em {args.output}")
+    if args.search is not None:
+        for name in get_catalog_index().search(args.search):
+            print(name)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+Camera Spoofer - Lista de Câmeras
+Lista virtualizada das câmeras detectadas: apenas as linhas visíveis existem
+como widgets, e uma atualização só reconfigura as linhas cuja câmera mudou.
+"""
+
+import customtkinter as ctk
+from typing import Callable, Dict, List, Optional
+
+
+# Altura de cada linha da lista (incluindo o espaçamento), em pixels
+ROW_HEIGHT = 60
+ROW_SPACING = 8
+
+
+def camera_key(camera: Dict) -> str:
+    """Chave estável de uma câmera entre atualizações da lista."""
+    return camera.get('registry_path') or camera.get('device_path') or camera['name']
+
+
+class _CameraRow:
+    """Linha reutilizável da lista (frame, nome e botão de seleção)."""
+
+    def __init__(self, master, colors: Dict, fonts: Dict, on_select: Callable[["_CameraRow"], None],
+                 on_wheel: Callable):
+        self.key: Optional[str] = None
+        self.name: Optional[str] = None
+        self.y: Optional[int] = None
+
+        self.frame = ctk.CTkFrame(
+            master,
+            fg_color=colors['card'],
+            corner_radius=10,
+            border_width=1,
+            border_color=colors['border'],
+            height=ROW_HEIGHT - ROW_SPACING
+        )
+        # Altura fixa: todas as linhas ocupam exatamente ROW_HEIGHT na rolagem
+        self.frame.pack_propagate(False)
+
+        self.name_label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=fonts['row_name'],
+            text_color=colors['text']
+        )
+        self.name_label.pack(side="left", padx=12)
+
+        self.select_btn = ctk.CTkButton(
+            self.frame,
+            text="Selecionar",
+            width=100,
+            height=32,
+            fg_color=colors['accent'],
+            hover_color=colors['accent_light'],
+            corner_radius=8,
+            font=fonts['row_button'],
+            command=lambda: on_select(self)
+        )
+        self.select_btn.pack(side="right", padx=12)
+
+        for widget in (self.frame, self.name_label, self.select_btn):
+            widget.bind("<MouseWheel>", on_wheel)
+            widget.bind("<Button-4>", on_wheel)
+            widget.bind("<Button-5>", on_wheel)
+
+    def show(self, key: str, name: str, y: int):
+        """Mostra a linha na posição indicada, alterando apenas o que mudou."""
+        self.key = key
+        if name != self.name:
+            self.name = name
+            self.name_label.configure(text=name)
+        if y != self.y:
+            self.y = y
+            self.frame.place(x=0, y=y, relwidth=1.0)
+
+    def hide(self):
+        self.key = None
+        self.y = None
+        self.frame.place_forget()
+
+
+class CameraListView(ctk.CTkFrame):
+    """
+    Lista de câmeras com rolagem virtual.
+
+    set_cameras() reconcilia a lista pela chave de cada câmera: linhas que
+    continuam visíveis com o mesmo nome e posição não recebem nenhuma chamada
+    ao Tk, e linhas que saem da área visível voltam para um conjunto de linhas
+    livres, reaproveitadas ao rolar.
+    """
+
+    def __init__(self, master, colors: Dict, fonts: Dict, on_select: Callable[[Dict], None], **kwargs):
+        super().__init__(master, fg_color=colors['bg'], corner_radius=12, **kwargs)
+        self.colors = colors
+        self.fonts = fonts
+        self.on_select = on_select
+
+        self._keys: List[str] = []
+        self._cameras: Dict[str, Dict] = {}
+        self._first = 0
+        self._viewport_height = 0
+        self._bound: Dict[str, _CameraRow] = {}
+        self._free: List[_CameraRow] = []
+        self._message_visible = False
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 4), pady=6)
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True, padx=(8, 4), pady=6)
+        self.viewport.bind("<Configure>", self._on_configure)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.viewport.bind(sequence, self._on_wheel)
+
+        self.message_label = ctk.CTkLabel(
+            self.viewport,
+            text="",
+            font=fonts['message'],
+            text_color="#888888",
+            justify="center"
+        )
+
+    # Dados ------------------------------------------------------------------
+
+    def set_cameras(self, cameras: List[Dict]):
+        """Atualiza a lista, tocando apenas nas linhas que mudaram."""
+        self._keys = [camera_key(camera) for camera in cameras]
+        self._cameras = dict(zip(self._keys, cameras))
+        if self._message_visible:
+            self._message_visible = False
+            self.message_label.place_forget()
+        self._first = min(self._first, self._max_first())
+        self._render()
+
+    def show_message(self, text: str):
+        """Esconde as linhas e mostra uma mensagem (carregando, lista vazia...)."""
+        self._keys = []
+        self._cameras = {}
+        self._first = 0
+        self._render()
+        self.message_label.configure(text=text)
+        self.message_label.place(relx=0.5, y=30, anchor="n")
+        self._message_visible = True
+
+    # Rolagem ----------------------------------------------------------------
+
+    def _visible_rows(self) -> int:
+        """Linhas que cabem inteiras na área visível."""
+        return max(1, self._viewport_height // ROW_HEIGHT)
+
+    def _max_first(self) -> int:
+        return max(0, len(self._keys) - self._visible_rows())
+
+    def _scroll_to(self, first: int):
+        first = max(0, min(first, self._max_first()))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def _on_scrollbar(self, action: str, amount, unit: Optional[str] = None):
+        if action == "moveto":
+            self._scroll_to(round(float(amount) * len(self._keys)))
+        elif action == "scroll":
+            step = self._visible_rows() if unit == "pages" else 1
+            self._scroll_to(self._first + int(amount) * step)
+
+    def _on_wheel(self, event):
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self._scroll_to(self._first - 1)
+        else:
+            self._scroll_to(self._first + 1)
+
+    def _on_configure(self, event):
+        if event.height != self._viewport_height:
+            self._viewport_height = event.height
+            self._first = min(self._first, self._max_first())
+            self._render()
+
+    # Renderização -----------------------------------------------------------
+
+    def _new_row(self) -> _CameraRow:
+        return _CameraRow(self.viewport, self.colors, self.fonts, self._on_row_select, self._on_wheel)
+
+    def _on_row_select(self, row: _CameraRow):
+        camera = self._cameras.get(row.key)
+        if camera is not None:
+            self.on_select(camera)
+
+    def _render(self):
+        # Uma linha a mais para a última, parcialmente visível
+        count = self._visible_rows() + 1
+        visible = self._keys[self._first:self._first + count]
+        wanted = set(visible)
+
+        # Linhas que deixaram de ser visíveis são reaproveitadas primeiro, sem
+        # esconder e mostrar de novo; as que sobrarem são escondidas no final
+        released = [self._bound.pop(key) for key in [key for key in self._bound if key not in wanted]]
+
+        for slot, key in enumerate(visible):
+            row = self._bound.get(key)
+            if row is None:
+                if released:
+                    row = released.pop()
+                elif self._free:
+                    row = self._free.pop()
+                else:
+                    row = self._new_row()
+                self._bound[key] = row
+            row.show(key, self._cameras[key]['name'], slot * ROW_HEIGHT)
+
+        for row in released:
+            row.hide()
+            self._free.append(row)
+
+        if self._keys:
+            total = len(self._keys)
+            self.scrollbar.set(self._first / total, min(1.0, (self._first + self._visible_rows()) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
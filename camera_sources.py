@@ -0,0 +1,207 @@
+"""
+Camera Spoofer - Fontes de Câmeras
+Consulta as fontes de câmeras (DirectShow e registro) em paralelo, cada uma
+com o seu prazo, e combina os resultados pela identidade do dispositivo: duas
+webcams iguais continuam sendo duas câmeras, e uma fonte travada não impede
+que as outras sejam mostradas.
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+
+SOURCE_DIRECTSHOW = "directshow"
+SOURCE_REGISTRY = "registry"
+
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+
+# Prazo de cada fonte, em segundos
+SOURCE_TIMEOUTS = {
+    SOURCE_DIRECTSHOW: 5.0,
+    SOURCE_REGISTRY: 3.0,
+}
+
+# Sufixo da interface ("#{guid}" e, no DevicePath, "\global") de um link simbólico
+_INTERFACE_SUFFIX = re.compile(r"#\{[0-9a-f-]{36}\}(\\.*)?$", re.IGNORECASE)
+
+# Prefixos de um link simbólico: "\\?\" (DevicePath) e "##?#" (subchave de DeviceClasses)
+_SYMBOLIC_LINK_PREFIXES = ("\\\\?\\", "##?#")
+
+
+class CameraSource(NamedTuple):
+    """Uma fonte de câmeras: load(prazo em segundos) retorna a lista de câmeras."""
+    name: str
+    load: Callable[[float], List[Dict]]
+    timeout: float
+
+
+class SourceResult(NamedTuple):
+    """Resultado de uma fonte na última enumeração."""
+    source: str
+    status: str          # STATUS_OK, STATUS_TIMEOUT ou STATUS_ERROR
+    elapsed_ms: float
+    count: int
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return self._asdict()
+
+
+class CameraEnumeration(NamedTuple):
+    """Câmeras combinadas de todas as fontes e o resultado de cada fonte."""
+    cameras: List[Dict]
+    sources: List[SourceResult]
+
+    @property
+    def complete(self) -> bool:
+        """True se todas as fontes responderam dentro do prazo e sem erro."""
+        return all(result.status == STATUS_OK for result in self.sources)
+
+
+def device_identity(device_path: Optional[str]) -> Optional[str]:
+    """
+    Identidade estável de um dispositivo a partir do seu caminho.
+
+    O DevicePath do DirectShow ("\\\\?\\usb#vid_...#{guid}\\global") e a
+    subchave de DeviceClasses ("##?#USB#VID_...#{guid}") de uma mesma câmera
+    diferem no prefixo, na interface e na caixa; ambos se reduzem ao ID da
+    instância do dispositivo ("usb\\vid_...\\6&..."). Outros identificadores
+    (o CLSID de um filtro de software, por exemplo) são usados como estão.
+    """
+    if not device_path:
+        return None
+    path = device_path.strip().lower()
+    for prefix in _SYMBOLIC_LINK_PREFIXES:
+        if path.startswith(prefix):
+            path = _INTERFACE_SUFFIX.sub("", path[len(prefix):])
+            return path.replace("#", "\\")
+    return path
+
+
+def _directshow_source(timeout: float) -> List[Dict]:
+    from camera_utils import list_directshow_cameras
+    return list_directshow_cameras(timeout)
+
+
+def _registry_source(timeout: float) -> List[Dict]:
+    from camera_utils import get_cameras_via_registry
+    return get_cameras_via_registry()
+
+
+def default_sources() -> List[CameraSource]:
+    """Fontes padrão, em ordem de prioridade na combinação."""
+    return [
+        CameraSource(SOURCE_DIRECTSHOW, _directshow_source, SOURCE_TIMEOUTS[SOURCE_DIRECTSHOW]),
+        CameraSource(SOURCE_REGISTRY, _registry_source, SOURCE_TIMEOUTS[SOURCE_REGISTRY]),
+    ]
+
+
+def merge_cameras(camera_lists: List[List[Dict]], source_names: List[str]) -> List[Dict]:
+    """
+    Combina as listas de câmeras de várias fontes.
+
+    Câmeras com a mesma identidade de dispositivo viram uma só. Uma câmera
+    sem identidade é combinada com uma câmera de mesmo nome vinda de outra
+    fonte (uma para uma), para que duas câmeras iguais não virem uma. Os
+    campos da fonte anterior têm prioridade; as seguintes apenas completam os
+    que faltam (registry_path, por exemplo).
+
+    Args:
+        camera_lists: Listas de câmeras, em ordem de prioridade
+        source_names: Nome da fonte de cada lista
+
+    Returns:
+        Câmeras combinadas, com a lista de fontes de cada uma em 'sources'
+    """
+    merged: List[Dict] = []
+    identities: List[Optional[str]] = []
+    by_identity: Dict[str, int] = {}
+
+    for cameras, source_name in zip(camera_lists, source_names):
+        for camera in cameras:
+            identity = device_identity(camera.get('device_path'))
+            index = by_identity.get(identity) if identity else None
+
+            if index is None:
+                for i, existing in enumerate(merged):
+                    if (existing['name'] == camera['name']
+                            and source_name not in existing['sources']
+                            and (identity is None or identities[i] is None)):
+                        index = i
+                        break
+
+            if index is None:
+                merged.append(dict(camera, sources=[source_name]))
+                identities.append(identity)
+                if identity:
+                    by_identity[identity] = len(merged) - 1
+                continue
+
+            target = merged[index]
+            for key, value in camera.items():
+                if target.get(key) is None:
+                    target[key] = value
+            target['sources'].append(source_name)
+            if identity and identities[index] is None:
+                identities[index] = identity
+                by_identity[identity] = index
+
+    return merged
+
+
+def _run_source(source: CameraSource, results: Dict[str, SourceResult], cameras: Dict[str, List[Dict]]):
+    start = time.perf_counter()
+    try:
+        found = source.load(source.timeout)
+        status, error = STATUS_OK, None
+    except (TimeoutError, FutureTimeoutError):
+        found, status, error = [], STATUS_TIMEOUT, None
+    except Exception as e:
+        found, status, error = [], STATUS_ERROR, str(e) or type(e).__name__
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    cameras[source.name] = found
+    results[source.name] = SourceResult(source.name, status, round(elapsed_ms, 3), len(found), error)
+
+
+def enumerate_cameras(sources: Optional[List[CameraSource]] = None) -> CameraEnumeration:
+    """
+    Consulta as fontes em paralelo e combina os resultados.
+
+    Cada fonte roda na sua própria thread e tem até o seu prazo para
+    responder; as que não respondem são marcadas como STATUS_TIMEOUT e o
+    resultado das demais é retornado mesmo assim.
+
+    Args:
+        sources: Fontes em ordem de prioridade (padrão: default_sources())
+    """
+    if sources is None:
+        sources = default_sources()
+
+    results: Dict[str, SourceResult] = {}
+    cameras: Dict[str, List[Dict]] = {}
+    start = time.monotonic()
+    threads = []
+    for source in sources:
+        # Threads daemon: uma fonte travada não impede o encerramento do programa
+        thread = threading.Thread(target=_run_source, args=(source, results, cameras),
+                                  name=f"camera-source-{source.name}", daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    source_results = []
+    camera_lists = []
+    for source, thread in zip(sources, threads):
+        thread.join(max(0.0, start + source.timeout - time.monotonic()))
+        result = results.get(source.name)
+        if result is None:
+            result = SourceResult(source.name, STATUS_TIMEOUT, round(source.timeout * 1000, 3), 0)
+        source_results.append(result)
+        camera_lists.append(cameras.get(source.name, []) if result.status == STATUS_OK else [])
+
+    merged = merge_cameras(camera_lists, [source.name for source in sources])
+    return CameraEnumeration(merged, source_results)
@@ -3,21 +3,148 @@ Camera Spoofer - Utilitários de Câmera
 Funções para detectar câmeras e modificar seus nomes no registro do Windows.
 """
 
-import winreg
-import json
 import os
-from typing import List, Dict, Optional, Tuple
+import re
+import threading
+from typing import TYPE_CHECKING, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
-from real_cameras import is_virtual_camera, get_suggested_name
+from registry_index import RegistryIndex, fold_text, is_searchable_value
+from backup_store import BackupRepository, BackupStore
+from operation_stats import (
+    PHASE_BACKUP,
+    PHASE_ENUMERATION,
+    PHASE_SEARCH,
+    PHASE_WRITE,
+    OperationStats,
+    measure,
+)
+from registry_backend import HKEY_LOCAL_MACHINE, REG_SZ, get_backend
+from registry_writer import WRITE_MISMATCH, WRITE_WRITTEN, WriteReport, read_values, write_values
+from rename_plan import PlanResult, PlannedWrite, RenamePlan, compute_fingerprint
+from registry_scan import (
+    DEFAULT_WORKERS,
+    ScanCancelled,
+    ScanItem,
+    ScanProgress,
+    iter_key_values,
+    scan_values,
+    stream_values,
+)
+
+# O acesso ao registro passa por get_backend() (winreg por padrão). winreg,
+# real_cameras, name_matcher e pygrabber são carregados apenas nas funções que
+# os usam, para manter a importação deste módulo rápida
+if TYPE_CHECKING:
+    from rename_profile import RenameProfile
 
 
 # Arquivo para backup dos nomes originais
 BACKUP_FILE = "camera_backup.json"
 
+# Locais do registro onde os nomes das câmeras são buscados
+REGISTRY_SEARCH_PATHS = [
+    (HKEY_LOCAL_MACHINE, r"SYSTEM\CurrentControlSet\Control\DeviceClasses"),
+    (HKEY_LOCAL_MACHINE, r"SYSTEM\CurrentControlSet\Enum"),
+    (HKEY_LOCAL_MACHINE, r"SOFTWARE\Classes\CLSID"),
+]
+
+# Modos de busca reportados pela busca com escopo
+SEARCH_MODE_SCOPED = "scoped"
+SEARCH_MODE_FULL = "full"
+
+# Subárvores onde câmeras de qualquer família costumam aparecer
+_ENUM = r"SYSTEM\CurrentControlSet\Enum"
+_DEVICE_CLASSES = r"SYSTEM\CurrentControlSet\Control\DeviceClasses"
+_CLSID = r"SOFTWARE\Classes\CLSID"
+
+COMMON_CAMERA_LOCATIONS = [
+    _ENUM + r"\ROOT",
+    _ENUM + r"\SWD",
+    _ENUM + r"\SW",  # Dispositivos KS enumerados por software (drivers antigos)
+    _ENUM + r"\USB",
+    _DEVICE_CLASSES + r"\{e5323777-f976-4f5b-9b55-b94699c46e44}",  # KSCATEGORY_VIDEO_CAMERA
+    _DEVICE_CLASSES + r"\{6994AD05-93EF-11D0-A3CC-00A0C9223196}",  # KSCATEGORY_VIDEO
+    _DEVICE_CLASSES + r"\{65E8773D-8F56-11D0-A3B9-00A0C9223196}",  # KSCATEGORY_CAPTURE
+    _CLSID + r"\{860BB310-5D01-11d0-BD3B-00A0C911CE86}",  # CLSID_VideoInputDeviceCategory
+]
+
+# Subárvores adicionais por família de câmera virtual. Toda família de
+# VIRTUAL_CAMERA_FAMILIES tem uma entrada; lista vazia quando a família não tem
+# local próprio conhecido além de COMMON_CAMERA_LOCATIONS (filtros DirectShow
+# aparecem em CLSID_VideoInputDeviceCategory; drivers de kernel e câmeras de
+# software, em Enum\ROOT, Enum\SW e Enum\SWD)
+SCOPED_SEARCH_LOCATIONS = {
+    "OBS Studio": [
+        _CLSID + r"\{A3FCE0F5-3493-419F-958A-ABA1250EC20B}",  # Filtro DirectShow do OBS
+    ],
+    # Filtros DirectShow do NDI Webcam/Virtual Input: CLSID varia com a versão do NDI Tools
+    "NDI": [],
+    # Filtro DirectShow "vMix Video": sem CLSID fixo documentado
+    "vMix": [],
+    # Driver de kernel (Enum\ROOT) e filtro DirectShow com CLSID da versão instalada
+    "ManyCam": [],
+    # Filtro DirectShow do XSplit VCam/Broadcaster: CLSID da versão instalada
+    "XSplit": [],
+    # Filtro DirectShow do Snap Camera: CLSID da versão instalada
+    "Snap Camera": [],
+    # Driver de vídeo do SplitCam enumerado em Enum\ROOT
+    "SplitCam": [],
+    # Filtro DirectShow do YouCam: CLSID da versão instalada
+    "CyberLink YouCam": [],
+    # Filtro DirectShow do Prism Live Studio: CLSID da versão instalada
+    "Prism Live Studio": [],
+    # Driver de kernel da e2eSoft enumerado em Enum\ROOT
+    "e2eSoft VCam": [],
+    # Driver da Elgato/Kinoni: dispositivo em Enum\ROOT ou Enum\SWD conforme a versão
+    "EpocCam": [],
+    # Filtro DirectShow do AlterCam: CLSID da versão instalada
+    "AlterCam": [],
+    # Filtro DirectShow "DroidCam Source": CLSID varia entre as versões do cliente
+    "DroidCam": [],
+    # Driver de kernel da e2eSoft enumerado em Enum\ROOT
+    "iVCam": [],
+    # Extensão do macOS; no Windows só aparece por outros filtros genéricos
+    "CamTwist": [],
+    # Padrões genéricos: nenhuma subárvore específica
+    "Outros": [],
+}
+
+# Número de threads usadas na varredura do registro
+SCAN_WORKERS = DEFAULT_WORKERS
+
+# Usa o índice em memória nas buscas quando use_index não é informado. Construir
+# o índice custa mais que uma varredura, então ele só compensa em processos
+# longos que fazem várias buscas (a interface o liga); a CLI e o uso como
+# biblioteca percorrem o registro diretamente
+USE_REGISTRY_INDEX = False
+
+# Intervalo padrão entre os sinais de progresso da busca em streaming, em segundos
+SEARCH_HEARTBEAT = 0.5
+
+# Índice compartilhado dos valores encontrados nas raízes de busca. O lock
+# protege o índice entre buscas, escritas e o monitor do registro (threads)
+_registry_index = RegistryIndex()
+_registry_index_lock = threading.RLock()
+
+# Backup em memória (criado sob demanda)
+_backup_repository: Optional[BackupRepository] = None
+
+# Caminho do backup definido por set_backup_path (None usa o padrão)
+_backup_path_override: Optional[Path] = None
+
+
+def set_backup_path(path: Optional[Path]):
+    """Define outro arquivo de backup (None volta ao padrão ao lado do executável)."""
+    global _backup_path_override
+    _backup_path_override = Path(path) if path is not None else None
+
 
 def get_backup_path() -> Path:
     """Retorna o caminho do arquivo de backup."""
+    if _backup_path_override is not None:
+        return _backup_path_override
+    
     # Salva no mesmo diretório do executável
     if hasattr(os, 'frozen'):
         base_dir = Path(os.path.dirname(os.sys.executable))
@@ -26,66 +153,62 @@ def get_backup_path() -> Path:
     return base_dir / BACKUP_FILE
 
 
-def get_cameras_via_directshow() -> List[Dict]:
+def list_directshow_cameras(timeout: Optional[float] = None) -> List[Dict]:
     """
     Obtém lista de câmeras usando DirectShow via pygrabber.
     Detecta se a câmera é virtual baseado em:
     1. Nome contém padrões de câmera virtual (OBS, NDI, vMix, etc.)
     2. Ou nome NÃO é de uma marca de hardware conhecida
     
+    Args:
+        timeout: Espera máxima pela enumeração, em segundos (None = padrão do worker)
+    
     Returns:
         Lista de dicionários com informações das câmeras
+    
+    Raises:
+        ImportError: pygrabber/pywin32 não instalados
+        TimeoutError: a enumeração não terminou a tempo
     """
-    cameras = []
+    from real_cameras import classify_many
+    from directshow_worker import DEFAULT_TIMEOUT, get_directshow_worker
     
-    # Marcas de câmeras físicas conhecidas
-    KNOWN_BRANDS = [
-        'logitech', 'microsoft', 'dell', 'hp', 'lenovo', 'asus', 'razer',
-        'creative', 'acer', 'genius', 'trust', 'elgato', 'anker', 'obsbot',
-        'insta360', 'avermedia', 'a4tech', 'canyon', 'papalook', 'webcam',
-        'facecam', 'lifecam', 'brio', 'kiyo', 'integrated', 'built-in', 'usb'
-    ]
+    # O worker mantém o COM e o enumerador abertos entre as chamadas
+    devices = get_directshow_worker().enumerate_devices(DEFAULT_TIMEOUT if timeout is None else timeout)
+    names = [name for name, _ in devices]
     
-    try:
-        import pythoncom
-        pythoncom.CoInitialize()
+    cameras = []
+    for idx, ((name, device_path), classification) in enumerate(zip(devices, classify_many(names))):
+        # Virtual se tem padrão de câmera virtual ou se não é de marca conhecida
+        is_virtual = classification.is_virtual
         
-        try:
-            from pygrabber.dshow_graph import FilterGraph
-            
-            graph = FilterGraph()
-            device_names = graph.get_input_devices()
-            
-            for idx, name in enumerate(device_names):
-                name_lower = name.lower()
-                
-                # Primeiro verifica se tem padrão de câmera virtual
-                if is_virtual_camera(name):
-                    is_virtual = True
-                # Senão verifica se é de uma marca conhecida
-                elif any(brand in name_lower for brand in KNOWN_BRANDS):
-                    is_virtual = False
-                else:
-                    # Se não reconhecemos, assume que é virtual (mais seguro)
-                    is_virtual = True
-                
-                cameras.append({
-                    'name': name,
-                    'device_id': str(idx),
-                    'pnp_device_id': str(idx),
-                    'status': 'OK',
-                    'is_virtual': is_virtual,
-                    'manufacturer': 'Unknown',
-                })
-        finally:
-            pythoncom.CoUninitialize()
-            
+        cameras.append({
+            'name': name,
+            'device_id': str(idx),
+            'pnp_device_id': str(idx),
+            'status': 'OK',
+            'is_virtual': is_virtual,
+            'manufacturer': 'Unknown',
+            'device_path': device_path,
+        })
+    return cameras
+
+
+def get_cameras_via_directshow() -> List[Dict]:
+    """
+    Obtém lista de câmeras usando DirectShow (veja list_directshow_cameras).
+    Erros são impressos e resultam em uma lista vazia.
+    
+    Returns:
+        Lista de dicionários com informações das câmeras
+    """
+    try:
+        return list_directshow_cameras()
     except ImportError:
         print("pygrabber não instalado. Instale com: pip install pygrabber")
     except Exception as e:
         print(f"Erro ao enumerar dispositivos: {e}")
-    
-    return cameras
+    return []
 
 
 def get_cameras_via_registry() -> List[Dict]:
@@ -96,6 +219,10 @@ def get_cameras_via_registry() -> List[Dict]:
     Returns:
         Lista de dicionários com informações das câmeras
     """
+    from real_cameras import is_virtual_camera
+    
+    winreg = get_backend()
+    
     cameras = []
     
     # Busca câmeras no registro de dispositivos de vídeo (Device Classes)
@@ -122,6 +249,7 @@ def get_cameras_via_registry() -> List[Dict]:
                                 'is_virtual': is_virtual_camera(friendly_name),
                                 'manufacturer': 'Unknown',
                                 'registry_path': subkey_path,
+                                'device_path': subkey_name,
                             })
                     except (FileNotFoundError, OSError):
                         pass
@@ -137,217 +265,823 @@ def get_cameras_via_registry() -> List[Dict]:
     return cameras
 
 
-def find_camera_registry_entries(camera_name: str) -> List[Tuple[str, str, str]]:
+def _iter_search_paths_values(value_filter=None,
+                              cancel_event: Optional[threading.Event] = None,
+                              stats: Optional[OperationStats] = None) -> Iterator[Tuple[str, str, str]]:
+    """Percorre todas as raízes de busca (em paralelo) retornando os valores de texto."""
+    return scan_values(REGISTRY_SEARCH_PATHS, workers=SCAN_WORKERS,
+                       value_filter=value_filter, cancel_event=cancel_event, stats=stats)
+
+
+def _path_depth(path: str) -> int:
+    """Calcula a profundidade de um caminho em relação à sua raiz de busca."""
+    for _, root in REGISTRY_SEARCH_PATHS:
+        if path.lower() == root.lower() or path.lower().startswith(root.lower() + "\\"):
+            return path.count("\\") - root.count("\\")
+    return 0
+
+
+def get_registry_index() -> RegistryIndex:
+    """Retorna o índice compartilhado dos valores do registro."""
+    return _registry_index
+
+
+def invalidate_registry_index(path: Optional[str] = None, recursive: bool = True):
     """
-    Encontra todas as entradas do registro que contêm o nome da câmera.
+    Invalida o índice do registro (todo, uma subárvore ou os valores de uma chave).
     
     Args:
-        camera_name: Nome da câmera para buscar
+        path: Subárvore alterada. Se None, o índice será reconstruído na próxima busca.
+        recursive: Se False, apenas os valores da própria chave serão relidos
+    """
+    with _registry_index_lock:
+        _registry_index.invalidate(path, recursive)
+
+
+def _ensure_registry_index(cancel_event: Optional[threading.Event] = None,
+                           stats: Optional[OperationStats] = None) -> bool:
+    """
+    Constrói o índice se necessário e percorre novamente as subárvores invalidadas.
+    
+    Args:
+        cancel_event: Evento que interrompe a varredura com ScanCancelled
+        stats: Contadores e tempos da operação (None desativa a medição)
+    
+    Returns:
+        True se o índice pode ser usado para buscas
+    """
+    if _registry_index.over_budget:
+        return False
+    
+    with measure(stats, PHASE_ENUMERATION):
+        if not _registry_index.is_ready:
+            return _registry_index.build(_iter_search_paths_values(cancel_event=cancel_event, stats=stats))
+        
+        for path in _registry_index.stale_paths:
+            for entry in iter_key_values(HKEY_LOCAL_MACHINE, path, _path_depth(path),
+                                         cancel_event=cancel_event, stats=stats):
+                if not _registry_index.add(*entry):
+                    return False
+            _registry_index.mark_fresh(path)
+        
+        for path in _registry_index.stale_keys:
+            for entry in iter_key_values(HKEY_LOCAL_MACHINE, path, _path_depth(path), recursive=False,
+                                         cancel_event=cancel_event, stats=stats):
+                if not _registry_index.add(*entry):
+                    return False
+            _registry_index.mark_fresh(path)
+    
+    return True
+
+
+def _reread_index_entries(found: Dict[str, List[Tuple[str, str, str]]],
+                          stats: Optional[OperationStats] = None) -> Dict[str, List[Tuple[str, str, str]]]:
+    """
+    Relê no registro os valores encontrados no índice.
+    
+    O índice só é atualizado pelo monitor nas raízes monitoradas e pelas
+    escritas deste processo, então um valor indexado pode ter mudado. Cada
+    entrada volta com o valor atual e é descartada se não contém mais o nome;
+    o índice recebe os valores relidos. Deve ser chamada com o lock do índice.
+    
+    Args:
+        found: Dicionário nome -> entradas encontradas no índice
+        stats: Contadores e tempos da operação (None desativa a medição)
         
     Returns:
-        Lista de tuplas (chave, valor, caminho) com as entradas encontradas
+        Dicionário nome -> entradas com os valores atuais
     """
-    entries = []
+    indexed = {(path, value_name): value for entries in found.values() for path, value_name, value in entries}
+    pairs = list(indexed)
+    current = {pair: value for pair, (value, _) in zip(pairs, read_values(pairs, stats))}
     
-    # Busca em vários locais do registro
-    search_paths = [
-        (winreg.HKEY_LOCAL_MACHINE, r"SYSTEM\CurrentControlSet\Control\DeviceClasses"),
-        (winreg.HKEY_LOCAL_MACHINE, r"SYSTEM\CurrentControlSet\Enum"),
-        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Classes\CLSID"),
-    ]
+    for (path, value_name), value in current.items():
+        if not isinstance(value, str):
+            _registry_index.remove(path, value_name)
+        elif value != indexed[(path, value_name)]:
+            _registry_index.update_value(path, value_name, value)
     
-    def search_key(hkey, path, depth=0):
-        """Busca recursivamente no registro."""
-        if depth > 6:  # Limita profundidade
-            return
+    results = {}
+    for name, entries in found.items():
+        folded = fold_text(name)
+        results[name] = []
+        for path, value_name, _ in entries:
+            value = current[(path, value_name)]
+            if isinstance(value, str) and folded in fold_text(value) and is_searchable_value(value):
+                results[name].append((path, value_name, value))
+    return results
+
+
+def _index_walk_entries(entries: List[Tuple[str, str, str]]):
+    """Acrescenta ao índice pronto as entradas que só a varredura encontrou."""
+    with _registry_index_lock:
+        if _registry_index.is_ready:
+            for entry in entries:
+                if not _registry_index.add(*entry):
+                    break
+
+
+def iter_camera_registry_entries(camera_name: str, use_index: Optional[bool] = None,
+                                 cancel_event: Optional[threading.Event] = None,
+                                 stats: Optional[OperationStats] = None,
+                                 heartbeat: Optional[float] = SEARCH_HEARTBEAT) -> Iterator[ScanItem]:
+    """
+    Procura o nome da câmera no registro devolvendo cada entrada assim que ela
+    é encontrada. Interromper a iteração (break) encerra a varredura, o que
+    permite parar na primeira entrada quando basta saber se o nome existe.
+    
+    Args:
+        camera_name: Nome da câmera para buscar
+        use_index: Usa o índice em memória em vez de percorrer o registro
+            (None segue USE_REGISTRY_INDEX)
+        cancel_event: Evento que interrompe a varredura com ScanCancelled
+        stats: Contadores e tempos da operação (None desativa a medição)
+        heartbeat: Intervalo entre sinais de progresso durante a varredura, em
+            segundos (None emite apenas o sinal final)
+    
+    Yields:
+        Tuplas (caminho, nome do valor, valor) e ScanProgress; o último item é
+        sempre um ScanProgress com done=True
+    """
+    if use_index is None:
+        use_index = USE_REGISTRY_INDEX
+    walked: Optional[List[Tuple[str, str, str]]] = None
+    if use_index:
+        entries = []
+        # O índice só aponta onde procurar: os valores são relidos e, se o nome
+        # não aparece mais em nenhum deles, o registro é percorrido
+        with _registry_index_lock:
+            if _ensure_registry_index(cancel_event, stats):
+                with measure(stats, PHASE_SEARCH):
+                    found = _registry_index.find(camera_name)
+                entries = _reread_index_entries({camera_name: found}, stats)[camera_name]
+                walked = []
         
-        try:
-            with winreg.OpenKey(hkey, path, 0, winreg.KEY_READ) as key:
-                # Verifica valores
-                try:
-                    i = 0
-                    while True:
-                        try:
-                            name, value, _ = winreg.EnumValue(key, i)
-                            if isinstance(value, str) and camera_name.lower() in value.lower():
-                                entries.append((path, name, value))
-                            i += 1
-                        except OSError:
-                            break
-                except Exception:
-                    pass
-                
-                # Busca subchaves
-                try:
-                    i = 0
-                    while True:
-                        try:
-                            subkey_name = winreg.EnumKey(key, i)
-                            search_key(hkey, f"{path}\\{subkey_name}", depth + 1)
-                            i += 1
-                        except OSError:
-                            break
-                except Exception:
-                    pass
-        except (FileNotFoundError, PermissionError):
-            pass
+        # As entradas do índice saem fora do lock: quem itera pode demorar
+        if entries:
+            yield from entries
+            yield ScanProgress(0, 0, len(entries), 0.0, done=True)
+            return
     
-    for hkey, path in search_paths:
-        search_key(hkey, path)
+    # Na varredura a comparação acontece durante a enumeração (ver bytes_compared)
+    camera_folded = fold_text(camera_name)
+    with measure(stats, PHASE_ENUMERATION):
+        for item in stream_values(
+            REGISTRY_SEARCH_PATHS,
+            workers=SCAN_WORKERS,
+            value_filter=lambda value: camera_folded in fold_text(value) and is_searchable_value(value),
+            cancel_event=cancel_event,
+            stats=stats,
+            heartbeat=heartbeat,
+        ):
+            if walked is not None and not isinstance(item, ScanProgress):
+                walked.append(item)
+            yield item
+    if walked:
+        _index_walk_entries(walked)
+
+
+def find_camera_registry_entries(camera_name: str, use_index: Optional[bool] = None,
+                                 cancel_event: Optional[threading.Event] = None,
+                                 stats: Optional[OperationStats] = None) -> List[Tuple[str, str, str]]:
+    """
+    Encontra todas as entradas do registro que contêm o nome da câmera
+    (veja iter_camera_registry_entries).
     
-    return entries
+    Args:
+        camera_name: Nome da câmera para buscar
+        use_index: Usa o índice em memória em vez de percorrer o registro
+            (None segue USE_REGISTRY_INDEX)
+        cancel_event: Evento que interrompe a varredura com ScanCancelled
+        stats: Contadores e tempos da operação (None desativa a medição)
+        
+    Returns:
+        Lista de tuplas (chave, valor, caminho) com as entradas encontradas
+    """
+    return [
+        item for item in iter_camera_registry_entries(camera_name, use_index, cancel_event, stats, heartbeat=None)
+        if not isinstance(item, ScanProgress)
+    ]
 
 
-def get_all_cameras() -> List[Dict]:
+def camera_name_in_registry(camera_name: str, use_index: Optional[bool] = None,
+                            cancel_event: Optional[threading.Event] = None) -> bool:
+    """Verifica se o nome aparece no registro, parando na primeira entrada encontrada."""
+    for item in iter_camera_registry_entries(camera_name, use_index, cancel_event, heartbeat=None):
+        if not isinstance(item, ScanProgress):
+            return True
+    return False
+
+
+def find_camera_registry_entries_many(camera_names: List[str], use_index: Optional[bool] = None,
+                                      cancel_event: Optional[threading.Event] = None,
+                                      stats: Optional[OperationStats] = None
+                                      ) -> Dict[str, List[Tuple[str, str, str]]]:
     """
-    Obtém lista de todas as câmeras do sistema.
-    Usa DirectShow (COM) para detectar câmeras por DevicePath.
+    Encontra as entradas do registro de vários nomes de câmera de uma só vez.
+    Sem o índice (ou para os nomes que o índice não encontra), faz uma única
+    varredura comparando todos os nomes com um autômato compilado.
     
+    Args:
+        camera_names: Nomes das câmeras para buscar
+        use_index: Usa o índice em memória em vez de percorrer o registro
+            (None segue USE_REGISTRY_INDEX)
+        cancel_event: Evento que interrompe a varredura com ScanCancelled
+        stats: Contadores e tempos da operação (None desativa a medição)
+        
     Returns:
-        Lista de dicionários com informações das câmeras
+        Dicionário nome -> lista de tuplas (chave, valor, caminho)
     """
-    cameras = []
+    names = list(dict.fromkeys(camera_names))
+    if not names:
+        return {}
     
-    # Usa DirectShow COM para detecção precisa de virtual vs real
-    cameras = get_cameras_via_directshow()
+    if use_index is None:
+        use_index = USE_REGISTRY_INDEX
+    found: Dict[str, List[Tuple[str, str, str]]] = {}
+    indexed = False
+    if use_index:
+        # Valores relidos como em iter_camera_registry_entries; só os nomes
+        # que não aparecem em nenhum deles são procurados na varredura
+        with _registry_index_lock:
+            if _ensure_registry_index(cancel_event, stats):
+                with measure(stats, PHASE_SEARCH):
+                    found = {name: _registry_index.find(name) for name in names}
+                found = _reread_index_entries(found, stats)
+                indexed = True
+        missing = [name for name in names if not found[name]]
+        if not missing:
+            return found
+    else:
+        missing = names
     
-    # Se não encontrou nada, tenta via registro
-    if not cameras:
-        cameras = get_cameras_via_registry()
+    from name_matcher import NameMatcher
     
-    # Remove duplicatas baseado no nome
-    seen_names = set()
-    unique_cameras = []
-    for cam in cameras:
-        if cam['name'] not in seen_names:
-            seen_names.add(cam['name'])
-            unique_cameras.append(cam)
+    # A varredura sempre começa de listas vazias (nada do índice é reaproveitado)
+    walked: Dict[str, List[Tuple[str, str, str]]] = {name: [] for name in missing}
+    matcher = NameMatcher(missing)
+    with measure(stats, PHASE_ENUMERATION):
+        for entry in _iter_search_paths_values(value_filter=is_searchable_value,
+                                               cancel_event=cancel_event, stats=stats):
+            for index in matcher.match_indices(entry[2]):
+                walked[missing[index]].append(entry)
+    if indexed:
+        _index_walk_entries([entry for entries in walked.values() for entry in entries])
     
-    return unique_cameras
+    return {name: found.get(name) or walked[name] for name in names}
 
 
-def save_backup(camera_name: str, registry_entries: List[Tuple[str, str, str]]):
+def get_scoped_search_locations(camera_name: str) -> List[str]:
     """
-    Salva backup do nome original da câmera.
+    Retorna as subárvores do registro onde a câmera provavelmente está registrada.
     
     Args:
-        camera_name: Nome original da câmera
-        registry_entries: Entradas do registro que serão modificadas
+        camera_name: Nome da câmera
+        
+    Returns:
+        Lista de caminhos (sem subárvores repetidas ou aninhadas)
     """
-    backup_path = get_backup_path()
+    from real_cameras import classify_camera
     
-    # Carrega backup existente ou cria novo
-    if backup_path.exists():
-        with open(backup_path, 'r', encoding='utf-8') as f:
-            backup_data = json.load(f)
-    else:
-        backup_data = {}
+    family = classify_camera(camera_name).family
+    locations = COMMON_CAMERA_LOCATIONS + SCOPED_SEARCH_LOCATIONS.get(family, [])
+    
+    folded = [path.lower() for path in locations]
+    return [
+        path for path in dict.fromkeys(locations)
+        if not any(path.lower().startswith(other + "\\") for other in folded)
+    ]
+
+
+def find_camera_registry_entries_scoped(camera_name: str,
+                                        cancel_event: Optional[threading.Event] = None,
+                                        stats: Optional[OperationStats] = None
+                                        ) -> Tuple[List[Tuple[str, str, str]], str]:
+    """
+    Busca a câmera apenas nas subárvores conhecidas da sua família de driver.
+    Se nada for encontrado, faz a varredura completa.
+    
+    Args:
+        camera_name: Nome da câmera para buscar
+        cancel_event: Evento que interrompe a varredura com ScanCancelled
+        stats: Contadores e tempos da operação (None desativa a medição)
+        
+    Returns:
+        Tupla (entradas encontradas, modo que produziu o resultado)
+    """
+    camera_folded = fold_text(camera_name)
+    roots = [
+        (HKEY_LOCAL_MACHINE, path, _path_depth(path))
+        for path in get_scoped_search_locations(camera_name)
+    ]
+    with measure(stats, PHASE_ENUMERATION):
+        entries = list(scan_values(
+            roots,
+            workers=SCAN_WORKERS,
+            value_filter=lambda value: camera_folded in fold_text(value) and is_searchable_value(value),
+            cancel_event=cancel_event,
+            stats=stats,
+        ))
+    if entries:
+        return entries, SEARCH_MODE_SCOPED
     
-    # Adiciona nova entrada
-    backup_data[camera_name] = {
+    entries = find_camera_registry_entries(camera_name, use_index=False, cancel_event=cancel_event,
+                                           stats=stats)
+    return entries, SEARCH_MODE_FULL
+
+
+def get_all_cameras() -> List[Dict]:
+    """
+    Obtém lista de todas as câmeras do sistema.
+    DirectShow e registro são consultados em paralelo, cada um com o seu
+    prazo, e os resultados são combinados pela identidade do dispositivo
+    (veja camera_sources.enumerate_cameras).
+    
+    Returns:
+        Lista de dicionários com informações das câmeras
+    """
+    from camera_sources import STATUS_TIMEOUT, enumerate_cameras
+    
+    enumeration = enumerate_cameras()
+    for result in enumeration.sources:
+        if result.status == STATUS_TIMEOUT:
+            print(f"Fonte de câmeras '{result.source}' não respondeu em {result.elapsed_ms:.0f} ms")
+        elif result.error:
+            print(f"Erro ao enumerar câmeras ({result.source}): {result.error}")
+    return enumeration.cameras
+
+
+def make_backup_record(camera_name: str, registry_entries: List[Tuple[str, str, str]]) -> Dict:
+    """Monta o registro de backup de uma câmera."""
+    return {
         'original_name': camera_name,
         'registry_entries': [
             {'path': path, 'value_name': name, 'original_value': value}
             for path, name, value in registry_entries
         ]
     }
+
+
+def get_backup_repository() -> BackupRepository:
+    """Retorna o backup em memória (recarregado apenas quando o arquivo muda)."""
+    global _backup_repository
+    backup_path = get_backup_path()
+    if _backup_repository is None or _backup_repository.store.snapshot_path != backup_path:
+        _backup_repository = BackupRepository(BackupStore(backup_path))
+    return _backup_repository
+
+
+def save_backup(camera_name: str, registry_entries: List[Tuple[str, str, str]]):
+    """
+    Salva backup do nome original da câmera.
+    
+    Args:
+        camera_name: Nome original da câmera
+        registry_entries: Entradas do registro que serão modificadas
+    """
+    save_backup_many({camera_name: registry_entries})
+
+
+def save_backup_many(entries_by_name: Dict[str, List[Tuple[str, str, str]]]):
+    """
+    Salva backup de várias câmeras com uma única gravação do arquivo.
     
-    # Salva
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        json.dump(backup_data, f, indent=2, ensure_ascii=False)
+    Args:
+        entries_by_name: Dicionário nome original -> entradas que serão modificadas
+    """
+    get_backup_repository().put_many({
+        camera_name: make_backup_record(camera_name, registry_entries)
+        for camera_name, registry_entries in entries_by_name.items()
+    })
 
 
 def load_backup() -> Dict:
     """
-    Carrega backup dos nomes originais.
+    Carrega backup dos nomes originais (snapshot + journal).
     
     Returns:
         Dicionário com dados de backup
     """
-    backup_path = get_backup_path()
+    return get_backup_repository().data()
+
+
+def _update_registry_index(writes: List[Tuple[str, str, str]], report: WriteReport):
+    """Atualiza o índice com o resultado das escritas."""
+    with _registry_index_lock:
+        for (path, value_name, value), outcome in zip(writes, report.outcomes):
+            if outcome.status == WRITE_WRITTEN:
+                _registry_index.update_value(path, value_name, value)
+            elif outcome.status == WRITE_MISMATCH:
+                # Valor gravado desconhecido: relê a chave na próxima busca
+                invalidate_registry_index(path, recursive=False)
+
+
+def _read_registry_value(path: str, value_name: str) -> Optional[str]:
+    """Lê um valor do registro (None se a chave ou o valor não existem)."""
+    winreg = get_backend()
+    
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_READ) as key:
+            value, _ = winreg.QueryValueEx(key, value_name)
+            return value
+    except OSError:
+        return None
+
+
+def rename_pattern(names) -> "re.Pattern":
+    """Alternância com os nomes, do mais longo ao mais curto (vence o mais longo em cada posição)."""
+    return re.compile("|".join(re.escape(name) for name in sorted(names, key=len, reverse=True)))
+
+
+def rename_text(text: str, renames: Dict[str, str],
+                pattern: Optional["re.Pattern"] = None) -> Tuple[str, List[str]]:
+    """
+    Aplica várias renomeações a um texto em uma única passada.
+    
+    Em cada posição é substituído o nome mais longo que aparece ali, de modo
+    que um nome contido em outro ("NDI Video 1" em "NDI Video 10") não
+    altera o nome maior.
+    
+    Args:
+        text: Texto original
+        renames: Dicionário nome atual -> novo nome
+        pattern: Padrão de rename_pattern(renames), para reaproveitar entre textos
+        
+    Returns:
+        Tupla (novo texto, nomes substituídos na ordem em que aparecem)
+    """
+    if not renames:
+        return text, []
+    if pattern is None:
+        pattern = rename_pattern(renames)
+    replaced: List[str] = []
+    
+    def replace(match: "re.Match") -> str:
+        old_name = match.group(0)
+        if old_name not in replaced:
+            replaced.append(old_name)
+        return renames[old_name]
+    
+    return pattern.sub(replace, text), replaced
+
+
+def _stage_renames(renames: Dict[str, str],
+                   entries_by_name: Dict[str, List[Tuple[str, str, str]]]) -> List[Tuple[str, str, str, str, List[str]]]:
+    """stage_renames com os nomes realmente substituídos em cada escrita."""
+    pattern = rename_pattern(renames)
+    entries: Dict[Tuple[str, str], Tuple[str, str, str]] = {}
+    for old_name in renames:
+        for path, value_name, value in entries_by_name.get(old_name, []):
+            entries.setdefault((path.lower(), value_name.lower()), (path, value_name, value))
+    
+    staged = []
+    for path, value_name, value in entries.values():
+        new_value, replaced = rename_text(value, renames, pattern)
+        if replaced:
+            staged.append((path, value_name, value, new_value, replaced))
+    return staged
+
+
+def stage_renames(renames: Dict[str, str],
+                  entries_by_name: Dict[str, List[Tuple[str, str, str]]]) -> List[Tuple[str, str, str, str]]:
+    """
+    Calcula as escritas necessárias para aplicar várias renomeações.
+    Um mesmo valor que contém mais de um nome recebe todas as substituições,
+    feitas em uma única passada (veja rename_text).
+    
+    Args:
+        renames: Dicionário nome atual -> novo nome
+        entries_by_name: Entradas do registro encontradas para cada nome atual
+        
+    Returns:
+        Lista de tuplas (caminho, nome do valor, valor original, novo valor)
+    """
+    return [write[:4] for write in _stage_renames(renames, entries_by_name)]
+
+
+def _apply_staged_writes(writes: List[Tuple[str, str, str, str]],
+                         stats: Optional[OperationStats] = None) -> Tuple[WriteReport, Optional[Exception]]:
+    """
+    Aplica as escritas como uma transação: se alguma falhar, desfaz as já aplicadas.
+    As escritas são agrupadas por chave e confirmadas por releitura (veja
+    registry_writer.write_values).
+    
+    Returns:
+        Tupla (resultado de cada escrita, erro que causou o rollback ou None)
+    """
+    pending = [(path, value_name, new_value) for path, value_name, _, new_value in writes]
+    report = write_values(pending, stats, stop_on_error=True)
+    _update_registry_index(pending, report)
+    
+    error = report.first_error
+    if error is None:
+        return report, None
+    
+    rollback = [
+        (path, value_name, original_value)
+        for (path, value_name, original_value, _), outcome in zip(writes, report.outcomes)
+        if outcome.status in (WRITE_WRITTEN, WRITE_MISMATCH)
+    ]
+    rollback_report = write_values(rollback, stats)
+    _update_registry_index(rollback, rollback_report)
+    for outcome in rollback_report.outcomes:
+        if not outcome.ok:
+            print(f"Erro ao desfazer {outcome.path}: {outcome.error or 'valor relido diferente do gravado'}")
+    return report, error
+
+
+def _build_rename_plan(renames: Dict[str, str],
+                       entries_by_name: Dict[str, List[Tuple[str, str, str]]],
+                       stats: Optional[OperationStats] = None) -> RenamePlan:
+    """Monta o plano a partir das entradas encontradas, lendo o tipo de cada valor."""
+    renames = {old: new for old, new in renames.items() if entries_by_name.get(old)}
+    writes = _stage_renames(renames, entries_by_name)
+    
+    # Cada entrada pertence apenas aos nomes realmente substituídos nela
+    replaced_names = {name for *_, replaced in writes for name in replaced}
+    renames = {old: new for old, new in renames.items() if old in replaced_names}
+    positions = {old_name: index for index, old_name in enumerate(renames)}
+    
+    types = read_values([(path, value_name) for path, value_name, *_ in writes], stats)
+    return RenamePlan(renames, [
+        PlannedWrite(path, value_name, old_value, new_value, value_type if value_type is not None else REG_SZ,
+                     tuple(sorted(positions[name] for name in replaced)))
+        for (path, value_name, old_value, new_value, replaced), (_, value_type) in zip(writes, types)
+    ])
+
+
+def plan_renames(renames: Dict[str, str],
+                 cancel_event: Optional[threading.Event] = None,
+                 stats: Optional[OperationStats] = None) -> RenamePlan:
+    """
+    Calcula as escritas de uma ou mais renomeações sem modificar o registro.
+    
+    Args:
+        renames: Dicionário nome atual -> novo nome
+        cancel_event: Evento que interrompe a busca com ScanCancelled
+        stats: Contadores e tempos da operação (None desativa a medição)
+        
+    Returns:
+        RenamePlan com os nomes encontrados no registro (nomes não encontrados
+        ficam de fora de plan.renames)
+    """
+    entries_by_name = find_camera_registry_entries_many(list(renames), cancel_event=cancel_event, stats=stats)
+    return _build_rename_plan(renames, entries_by_name, stats)
+
+
+def refresh_rename_plan(plan: RenamePlan,
+                        stats: Optional[OperationStats] = None) -> Tuple[RenamePlan, List[str]]:
+    """
+    Confere o plano com o registro atual, sem busca.
+    
+    Relê apenas os valores do plano. Se a impressão digital confere, o plano
+    é retornado como está; senão as chaves cujos valores mudaram são relidas
+    por inteiro e o plano é recalculado para elas (as demais entradas são
+    mantidas). Ocorrências novas fora das chaves do plano exigem um novo
+    plan_renames.
     
-    if backup_path.exists():
-        with open(backup_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    Returns:
+        Tupla (plano atualizado, chaves relidas)
+    """
+    current = read_values([(write.path, write.value_name) for write in plan.writes], stats)
+    fingerprint = compute_fingerprint(
+        (write.path, write.value_name, value, value_type)
+        for write, (value, value_type) in zip(plan.writes, current)
+    )
+    if fingerprint == plan.fingerprint:
+        return plan, []
+    
+    drifted = list(dict.fromkeys(
+        write.path for write, state in zip(plan.writes, current)
+        if state != (write.old_value, write.value_type)
+    ))
+    drifted_folded = {path.lower() for path in drifted}
+    
+    entries_by_name = {
+        old_name: [entry for entry in entries if entry[0].lower() not in drifted_folded]
+        for old_name, entries in plan.entries_by_name().items()
+    }
+    folded_names = [(old_name, fold_text(old_name)) for old_name in plan.renames]
+    for path in drifted:
+        # Mesmo filtro da busca: caminhos e identificadores nunca entram no plano
+        for entry in iter_key_values(HKEY_LOCAL_MACHINE, path, _path_depth(path), recursive=False,
+                                     value_filter=is_searchable_value, stats=stats):
+            folded_value = fold_text(entry[2])
+            for old_name, folded_name in folded_names:
+                if folded_name in folded_value:
+                    entries_by_name[old_name].append(entry)
+    
+    return _build_rename_plan(plan.renames, entries_by_name, stats), drifted
+
+
+def _commit_plan(plan: RenamePlan,
+                 stats: Optional[OperationStats] = None) -> Tuple[WriteReport, Optional[Exception]]:
+    """
+    Grava o backup de todas as câmeras do plano de uma vez e aplica as escritas em uma transação.
+    Se a transação falhar, o backup anterior é restaurado.
     
-    return {}
+    Returns:
+        Tupla (resultado de cada escrita, erro que causou o rollback ou None)
+    """
+    entries_by_name = plan.entries_by_name()
+    backed_up = [old_name for old_name in plan.renames if entries_by_name.get(old_name)]
+    with measure(stats, PHASE_BACKUP):
+        previous_backup = load_backup()
+        save_backup_many({old_name: entries_by_name[old_name] for old_name in backed_up})
+    
+    with measure(stats, PHASE_WRITE):
+        report, error = _apply_staged_writes(plan.staged_writes(), stats)
+    if error is not None:
+        # Desfaz os registros de backup desta transação
+        with measure(stats, PHASE_BACKUP):
+            repository = get_backup_repository()
+            repository.put_many({name: previous_backup[name] for name in backed_up if name in previous_backup})
+            repository.delete_many([name for name in backed_up if name not in previous_backup])
+    return report, error
 
 
-def rename_camera_in_registry(old_name: str, new_name: str) -> Tuple[bool, str]:
+def apply_rename_plan(plan: RenamePlan, stats: Optional[OperationStats] = None) -> PlanResult:
+    """
+    Aplica um plano (calculado agora ou carregado de um arquivo).
+    Se o registro mudou desde o plano, as chaves alteradas são replanejadas
+    antes da escrita (veja refresh_rename_plan).
+    
+    Args:
+        plan: Plano de renomeação
+        stats: Preenchido com os contadores e tempos da operação (None desativa a medição)
+        
+    Returns:
+        PlanResult (sucesso, mensagem, resultado de cada escrita, chaves replanejadas)
+    """
+    try:
+        with measure(stats, PHASE_SEARCH):
+            plan, replanned = refresh_rename_plan(plan, stats)
+        if not plan.writes:
+            return PlanResult(False, "Nenhuma entrada do plano foi encontrada no registro.", None, replanned)
+        
+        if stats is not None:
+            stats.matches += len(plan.writes)
+        
+        report, error = _commit_plan(plan, stats)
+        if error is not None:
+            return PlanResult(False, _transaction_error_message(error), report, replanned)
+        
+        message = f"Plano aplicado! ({report.written} entradas modificadas)"
+        if replanned:
+            message += f" {len(replanned)} chaves mudaram desde o plano e foram relidas."
+        return PlanResult(True, message, report, replanned)
+    
+    except Exception as e:
+        return PlanResult(False, f"Erro ao aplicar o plano: {str(e)}", None, [])
+
+
+def _transaction_error_message(error: Exception) -> str:
+    """Mensagem para uma transação desfeita."""
+    if isinstance(error, PermissionError):
+        return "Não foi possível modificar as entradas. Execute como administrador. (Nenhuma alteração mantida)"
+    return f"Erro ao modificar o registro: {error}. (Nenhuma alteração mantida)"
+
+
+def rename_camera_in_registry(old_name: str, new_name: str,
+                              cancel_event: Optional[threading.Event] = None,
+                              stats: Optional[OperationStats] = None) -> Tuple[bool, str]:
     """
     Renomeia uma câmera no registro do Windows.
+    Todas as entradas são modificadas ou nenhuma (em caso de erro, as já
+    modificadas são restauradas).
     
     Args:
         old_name: Nome atual da câmera
         new_name: Novo nome para a câmera
+        cancel_event: Evento que cancela a busca antes de qualquer escrita
+        stats: Preenchido com os contadores e tempos da operação (None desativa a medição)
         
     Returns:
         Tupla (sucesso, mensagem)
     """
     try:
         # Encontra todas as entradas com o nome antigo
-        entries = find_camera_registry_entries(old_name)
+        entries = find_camera_registry_entries(old_name, cancel_event=cancel_event, stats=stats)
         
         if not entries:
             return False, f"Não foi possível encontrar '{old_name}' no registro."
         
-        # Salva backup
-        save_backup(old_name, entries)
-        
-        # Modifica cada entrada
-        modified_count = 0
-        for path, value_name, old_value in entries:
-            try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0, 
-                                   winreg.KEY_SET_VALUE | winreg.KEY_READ) as key:
-                    new_value = old_value.replace(old_name, new_name)
-                    winreg.SetValueEx(key, value_name, 0, winreg.REG_SZ, new_value)
-                    modified_count += 1
-            except PermissionError:
-                continue
-            except Exception as e:
-                print(f"Erro ao modificar {path}: {e}")
-        
-        if modified_count > 0:
-            return True, f"Câmera renomeada com sucesso! ({modified_count} entradas modificadas)"
+        if stats is not None:
+            stats.matches += len(entries)
+        
+        plan = _build_rename_plan({old_name: new_name}, {old_name: entries}, stats)
+        
+        # Último ponto de cancelamento: daqui em diante o registro é modificado
+        if cancel_event is not None and cancel_event.is_set():
+            raise ScanCancelled()
+        
+        # Salva backup e modifica cada entrada
+        report, error = _commit_plan(plan, stats)
+        
+        if error is None:
+            return True, f"Câmera renomeada com sucesso! ({report.written} entradas modificadas)"
         else:
-            return False, "Não foi possível modificar nenhuma entrada. Execute como administrador."
+            return False, _transaction_error_message(error)
             
+    except ScanCancelled:
+        return False, "Busca cancelada. Nenhuma entrada foi modificada."
     except Exception as e:
         return False, f"Erro ao renomear câmera: {str(e)}"
 
 
-def restore_camera_name(camera_name: str) -> Tuple[bool, str]:
+def rename_cameras_with_profile(profile: "RenameProfile", camera_names: Optional[List[str]] = None,
+                                cancel_event: Optional[threading.Event] = None,
+                                stats: Optional[OperationStats] = None) -> Tuple[bool, str]:
+    """
+    Renomeia várias câmeras de acordo com um perfil de regras.
+    Os nomes são buscados em uma única varredura, o backup é gravado uma vez e
+    todas as escritas são aplicadas como uma transação.
+    
+    Args:
+        profile: Perfil com as regras de renomeação
+        camera_names: Nomes atuais das câmeras (padrão: câmeras detectadas)
+        cancel_event: Evento que cancela a busca antes de qualquer escrita
+        stats: Preenchido com os contadores e tempos da operação (None desativa a medição)
+        
+    Returns:
+        Tupla (sucesso, mensagem)
+    """
+    try:
+        if camera_names is None:
+            camera_names = [camera['name'] for camera in get_all_cameras()]
+        
+        renames = profile.resolve(camera_names)
+        if not renames:
+            return False, "Nenhuma câmera corresponde às regras do perfil."
+        
+        entries_by_name = find_camera_registry_entries_many(list(renames), cancel_event=cancel_event,
+                                                            stats=stats)
+        missing = [name for name in renames if not entries_by_name.get(name)]
+        renames = {old: new for old, new in renames.items() if entries_by_name.get(old)}
+        
+        if not renames:
+            return False, "Não foi possível encontrar as câmeras do perfil no registro."
+        
+        if stats is not None:
+            stats.matches += sum(len(entries_by_name[name]) for name in renames)
+        
+        plan = _build_rename_plan(renames, entries_by_name, stats)
+        
+        # Último ponto de cancelamento: daqui em diante o registro é modificado
+        if cancel_event is not None and cancel_event.is_set():
+            raise ScanCancelled()
+        
+        report, error = _commit_plan(plan, stats)
+        
+        if error is not None:
+            return False, _transaction_error_message(error)
+        
+        message = f"{len(renames)} câmeras renomeadas! ({report.written} entradas modificadas)"
+        if missing:
+            message += f" Não encontradas: {', '.join(missing)}"
+        return True, message
+        
+    except ScanCancelled:
+        return False, "Busca cancelada. Nenhuma entrada foi modificada."
+    except Exception as e:
+        return False, f"Erro ao renomear câmeras: {str(e)}"
+
+
+def restore_camera_name(camera_name: str,
+                        stats: Optional[OperationStats] = None) -> Tuple[bool, str]:
     """
     Restaura o nome original de uma câmera a partir do backup.
     
     Args:
         camera_name: Nome da câmera para restaurar (nome original)
+        stats: Preenchido com os contadores e tempos da operação (None desativa a medição)
         
     Returns:
         Tupla (sucesso, mensagem)
     """
     try:
-        backup_data = load_backup()
+        with measure(stats, PHASE_BACKUP):
+            entry_data = get_backup_repository().get(camera_name)
         
-        if camera_name not in backup_data:
+        if entry_data is None:
             return False, f"Backup não encontrado para '{camera_name}'"
         
-        entry_data = backup_data[camera_name]
-        restored_count = 0
-        
-        for reg_entry in entry_data['registry_entries']:
-            try:
-                path = reg_entry['path']
-                value_name = reg_entry['value_name']
-                original_value = reg_entry['original_value']
-                
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0,
-                                   winreg.KEY_SET_VALUE) as key:
-                    winreg.SetValueEx(key, value_name, 0, winreg.REG_SZ, original_value)
-                    restored_count += 1
-            except Exception as e:
-                print(f"Erro ao restaurar {path}: {e}")
+        if stats is not None:
+            stats.matches += len(entry_data['registry_entries'])
+        
+        writes = [
+            (reg_entry['path'], reg_entry['value_name'], reg_entry['original_value'])
+            for reg_entry in entry_data['registry_entries']
+        ]
+        with measure(stats, PHASE_WRITE):
+            report = write_values(writes, stats)
+            _update_registry_index(writes, report)
+        
+        for outcome in report.outcomes:
+            if not outcome.ok:
+                print(f"Erro ao restaurar {outcome.path}: {outcome.error or 'valor relido diferente do gravado'}")
+        # Entradas que já tinham o valor original também contam como restauradas
+        restored_count = sum(1 for outcome in report.outcomes if outcome.ok)
         
         if restored_count > 0:
             return True, f"Nome original restaurado! ({restored_count} entradas)"
@@ -365,5 +1099,47 @@ def get_backed_up_cameras() -> List[str]:
     Returns:
         Lista de nomes de câmeras com backup
     """
-    backup_data = load_backup()
-    return list(backup_data.keys())
+    return get_backup_repository().names()
+
+
+def verify_camera_backup(camera_name: str) -> Dict:
+    """
+    Compara os valores atuais do registro com o backup de uma câmera.
+    
+    Args:
+        camera_name: Nome original da câmera
+        
+    Returns:
+        Dicionário com o estado de cada entrada ('original', 'modified' ou 'missing')
+        e a contagem de cada estado
+    """
+    record = get_backup_repository().get(camera_name)
+    report = {
+        'name': camera_name,
+        'has_backup': record is not None,
+        'entries': [],
+        'original': 0,
+        'modified': 0,
+        'missing': 0,
+    }
+    if record is None:
+        return report
+    
+    for reg_entry in record['registry_entries']:
+        current = _read_registry_value(reg_entry['path'], reg_entry['value_name'])
+        if current is None:
+            state = 'missing'
+        elif current == reg_entry['original_value']:
+            state = 'original'
+        else:
+            state = 'modified'
+        report[state] += 1
+        report['entries'].append({
+            'path': reg_entry['path'],
+            'value_name': reg_entry['value_name'],
+            'original_value': reg_entry['original_value'],
+            'current_value': current,
+            'state': state,
+        })
+    
+    return report
@@ -0,0 +1,423 @@
+"""
+Camera Spoofer - Linha de Comando
+Interface sem janela para automação. Cada resultado é impresso como uma linha
+JSON (NDJSON) assim que fica disponível.
+
+Uso:
+    python -m cli list
+    python -m cli suggest --top 3 "OBS Virtual Camera"
+    python -m cli find "OBS Virtual Camera"
+    python -m cli find --stream --limit 1 "OBS Virtual Camera"
+    python -m cli find --index "OBS Virtual Camera" "NDI Webcam Input"
+    python -m cli rename "OBS Virtual Camera" "Logitech HD Webcam C920"
+    python -m cli --stats rename "OBS Virtual Camera" "Logitech HD Webcam C920"
+    python -m cli rename --profile perfil.json
+    python -m cli plan "OBS Virtual Camera" "Logitech HD Webcam C920" -o plano.json
+    python -m cli apply plano.json
+    python -m cli restore "OBS Virtual Camera"
+    python -m cli restore --all
+    python -m cli verify
+    python -m cli benchmark --name "OBS Virtual Camera"
+    python -m cli rewrite-reg export.reg --rename "OBS Virtual Camera=Logitech C920" --delta delta.reg
+    python -m cli fleet imagens/ --profile perfil.json --out-dir saida/ --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Optional
+
+from admin_utils import is_admin
+
+
+def emit(record_type: str, **fields):
+    """Imprime um registro NDJSON imediatamente."""
+    record = {'type': record_type}
+    record.update(fields)
+    print(json.dumps(record, ensure_ascii=False), flush=True)
+
+
+def _emit_result(success: bool, message: str, **fields) -> int:
+    emit('result', success=success, message=message, **fields)
+    return 0 if success else 1
+
+
+def _new_stats(args):
+    """Cria o objeto de estatísticas se --stats (ou CAMERA_SPOOFER_STATS) estiver ativo."""
+    if not args.stats:
+        return None
+    from operation_stats import OperationStats
+    return OperationStats()
+
+
+def _stats_fields(stats) -> dict:
+    return {'stats': stats.to_dict()} if stats is not None else {}
+
+
+def _warn_if_not_admin():
+    if not is_admin():
+        emit('warning', message="Sem privilégios de administrador: as escritas no registro podem falhar.")
+
+
+def cmd_list(args) -> int:
+    from camera_sources import enumerate_cameras
+
+    enumeration = enumerate_cameras()
+    for camera in enumeration.cameras:
+        emit('camera', **camera)
+    for result in enumeration.sources:
+        emit('source', **result.to_dict())
+    return 0
+
+
+def cmd_suggest(args) -> int:
+    from name_suggestions import suggest_names
+
+    if args.names:
+        cameras = [{'name': name, 'resolution': args.resolution} for name in args.names]
+    else:
+        from camera_sources import enumerate_cameras
+        cameras = [dict(camera, resolution=args.resolution) for camera in enumerate_cameras().cameras]
+
+    for camera, suggestions in zip(cameras, suggest_names(cameras, args.top)):
+        emit('suggestions', camera=camera['name'], device_path=camera.get('device_path'),
+             suggestions=[suggestion.to_dict() for suggestion in suggestions])
+    return 0
+
+
+def cmd_find(args) -> int:
+    from camera_utils import (
+        find_camera_registry_entries_many,
+        find_camera_registry_entries_scoped,
+    )
+
+    stats = _new_stats(args)
+    if args.stream or args.limit:
+        from camera_utils import iter_camera_registry_entries
+        from registry_scan import ScanProgress
+
+        for name in args.names:
+            found = 0
+            for item in iter_camera_registry_entries(name, use_index=args.index, stats=stats,
+                                                     heartbeat=args.heartbeat if args.stream else None):
+                if isinstance(item, ScanProgress):
+                    if args.stream:
+                        emit('progress', name=name, **item._asdict())
+                    continue
+                path, value_name, value = item
+                emit('entry', name=name, path=path, value_name=value_name, value=value)
+                found += 1
+                if args.limit and found >= args.limit:
+                    break
+    elif args.scoped:
+        for name in args.names:
+            entries, mode = find_camera_registry_entries_scoped(name, stats=stats)
+            for path, value_name, value in entries:
+                emit('entry', name=name, path=path, value_name=value_name, value=value, mode=mode)
+    else:
+        results = find_camera_registry_entries_many(args.names, use_index=args.index, stats=stats)
+        for name, entries in results.items():
+            for path, value_name, value in entries:
+                emit('entry', name=name, path=path, value_name=value_name, value=value)
+
+    if stats is not None:
+        emit('stats', **stats.to_dict())
+    return 0
+
+
+def cmd_rename(args) -> int:
+    from camera_utils import rename_camera_in_registry, rename_cameras_with_profile
+    from rename_profile import load_profile
+
+    _warn_if_not_admin()
+    stats = _new_stats(args)
+
+    if args.profile:
+        profile = load_profile(args.profile)
+        success, message = rename_cameras_with_profile(profile, args.cameras or None, stats=stats)
+        return _emit_result(success, message, profile=args.profile, **_stats_fields(stats))
+
+    if not args.old_name or not args.new_name:
+        return _emit_result(False, "Informe o nome atual e o novo nome, ou --profile.")
+
+    success, message = rename_camera_in_registry(args.old_name, args.new_name, stats=stats)
+    return _emit_result(success, message, old_name=args.old_name, new_name=args.new_name,
+                        **_stats_fields(stats))
+
+
+def cmd_plan(args) -> int:
+    from camera_utils import get_all_cameras, plan_renames
+    from rename_profile import load_profile
+
+    stats = _new_stats(args)
+    if args.profile:
+        profile = load_profile(args.profile)
+        names = args.cameras or [camera['name'] for camera in get_all_cameras()]
+        renames = profile.resolve(names)
+    elif args.old_name and args.new_name:
+        renames = {args.old_name: args.new_name}
+    else:
+        return _emit_result(False, "Informe o nome atual e o novo nome, ou --profile.")
+
+    plan = plan_renames(renames, stats=stats)
+    for write in plan.writes:
+        emit('write', path=write.path, value_name=write.value_name, old_value=write.old_value,
+             new_value=write.new_value, value_type=write.value_type)
+    if args.output:
+        plan.save(args.output)
+
+    missing = [name for name in renames if name not in plan.renames]
+    return _emit_result(bool(plan.writes), f"{len(plan.writes)} entradas no plano",
+                        fingerprint=plan.fingerprint, output=args.output, missing=missing,
+                        **_stats_fields(stats))
+
+
+def cmd_apply(args) -> int:
+    from camera_utils import apply_rename_plan
+    from rename_plan import load_plan
+
+    _warn_if_not_admin()
+    stats = _new_stats(args)
+
+    result = apply_rename_plan(load_plan(args.plan), stats=stats)
+    if result.report is not None:
+        for outcome in result.report.outcomes:
+            emit('write', **outcome.to_dict())
+    return _emit_result(result.success, result.message, plan=args.plan,
+                        replanned_keys=result.replanned_keys, **_stats_fields(stats))
+
+
+def cmd_restore(args) -> int:
+    from camera_utils import get_backed_up_cameras, restore_camera_name
+
+    _warn_if_not_admin()
+
+    if args.all:
+        names = get_backed_up_cameras()
+    elif args.name:
+        names = [args.name]
+    else:
+        return _emit_result(False, "Informe o nome da câmera ou --all.")
+
+    exit_code = 0
+    for name in names:
+        stats = _new_stats(args)
+        success, message = restore_camera_name(name, stats=stats)
+        emit('result', success=success, message=message, name=name, **_stats_fields(stats))
+        if not success:
+            exit_code = 1
+    return exit_code
+
+
+def cmd_verify(args) -> int:
+    from camera_utils import get_backed_up_cameras, verify_camera_backup
+
+    names = args.names or get_backed_up_cameras()
+    exit_code = 0
+    for name in names:
+        report = verify_camera_backup(name)
+        emit('verify', **report)
+        if report['missing']:
+            exit_code = 1
+    return exit_code
+
+
+def _timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def cmd_benchmark(args) -> int:
+    from camera_utils import (
+        find_camera_registry_entries,
+        get_registry_index,
+        invalidate_registry_index,
+    )
+
+    names: List[str] = args.name or ["OBS Virtual Camera"]
+
+    for _ in range(args.repeat):
+        for name in names:
+            entries, seconds = _timed(find_camera_registry_entries, name, use_index=False)
+            emit('timing', phase='full_walk', name=name, seconds=seconds, matches=len(entries))
+
+    invalidate_registry_index()
+    _, seconds = _timed(find_camera_registry_entries, names[0])
+    index = get_registry_index()
+    emit('timing', phase='index_build', seconds=seconds, records=len(index), bytes=index.size_bytes)
+
+    for _ in range(args.repeat):
+        for name in names:
+            entries, seconds = _timed(find_camera_registry_entries, name)
+            emit('timing', phase='index_query', name=name, seconds=seconds, matches=len(entries))
+    return 0
+
+
+def _parse_pairs(pairs: Optional[List[str]]) -> dict:
+    result = {}
+    for pair in pairs or []:
+        old, sep, new = pair.partition("=")
+        if not sep:
+            raise ValueError(f"Use o formato ANTIGO=NOVO: {pair}")
+        result[old] = new
+    return result
+
+
+def cmd_rewrite_reg(args) -> int:
+    from reg_export import RegExportRewriter, collect_friendly_names, write_backup_file
+    from rename_profile import load_profile
+
+    mount_map = _parse_pairs(args.mount)
+    renames = _parse_pairs(args.rename)
+    if args.profile:
+        profile = load_profile(args.profile)
+        renames.update(profile.resolve(collect_friendly_names(args.source, mount_map)))
+    if not renames:
+        return _emit_result(False, "Nenhuma renomeação informada (--rename ou --profile).")
+    if not args.out and not args.delta:
+        return _emit_result(False, "Informe --out e/ou --delta.")
+
+    matched = RegExportRewriter(renames, mount_map).rewrite(args.source, args.out, args.delta)
+    for name, entries in matched.items():
+        for path, value_name, value in entries:
+            emit('entry', name=name, path=path, value_name=value_name, value=value)
+    if args.backup:
+        write_backup_file(matched, args.backup)
+
+    found = sum(len(entries) for entries in matched.values())
+    return _emit_result(bool(matched), f"{found} entradas reescritas", renames=renames,
+                        out=args.out, delta=args.delta, backup=args.backup)
+
+
+def cmd_fleet(args) -> int:
+    from fleet import run_fleet
+    from rename_profile import load_profile
+
+    profile = load_profile(args.profile).to_dict() if args.profile else None
+    renames = _parse_pairs(args.rename)
+    if profile is None and not renames:
+        return _emit_result(False, "Nenhuma renomeação informada (--rename ou --profile).")
+
+    def on_result(result, done, total):
+        emit('image', done=done, total=total, **result.to_dict())
+
+    summary = run_fleet(args.directory, args.out_dir, profile=profile, renames=renames,
+                        mount_map=_parse_pairs(args.mount), workers=args.workers, on_result=on_result)
+    data = summary.to_dict()
+    del data['results']
+    return _emit_result(summary.ok, f"{len(summary.results)} imagens processadas", **data)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Camera Spoofer sem interface gráfica (saída em NDJSON).",
+    )
+    parser.add_argument("--stats", action="store_true",
+                        default=bool(os.environ.get("CAMERA_SPOOFER_STATS")),
+                        help="Inclui contadores e tempo de cada fase nos resultados")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="Lista as câmeras detectadas")
+    list_parser.set_defaults(func=cmd_list)
+
+    suggest_parser = subparsers.add_parser("suggest", help="Sugere nomes de câmeras reais do catálogo")
+    suggest_parser.add_argument("names", nargs="*",
+                                help="Nomes atuais (padrão: todas as câmeras detectadas)")
+    suggest_parser.add_argument("--top", type=int, default=5, help="Sugestões por câmera")
+    suggest_parser.add_argument("--resolution", choices=["4k", "2k", "1080p", "720p", "vga"],
+                                help="Classe de resolução das câmeras (padrão: a citada no nome)")
+    suggest_parser.set_defaults(func=cmd_suggest)
+
+    find_parser = subparsers.add_parser("find", help="Busca nomes de câmera no registro")
+    find_parser.add_argument("names", nargs="+", help="Nomes para buscar")
+    find_parser.add_argument("--scoped", action="store_true",
+                             help="Busca primeiro nos locais conhecidos da família do driver")
+    find_parser.add_argument("--index", action="store_true",
+                             help="Constrói o índice em memória antes de buscar (compensa só com muitos nomes)")
+    find_parser.add_argument("--stream", action="store_true",
+                             help="Emite registros 'progress' periódicos durante a busca")
+    find_parser.add_argument("--heartbeat", type=float, default=0.5,
+                             help="Intervalo entre registros 'progress', em segundos (padrão 0.5)")
+    find_parser.add_argument("--limit", type=int, default=0,
+                             help="Para a busca de cada nome após N entradas")
+    find_parser.set_defaults(func=cmd_find)
+
+    rename_parser = subparsers.add_parser("rename", help="Renomeia uma câmera ou aplica um perfil")
+    rename_parser.add_argument("old_name", nargs="?", help="Nome atual")
+    rename_parser.add_argument("new_name", nargs="?", help="Novo nome")
+    rename_parser.add_argument("--profile", help="Arquivo JSON com regras de renomeação em lote")
+    rename_parser.add_argument("--camera", dest="cameras", action="append",
+                               help="Nome atual a considerar no perfil (padrão: câmeras detectadas)")
+    rename_parser.set_defaults(func=cmd_rename)
+
+    plan_parser = subparsers.add_parser("plan", help="Calcula as escritas de uma renomeação sem aplicá-las")
+    plan_parser.add_argument("old_name", nargs="?", help="Nome atual")
+    plan_parser.add_argument("new_name", nargs="?", help="Novo nome")
+    plan_parser.add_argument("--profile", help="Arquivo JSON com regras de renomeação em lote")
+    plan_parser.add_argument("--camera", dest="cameras", action="append",
+                             help="Nome atual a considerar no perfil (padrão: câmeras detectadas)")
+    plan_parser.add_argument("-o", "--output", help="Arquivo onde gravar o plano (.json ou .json.gz)")
+    plan_parser.set_defaults(func=cmd_plan)
+
+    apply_parser = subparsers.add_parser("apply", help="Aplica um plano gravado com 'plan'")
+    apply_parser.add_argument("plan", help="Arquivo do plano")
+    apply_parser.set_defaults(func=cmd_apply)
+
+    restore_parser = subparsers.add_parser("restore", help="Restaura nomes originais do backup")
+    restore_parser.add_argument("name", nargs="?", help="Nome original da câmera")
+    restore_parser.add_argument("--all", action="store_true", help="Restaura todas as câmeras com backup")
+    restore_parser.set_defaults(func=cmd_restore)
+
+    verify_parser = subparsers.add_parser("verify", help="Compara o registro com o backup")
+    verify_parser.add_argument("names", nargs="*", help="Nomes originais (padrão: todos com backup)")
+    verify_parser.set_defaults(func=cmd_verify)
+
+    benchmark_parser = subparsers.add_parser("benchmark", help="Mede o tempo das buscas no registro")
+    benchmark_parser.add_argument("--name", action="append", help="Nome para buscar (pode repetir)")
+    benchmark_parser.add_argument("--repeat", type=int, default=3, help="Repetições de cada medida")
+    benchmark_parser.set_defaults(func=cmd_benchmark)
+
+    rewrite_parser = subparsers.add_parser("rewrite-reg",
+                                           help="Reescreve uma exportação .reg offline (sem winreg)")
+    rewrite_parser.add_argument("source", help="Exportação gerada por regedit /e")
+    rewrite_parser.add_argument("--rename", action="append", metavar="ANTIGO=NOVO",
+                                help="Renomeação a aplicar (pode repetir)")
+    rewrite_parser.add_argument("--profile", help="Perfil JSON aplicado aos FriendlyName da exportação")
+    rewrite_parser.add_argument("--out", help="Destino da exportação completa reescrita")
+    rewrite_parser.add_argument("--delta", help="Destino do .reg apenas com os valores alterados")
+    rewrite_parser.add_argument("--backup", help="Destino do backup no formato camera_backup.json")
+    rewrite_parser.add_argument("--mount", action="append", metavar="PREFIXO=CAMINHO",
+                                help="Hive montada offline (ex.: HKEY_LOCAL_MACHINE\\OFFLINE=SYSTEM)")
+    rewrite_parser.set_defaults(func=cmd_rewrite_reg)
+
+    fleet_parser = subparsers.add_parser("fleet",
+                                         help="Reescreve um diretório de imagens offline em paralelo (sem winreg)")
+    fleet_parser.add_argument("directory", help="Diretório com as exportações .reg das imagens")
+    fleet_parser.add_argument("--out-dir", required=True, help="Diretório dos arquivos gerados e do resumo")
+    fleet_parser.add_argument("--profile", help="Perfil JSON aplicado aos FriendlyName de cada imagem")
+    fleet_parser.add_argument("--rename", action="append", metavar="ANTIGO=NOVO",
+                              help="Renomeação a aplicar em todas as imagens (pode repetir)")
+    fleet_parser.add_argument("--workers", type=int, help="Número de processos (padrão: número de CPUs)")
+    fleet_parser.add_argument("--mount", action="append", metavar="PREFIXO=CAMINHO",
+                              help="Hive montada offline (ex.: HKEY_LOCAL_MACHINE\\OFFLINE=SYSTEM)")
+    fleet_parser.set_defaults(func=cmd_fleet)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Função principal da linha de comando."""
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except Exception as e:
+        emit('error', message=str(e))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
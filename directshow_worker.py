@@ -0,0 +1,253 @@
+"""
+Camera Spoofer - Enumeração DirectShow
+Thread de longa duração que mantém o apartamento COM e o enumerador abertos
+e atende pedidos de enumeração de câmeras por uma fila. Pedidos simultâneos
+compartilham a mesma enumeração.
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, List, Optional, Tuple
+
+
+# Tempo máximo de espera por uma enumeração, em segundos
+DEFAULT_TIMEOUT = 15.0
+
+
+def _read_property(property_bag, name: str) -> Optional[str]:
+    try:
+        return property_bag.Read(name, pErrorLog=None)
+    except Exception:
+        return None
+
+
+class _VideoInputEnumerator:
+    """
+    Enumerador de dispositivos de captura de vídeo (via pygrabber/comtypes).
+
+    Além do FriendlyName lê o DevicePath de cada moniker, que identifica o
+    dispositivo mesmo quando duas câmeras têm o mesmo nome. Filtros de
+    software (a maioria das câmeras virtuais) não têm DevicePath; nesse caso
+    o CLSID do filtro é usado.
+    """
+
+    def __init__(self):
+        from pygrabber.dshow_graph import SystemDeviceEnum
+        self.system_device_enum = SystemDeviceEnum()
+
+    def get_input_devices(self) -> List[Tuple[str, Optional[str]]]:
+        from comtypes import GUID
+        from comtypes.persist import IPropertyBag
+        from pygrabber.dshow_ids import DeviceCategories
+
+        enumerator = self.system_device_enum.system_device_enum.CreateClassEnumerator(
+            GUID(DeviceCategories.VideoInputDevice), dwFlags=0)
+        devices = []
+        try:
+            moniker, count = enumerator.Next(1)
+        except ValueError:
+            # Nenhum dispositivo na categoria
+            return devices
+        while count > 0:
+            property_bag = moniker.BindToStorage(0, 0, IPropertyBag._iid_).QueryInterface(IPropertyBag)
+            name = _read_property(property_bag, "FriendlyName")
+            device_path = _read_property(property_bag, "DevicePath") or _read_property(property_bag, "CLSID")
+            if name:
+                devices.append((name, device_path))
+            moniker, count = enumerator.Next(1)
+        return devices
+
+
+def _com_initialize():
+    import pythoncom
+    pythoncom.CoInitialize()
+
+
+def _com_uninitialize():
+    import pythoncom
+    pythoncom.CoUninitialize()
+
+
+class DirectShowWorker:
+    """
+    Enumera dispositivos de vídeo em uma thread dedicada.
+
+    O apartamento COM é inicializado uma vez na thread e o enumerador é
+    criado no primeiro pedido e reaproveitado nos seguintes (recriado apenas
+    após um erro). O enumerador deve ter um método get_input_devices() que
+    retorna nomes ou pares (nome, caminho do dispositivo). Quem chama
+    enumerate() enquanto um pedido ainda está na fila ou em andamento recebe
+    o resultado desse mesmo pedido.
+
+    Se um pedido estoura o prazo (driver travado em get_input_devices), a
+    thread presa é abandonada com a sua fila e o seu enumerador: o próximo
+    pedido começa em uma thread nova, e a antiga termina sozinha se o driver
+    um dia responder.
+
+    As funções de criação do enumerador e de inicialização do COM podem ser
+    substituídas para usar o worker sem DirectShow.
+    """
+
+    def __init__(self, enumerator_factory: Callable[[], object] = _VideoInputEnumerator,
+                 com_initialize: Optional[Callable[[], None]] = _com_initialize,
+                 com_uninitialize: Optional[Callable[[], None]] = _com_uninitialize):
+        self.enumerator_factory = enumerator_factory
+        self.com_initialize = com_initialize
+        self.com_uninitialize = com_uninitialize
+        self.enumerations = 0  # Enumerações realmente executadas
+        self.abandoned = 0     # Threads abandonadas após estourar o prazo
+
+        # Cada thread tem a sua fila: uma thread abandonada não recebe mais pedidos
+        self._queue: "queue.Queue[Optional[Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._inflight: Optional[Future] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._run, args=(self._queue,),
+                                            name="directshow-worker", daemon=True)
+            self._thread.start()
+
+    def submit(self) -> Future:
+        """Pede uma enumeração (ou junta-se à que já está pendente)."""
+        with self._lock:
+            if self._inflight is None:
+                self._inflight = Future()
+                self._ensure_started()
+                self._queue.put(self._inflight)
+            return self._inflight
+
+    def enumerate(self, timeout: Optional[float] = DEFAULT_TIMEOUT) -> List[str]:
+        """
+        Retorna os nomes dos dispositivos de vídeo.
+
+        Raises:
+            ImportError: pygrabber/pywin32 não instalados
+            TimeoutError: a enumeração não terminou a tempo
+        """
+        return [name for name, _ in self.enumerate_devices(timeout)]
+
+    def enumerate_devices(self, timeout: Optional[float] = DEFAULT_TIMEOUT) -> List[Tuple[str, Optional[str]]]:
+        """
+        Retorna pares (nome, caminho do dispositivo) dos dispositivos de vídeo.
+        O caminho é None quando o enumerador não o informa.
+
+        Raises:
+            ImportError: pygrabber/pywin32 não instalados
+            TimeoutError: a enumeração não terminou a tempo
+        """
+        future = self.submit()
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            self._abandon(future)
+            raise
+
+    def _abandon(self, future: Future):
+        # A thread presa no pedido deixa de ser a do worker; None na fila dela
+        # a encerra quando (e se) o driver responder
+        with self._lock:
+            if self._inflight is not future:
+                return
+            self._inflight = None
+            stuck_queue, self._thread = self._queue, None
+            self.abandoned += 1
+        stuck_queue.put(None)
+
+    def _run(self, requests: "queue.Queue[Optional[Future]]"):
+        try:
+            if self.com_initialize is not None:
+                self.com_initialize()
+        except Exception as e:
+            self._fail_pending(e, requests)
+            return
+
+        # O enumerador pertence ao apartamento COM desta thread
+        enumerator = None
+        try:
+            while True:
+                future = requests.get()
+                if future is None:
+                    break
+                if not future.set_running_or_notify_cancel():
+                    with self._lock:
+                        if self._inflight is future:
+                            self._inflight = None
+                    continue
+                try:
+                    if enumerator is None:
+                        enumerator = self.enumerator_factory()
+                    result = [
+                        (device, None) if isinstance(device, str) else tuple(device)
+                        for device in enumerator.get_input_devices()
+                    ]
+                    error = None
+                except Exception as e:
+                    # Enumerador possivelmente inválido: recria no próximo pedido
+                    enumerator = None
+                    result, error = None, e
+                self.enumerations += 1
+
+                # Pedidos feitos a partir daqui iniciam uma nova enumeração
+                with self._lock:
+                    if self._inflight is future:
+                        self._inflight = None
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+        finally:
+            enumerator = None
+            if self.com_uninitialize is not None:
+                try:
+                    self.com_uninitialize()
+                except Exception:
+                    pass
+
+    def _fail_pending(self, error: Exception, requests: "queue.Queue[Optional[Future]]"):
+        # Sem COM não há como atender: falha o pedido pendente e esvazia a fila
+        with self._lock:
+            if self._queue is requests:
+                self._inflight = None
+                self._thread = None
+            while True:
+                try:
+                    future = requests.get_nowait()
+                except queue.Empty:
+                    break
+                if future is not None and future.set_running_or_notify_cancel():
+                    future.set_exception(error)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Encerra a thread (pedidos futuros iniciam uma nova)."""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+        self._thread = None
+
+
+_worker: Optional[DirectShowWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_directshow_worker() -> DirectShowWorker:
+    """Retorna o worker compartilhado (criado no primeiro uso)."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = DirectShowWorker()
+        return _worker
+
+
+def set_directshow_worker(worker: Optional[DirectShowWorker]):
+    """Substitui o worker compartilhado (None volta ao padrão no próximo uso)."""
+    global _worker
+    with _worker_lock:
+        if _worker is not None and _worker is not worker:
+            _worker.stop(timeout=1.0)
+        _worker = worker
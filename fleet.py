@@ -0,0 +1,240 @@
+"""
+Camera Spoofer - Renomeação em Frota
+Aplica um perfil de renomeação a um diretório de imagens offline (exportações
+.reg), uma imagem por processo. Cada imagem gera a exportação reescrita, o
+.reg com as diferenças, o backup e um arquivo de resultado; um resumo reúne
+todas as imagens.
+
+Funciona em qualquer sistema operacional (não usa winreg).
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+PathLike = Union[str, Path]
+
+# Estado de cada imagem
+IMAGE_OK = "ok"                    # Entradas reescritas
+IMAGE_NO_MATCH = "no_match"        # Nenhuma câmera do perfil na imagem
+IMAGE_UNSUPPORTED = "unsupported"  # Formato não suportado (hive binária)
+IMAGE_ERROR = "error"
+
+# Assinatura de um arquivo de hive binária (SYSTEM, SOFTWARE...)
+_HIVE_SIGNATURE = b"regf"
+
+SUMMARY_FILE = "fleet_summary.json"
+
+
+class FleetJob(NamedTuple):
+    """Trabalho de uma imagem (enviado ao processo)."""
+    image: str
+    out_dir: str
+    profile: Optional[Dict]       # RenameProfile.to_dict()
+    renames: Dict[str, str]       # Renomeações fixas (aplicadas além do perfil)
+    mount_map: Dict[str, str]
+
+
+class ImageResult(NamedTuple):
+    """Resultado de uma imagem."""
+    image: str
+    status: str
+    renames: Dict[str, str]
+    entries: int
+    elapsed_ms: float
+    outputs: Dict[str, str]
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return self._asdict()
+
+
+class FleetSummary(NamedTuple):
+    """Resumo de todas as imagens."""
+    results: List[ImageResult]
+    workers: int
+    elapsed_ms: float
+
+    def count(self, status: str) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def ok(self) -> bool:
+        return all(result.status in (IMAGE_OK, IMAGE_NO_MATCH) for result in self.results)
+
+    def to_dict(self) -> Dict:
+        return {
+            'images': len(self.results),
+            'counts': {status: self.count(status)
+                       for status in (IMAGE_OK, IMAGE_NO_MATCH, IMAGE_UNSUPPORTED, IMAGE_ERROR)},
+            'entries': sum(result.entries for result in self.results),
+            'workers': self.workers,
+            'elapsed_ms': round(self.elapsed_ms, 3),
+            'results': [result.to_dict() for result in self.results],
+        }
+
+
+def is_hive_file(path: PathLike) -> bool:
+    """Verifica se o arquivo é uma hive binária do registro."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(4) == _HIVE_SIGNATURE
+    except OSError:
+        return False
+
+
+def find_images(directory: PathLike) -> List[Path]:
+    """
+    Lista as imagens de um diretório (sem subdiretórios): exportações .reg e
+    hives binárias, em ordem alfabética.
+    """
+    images = []
+    for path in sorted(Path(directory).iterdir()):
+        if not path.is_file():
+            continue
+        if path.suffix.lower() == '.reg' or is_hive_file(path):
+            images.append(path)
+    return images
+
+
+def image_outputs(image: PathLike, out_dir: PathLike) -> Dict[str, str]:
+    """Arquivos gerados para uma imagem."""
+    stem = Path(image).stem
+    out_dir = Path(out_dir)
+    return {
+        'out': str(out_dir / f"{stem}.reg"),
+        'delta': str(out_dir / f"{stem}.delta.reg"),
+        'backup': str(out_dir / f"{stem}.backup.json"),
+        'result': str(out_dir / f"{stem}.result.json"),
+    }
+
+
+def process_image(job: FleetJob) -> ImageResult:
+    """
+    Processa uma imagem: resolve o perfil com os FriendlyName da imagem,
+    reescreve a exportação e grava o delta, o backup e o resultado.
+    """
+    from reg_export import RegExportRewriter, collect_friendly_names, write_backup_file
+    from rename_profile import RenameProfile
+
+    start = time.perf_counter()
+    outputs = image_outputs(job.image, job.out_dir)
+    produced = {'result': outputs['result']}
+    renames: Dict[str, str] = {}
+    entries = 0
+    error = None
+    try:
+        if is_hive_file(job.image):
+            status = IMAGE_UNSUPPORTED
+            error = "Hive binária: exporte com 'reg export' ou 'regedit /e' para um .reg"
+        else:
+            renames = dict(job.renames)
+            if job.profile is not None:
+                profile = RenameProfile.from_dict(job.profile)
+                renames.update(profile.resolve(collect_friendly_names(job.image, job.mount_map)))
+
+            matched = {}
+            if renames:
+                matched = RegExportRewriter(renames, job.mount_map).rewrite(
+                    job.image, outputs['out'], outputs['delta'])
+            if matched:
+                write_backup_file(matched, outputs['backup'])
+                entries = sum(len(found) for found in matched.values())
+                produced.update({key: outputs[key] for key in ('out', 'delta', 'backup')})
+                status = IMAGE_OK
+            else:
+                # Nada reescrito: não deixa cópias iguais à imagem original
+                for key in ('out', 'delta'):
+                    if os.path.exists(outputs[key]):
+                        os.remove(outputs[key])
+                status = IMAGE_NO_MATCH
+    except Exception as e:
+        status = IMAGE_ERROR
+        error = str(e) or type(e).__name__
+
+    result = ImageResult(job.image, status, renames, entries,
+                         round((time.perf_counter() - start) * 1000, 3), produced, error)
+    with open(outputs['result'], 'w', encoding='utf-8') as f:
+        json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
+    return result
+
+
+def run_fleet(directory: PathLike, out_dir: PathLike,
+              profile: Optional[Dict] = None,
+              renames: Optional[Dict[str, str]] = None,
+              mount_map: Optional[Dict[str, str]] = None,
+              workers: Optional[int] = None,
+              on_result: Optional[Callable[[ImageResult, int, int], None]] = None) -> FleetSummary:
+    """
+    Processa todas as imagens de um diretório em um pool de processos.
+
+    Args:
+        directory: Diretório com as imagens
+        out_dir: Diretório de saída (criado se necessário)
+        profile: Perfil de renomeação (RenameProfile.to_dict())
+        renames: Renomeações fixas, aplicadas além do perfil
+        mount_map: Prefixos de hives montadas para o caminho real (veja reg_export)
+        workers: Número de processos (padrão: número de CPUs; 1 processa no
+            próprio processo)
+        on_result: Chamada a cada imagem concluída com (resultado, concluídas, total)
+
+    Returns:
+        FleetSummary (também gravado em SUMMARY_FILE no diretório de saída)
+
+    Raises:
+        ValueError: saída igual ao diretório das imagens, ou imagens cujos
+            nomes sem extensão coincidem
+    """
+    start = time.perf_counter()
+    out_dir = Path(out_dir)
+    if out_dir.resolve() == Path(directory).resolve():
+        # As exportações reescritas têm o mesmo nome das imagens
+        raise ValueError("O diretório de saída deve ser diferente do diretório das imagens.")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    images = find_images(directory)
+    # Os arquivos de saída usam o nome sem extensão (e o Windows não diferencia
+    # maiúsculas): "a.reg" e "a.REG", ou a hive "SYSTEM" e "SYSTEM.reg", se sobrescreveriam
+    by_stem: Dict[str, List[str]] = {}
+    for image in images:
+        by_stem.setdefault(image.stem.casefold(), []).append(image.name)
+    collisions = [names for names in by_stem.values() if len(names) > 1]
+    if collisions:
+        raise ValueError("Imagens com o mesmo nome gerariam os mesmos arquivos de saída: "
+                         + "; ".join(", ".join(names) for names in collisions))
+
+    jobs = [FleetJob(str(image), str(out_dir), profile, dict(renames or {}), dict(mount_map or {}))
+            for image in images]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+
+    results: Dict[str, ImageResult] = {}
+
+    def finished(result: ImageResult):
+        results[result.image] = result
+        if on_result is not None:
+            on_result(result, len(results), len(jobs))
+
+    if workers <= 1:
+        for job in jobs:
+            finished(process_image(job))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(process_image, job): job for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Processo encerrado de forma anormal
+                    job = futures[future]
+                    result = ImageResult(job.image, IMAGE_ERROR, {}, 0, 0.0, {}, str(e) or type(e).__name__)
+                finished(result)
+
+    summary = FleetSummary([results[job.image] for job in jobs], workers,
+                           (time.perf_counter() - start) * 1000)
+    with open(out_dir / SUMMARY_FILE, 'w', encoding='utf-8') as f:
+        json.dump(summary.to_dict(), f, indent=2, ensure_ascii=False)
+    return summary
@@ -0,0 +1,660 @@
+"""
+Camera Spoofer - Interface Gráfica
+Janela principal para renomear câmeras virtuais com nomes de câmeras reais.
+"""
+
+import customtkinter as ctk
+from tkinter import messagebox
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from admin_utils import is_admin
+from camera_catalog import Typeahead, get_catalog_index
+from camera_list import CameraListView, camera_key
+import camera_utils
+from camera_utils import (
+    get_all_cameras, 
+    rename_camera_in_registry, 
+    restore_camera_name,
+    get_backed_up_cameras,
+    invalidate_registry_index
+)
+from name_suggestions import SuggestionIndex, get_suggestion_index
+from operation_stats import OperationStats
+from registry_watcher import RegistryWatcher
+from real_cameras import (
+    get_all_real_camera_names, 
+    get_real_cameras_by_brand,
+    is_virtual_camera,
+    get_suggested_name
+)
+
+
+# Sugestões de nome mostradas no topo da lista para a câmera selecionada
+SUGGESTIONS_SHOWN = 5
+
+
+# Configuração do tema
+ctk.set_appearance_mode("dark")
+ctk.set_default_color_theme("blue")
+
+
+class CameraSpoofApp(ctk.CTk):
+    """Aplicativo principal para renomear câmeras virtuais."""
+    
+    def __init__(self):
+        super().__init__()
+        
+        # Configuração da janela
+        self.title("📷 Camera Spoofer")
+        self.geometry("780x920")
+        self.minsize(750, 850)
+        
+        # Dados
+        self.cameras = []
+        self.selected_camera = None
+        
+        # Operação em andamento (renomear/restaurar) executada em segundo plano
+        self._operation_cancel: Optional[threading.Event] = None
+        
+        # Paleta de cores premium (roxo/ciano gradiente)
+        self.colors = {
+            'bg': '#0f0f1a',           # Fundo muito escuro
+            'card': '#1a1a2e',          # Cards
+            'card_hover': '#252542',    # Card hover
+            'accent': '#6366f1',        # Roxo vibrante (indigo)
+            'accent_light': '#818cf8',  # Roxo claro
+            'success': '#10b981',       # Verde esmeralda
+            'success_hover': '#059669', # Verde escuro
+            'warning': '#f59e0b',       # Âmbar
+            'danger': '#ef4444',        # Vermelho
+            'text': '#f8fafc',          # Texto branco
+            'text_muted': '#94a3b8',    # Texto cinza
+            'border': '#334155',        # Bordas
+            'gradient_start': '#6366f1', # Roxo
+            'gradient_end': '#06b6d4',   # Ciano
+        }
+        
+        self.configure(fg_color=self.colors['bg'])
+        
+        # Fontes compartilhadas pelas linhas da lista (criadas uma única vez)
+        self.fonts = {
+            'row_name': ctk.CTkFont(size=13, weight="bold"),
+            'row_button': ctk.CTkFont(size=12, weight="bold"),
+            'message': ctk.CTkFont(size=14),
+        }
+        
+        # Cria interface
+        self._create_widgets()
+        
+        # Carrega câmeras
+        self.after(100, self._load_cameras_async)
+        
+        # Carrega o catálogo de câmeras reais usado na busca do nome
+        self._load_catalog_async()
+        
+        # Monitora o registro e atualiza a lista quando câmeras mudam. Com o
+        # monitor mantendo o índice em dia, as buscas passam a usá-lo
+        camera_utils.USE_REGISTRY_INDEX = True
+        self._watcher = RegistryWatcher(
+            on_change=lambda changes, cameras: self.after(0, self._apply_watched_cameras, cameras),
+            load=get_all_cameras,
+        )
+        self._watcher.start()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+    
+    def _create_widgets(self):
+        """Cria todos os widgets da interface."""
+        
+        # Container principal
+        main_frame = ctk.CTkFrame(self, fg_color="transparent")
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        # Header com visual premium
+        title_frame = ctk.CTkFrame(main_frame, fg_color=self.colors['card'], corner_radius=20, border_width=1, border_color=self.colors['border'])
+        title_frame.pack(fill="x", pady=(0, 12))
+        
+        # Container interno do header
+        header_inner = ctk.CTkFrame(title_frame, fg_color="transparent")
+        header_inner.pack(fill="x", padx=20, pady=15)
+        
+        # Título principal com estilo
+        title_label = ctk.CTkLabel(
+            header_inner,
+            text="🎭 Camera Spoofer",
+            font=ctk.CTkFont(family="Segoe UI", size=32, weight="bold"),
+            text_color=self.colors['text']
+        )
+        title_label.pack()
+        
+        # Linha decorativa (simula gradiente)
+        accent_line = ctk.CTkFrame(header_inner, fg_color=self.colors['accent'], height=3, corner_radius=2)
+        accent_line.pack(fill="x", pady=(8, 8), padx=100)
+        
+        subtitle = ctk.CTkLabel(
+            header_inner,
+            text="Gerencie os nomes das suas câmeras com facilidade",
+            font=ctk.CTkFont(size=13),
+            text_color=self.colors['text_muted']
+        )
+        subtitle.pack()
+        
+        # Status de admin
+        admin_status = "✅ Administrador" if is_admin() else "⚠️ Sem privilégios de Admin"
+        admin_color = self.colors['success'] if is_admin() else self.colors['warning']
+        
+        self.admin_label = ctk.CTkLabel(
+            header_inner,
+            text=admin_status,
+            font=ctk.CTkFont(size=12),
+            text_color=admin_color
+        )
+        self.admin_label.pack(pady=(8, 0))
+        
+        # Seção de câmeras detectadas
+        cameras_frame = ctk.CTkFrame(main_frame, fg_color=self.colors['card'], corner_radius=16, border_width=1, border_color=self.colors['border'])
+        cameras_frame.pack(fill="both", expand=True, pady=(0, 12))
+        
+        cameras_label = ctk.CTkLabel(
+            cameras_frame,
+            text="Câmeras Detectadas",
+            font=ctk.CTkFont(size=15, weight="bold"),
+            text_color=self.colors['text']
+        )
+        cameras_label.pack(pady=(12, 8), padx=15, anchor="w")
+        
+        # Lista de câmeras (virtualizada: só as linhas visíveis são criadas)
+        self.camera_list = CameraListView(
+            cameras_frame,
+            colors=self.colors,
+            fonts=self.fonts,
+            on_select=self._select_camera,
+            height=160
+        )
+        self.camera_list.pack(fill="both", expand=True, padx=12, pady=(0, 8))
+        
+        # Botão de atualizar com estilo
+        refresh_btn = ctk.CTkButton(
+            cameras_frame,
+            text="↻  Atualizar Lista",
+            command=self._refresh_cameras,
+            fg_color=self.colors['accent'],
+            hover_color=self.colors['accent_light'],
+            height=32,
+            corner_radius=8,
+            font=ctk.CTkFont(size=12)
+        )
+        refresh_btn.pack(pady=(0, 10))
+        
+        # Seção de renomeação
+        rename_frame = ctk.CTkFrame(main_frame, fg_color=self.colors['card'], corner_radius=16, border_width=1, border_color=self.colors['border'])
+        rename_frame.pack(fill="x", pady=(0, 12))
+        
+        rename_label = ctk.CTkLabel(
+            rename_frame,
+            text="📝  Renomear Câmera",
+            font=ctk.CTkFont(size=15, weight="bold"),
+            text_color=self.colors['text']
+        )
+        rename_label.pack(pady=(12, 8), padx=15, anchor="w")
+        
+        # Dropdown para novo nome
+        new_name_frame = ctk.CTkFrame(rename_frame, fg_color="transparent")
+        new_name_frame.pack(fill="x", padx=15, pady=(0, 8))
+        
+        new_name_label = ctk.CTkLabel(
+            new_name_frame,
+            text="Selecione um nome de câmera real:",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            text_color=self.colors['text_muted']
+        )
+        new_name_label.pack(anchor="w", pady=(0, 4))
+        
+        # Combobox com nomes de câmeras reais
+        self.real_camera_var = ctk.StringVar(value=get_suggested_name())
+        self.real_camera_combo = ctk.CTkComboBox(
+            new_name_frame,
+            values=get_all_real_camera_names(),
+            variable=self.real_camera_var,
+            width=400,
+            height=38,
+            corner_radius=10,
+            fg_color=self.colors['bg'],
+            border_color=self.colors['border'],
+            button_color=self.colors['accent'],
+            button_hover_color=self.colors['accent_light'],
+            dropdown_fg_color=self.colors['card'],
+            dropdown_hover_color=self.colors['accent'],
+            font=ctk.CTkFont(size=13)
+        )
+        self.real_camera_combo.pack(fill="x", pady=(0, 10))
+        
+        # Busca incremental no catálogo enquanto o nome é digitado e sugestões
+        # de nome de cada câmera (chave da câmera -> nomes)
+        self._typeahead: Optional[Typeahead] = None
+        self._suggestion_index: Optional[SuggestionIndex] = None
+        self._suggestions: Dict[str, List[str]] = {}
+        self.real_camera_combo.bind("<KeyRelease>", self._on_camera_name_typed)
+        
+        # Card para opção de nome personalizado
+        custom_card = ctk.CTkFrame(new_name_frame, fg_color=self.colors['bg'], corner_radius=10)
+        custom_card.pack(fill="x", pady=(0, 5))
+        
+        custom_inner = ctk.CTkFrame(custom_card, fg_color="transparent")
+        custom_inner.pack(fill="x", padx=12, pady=10)
+        
+        # Checkbox para usar nome personalizado
+        self.use_custom_var = ctk.BooleanVar(value=False)
+        self.custom_check = ctk.CTkCheckBox(
+            custom_inner,
+            text="  Usar nome personalizado",
+            variable=self.use_custom_var,
+            command=self._toggle_custom_name,
+            font=ctk.CTkFont(size=12),
+            fg_color=self.colors['accent'],
+            hover_color=self.colors['accent_light'],
+            border_color=self.colors['border'],
+            checkmark_color=self.colors['text']
+        )
+        self.custom_check.pack(anchor="w", pady=(0, 8))
+        
+        # Campo de entrada para nome personalizado
+        self.custom_name_var = ctk.StringVar(value="")
+        self.custom_name_entry = ctk.CTkEntry(
+            custom_inner,
+            textvariable=self.custom_name_var,
+            placeholder_text="Digite qualquer nome aqui...",
+            height=38,
+            corner_radius=10,
+            fg_color=self.colors['card'],
+            border_color=self.colors['border'],
+            font=ctk.CTkFont(size=13),
+            state="disabled"
+        )
+        self.custom_name_entry.pack(fill="x")
+        
+        # Botões de ação
+        buttons_frame = ctk.CTkFrame(rename_frame, fg_color="transparent")
+        buttons_frame.pack(fill="x", padx=15, pady=15)
+        
+        self.rename_btn = ctk.CTkButton(
+            buttons_frame,
+            text="✔  Renomear Selecionada",
+            command=self._rename_camera,
+            fg_color=self.colors['success'],
+            hover_color=self.colors['success_hover'],
+            height=42,
+            corner_radius=10,
+            font=ctk.CTkFont(size=13, weight="bold"),
+            state="disabled"
+        )
+        self.rename_btn.pack(side="left", expand=True, fill="x", padx=(0, 6))
+        
+        self.restore_btn = ctk.CTkButton(
+            buttons_frame,
+            text="↩  Restaurar Original",
+            command=self._restore_camera,
+            fg_color="transparent",
+            hover_color=self.colors['card_hover'],
+            border_width=2,
+            border_color=self.colors['accent'],
+            text_color=self.colors['accent_light'],
+            height=42,
+            corner_radius=10,
+            font=ctk.CTkFont(size=13, weight="bold"),
+            state="disabled"
+        )
+        self.restore_btn.pack(side="left", expand=True, fill="x", padx=(6, 0))
+        
+        # Status bar
+        self.status_frame = ctk.CTkFrame(main_frame, fg_color=self.colors['card'], corner_radius=12, border_width=1, border_color=self.colors['border'])
+        self.status_frame.pack(fill="x")
+        
+        self.status_label = ctk.CTkLabel(
+            self.status_frame,
+            text="💡 Selecione uma câmera para renomear",
+            font=ctk.CTkFont(size=12),
+            text_color=self.colors['text_muted']
+        )
+        self.status_label.pack(pady=(8, 0))
+        
+        # Progresso e cancelamento da operação em andamento (ocultos quando ociosos)
+        self.progress_frame = ctk.CTkFrame(self.status_frame, fg_color="transparent")
+        
+        self.progress_bar = ctk.CTkProgressBar(
+            self.progress_frame,
+            height=8,
+            progress_color=self.colors['accent'],
+            fg_color=self.colors['border']
+        )
+        self.progress_bar.pack(side="left", expand=True, fill="x", padx=(0, 10))
+        
+        self.cancel_btn = ctk.CTkButton(
+            self.progress_frame,
+            text="Cancelar",
+            command=self._cancel_operation,
+            width=90,
+            height=26,
+            fg_color="transparent",
+            hover_color=self.colors['card_hover'],
+            border_width=1,
+            border_color=self.colors['danger'],
+            text_color=self.colors['danger'],
+            corner_radius=8,
+            font=ctk.CTkFont(size=11, weight="bold")
+        )
+        self.cancel_btn.pack(side="right")
+        
+        # Contadores e tempos da última renomeação/restauração
+        self.stats_label = ctk.CTkLabel(
+            self.status_frame,
+            text="",
+            font=ctk.CTkFont(size=10),
+            text_color=self.colors['text_muted']
+        )
+        self.stats_label.pack(pady=(0, 6))
+    
+    def _load_cameras_async(self):
+        """Carrega câmeras em thread separada."""
+        # Mostra status de carregando na barra de status
+        self._update_status("🔍 Buscando câmeras...", "info")
+        
+        # A lista atual continua visível até a nova chegar (sem piscar)
+        if not self.cameras:
+            self.camera_list.show_message("⏳ Carregando...")
+        
+        def load():
+            self.cameras = get_all_cameras()
+            try:
+                self.after(0, self._update_cameras_list)
+            except Exception:
+                pass
+        
+        thread = threading.Thread(target=load, daemon=True)
+        thread.start()
+    
+    def _load_catalog_async(self):
+        """Carrega o catálogo e os índices de busca e de sugestões em thread separada."""
+        def load():
+            typeahead = Typeahead(get_catalog_index())
+            suggestion_index = get_suggestion_index()
+            try:
+                self.after(0, self._set_catalog, typeahead, suggestion_index)
+            except Exception:
+                pass
+        
+        thread = threading.Thread(target=load, daemon=True)
+        thread.start()
+    
+    def _set_catalog(self, typeahead: Typeahead, suggestion_index: SuggestionIndex):
+        """Recebe os índices do catálogo carregados em segundo plano."""
+        self._typeahead = typeahead
+        self._suggestion_index = suggestion_index
+        self._update_suggestions()
+    
+    def _update_suggestions(self):
+        """Calcula as sugestões de nome de todas as câmeras da lista de uma vez."""
+        if self._suggestion_index is None:
+            return
+        batch = self._suggestion_index.suggest_many(self.cameras, SUGGESTIONS_SHOWN)
+        self._suggestions = {
+            camera_key(camera): [suggestion.name for suggestion in suggestions]
+            for camera, suggestions in zip(self.cameras, batch)
+        }
+    
+    def _on_camera_name_typed(self, event=None):
+        """Troca as opções do combobox pelas sugestões do catálogo para o texto digitado."""
+        if self._typeahead is None:
+            return
+        if event is not None and event.keysym in ('Up', 'Down', 'Return', 'Escape', 'Tab'):
+            return
+        text = self.real_camera_var.get()
+        values = self._typeahead.update(text) if text.strip() else get_all_real_camera_names()
+        self.real_camera_combo.configure(values=values)
+    
+    def _refresh_cameras(self):
+        """Atualiza a lista a pedido do usuário, descartando o índice do registro."""
+        invalidate_registry_index()
+        self._load_cameras_async()
+    
+    def _apply_watched_cameras(self, cameras: list):
+        """Recebe a lista recarregada pelo monitor do registro."""
+        self.cameras = cameras
+        self._update_cameras_list()
+    
+    def _on_close(self):
+        """Interrompe o monitor do registro e fecha a janela."""
+        self._watcher.stop(timeout=1.0)
+        self.destroy()
+    
+    def _update_cameras_list(self):
+        """Atualiza a lista de câmeras na interface (apenas as linhas que mudaram)."""
+        if not self.cameras:
+            self.camera_list.show_message(
+                "❌ Nenhuma câmera encontrada\n\n💡 Dica: Abra o OBS e clique em\n'Ferramentas → Iniciar Câmera Virtual'"
+            )
+            self._update_status("Nenhuma câmera detectada no sistema", "warning")
+            return
+        
+        self.camera_list.set_cameras(self.cameras)
+        self._update_suggestions()
+        
+        # Verifica backups e habilita botão de restaurar
+        self._check_and_enable_restore()
+        
+        self._update_status(f"✅ {len(self.cameras)} câmeras encontradas - Clique em 'Selecionar' para renomear", "success")
+    
+    def _select_camera(self, camera: dict):
+        """Seleciona uma câmera para renomeação."""
+        self.selected_camera = camera
+        self.rename_btn.configure(state="normal")
+        
+        # Sugestões da câmera primeiro, depois as câmeras populares
+        suggestions = self._suggestions.get(camera_key(camera))
+        if suggestions:
+            popular = [name for name in get_all_real_camera_names() if name not in suggestions]
+            self.real_camera_combo.configure(values=suggestions + popular)
+            self.real_camera_var.set(suggestions[0])
+        self._update_status(f"📷 Selecionada: {camera['name']}", "info")
+    
+    def _rename_camera(self):
+        """Renomeia a câmera selecionada."""
+        if not self.selected_camera:
+            messagebox.showwarning("Aviso", "Selecione uma câmera primeiro!")
+            return
+        
+        # Obtém o nome (personalizado ou da lista)
+        if self.use_custom_var.get():
+            new_name = self.custom_name_var.get().strip()
+            if not new_name:
+                messagebox.showwarning("Aviso", "Digite um nome personalizado!")
+                return
+        else:
+            new_name = self.real_camera_var.get()
+            if not new_name:
+                messagebox.showwarning("Aviso", "Escolha um nome de câmera!")
+                return
+        
+        old_name = self.selected_camera['name']
+        
+        # Confirmação
+        if not messagebox.askyesno(
+            "Confirmar Renomeação",
+            f"Renomear:\n\n'{old_name}'\n\npara:\n\n'{new_name}'\n\n"
+            "Um backup será criado automaticamente."
+        ):
+            return
+        
+        def on_done(success: bool, message: str):
+            if success:
+                self._update_status(f"✅ {message}", "success")
+                messagebox.showinfo("Sucesso", message + "\n\nReinicie os aplicativos para ver a mudança.")
+                self._load_cameras_async()
+            else:
+                self._update_status(f"❌ {message}", "error")
+                messagebox.showerror("Erro", message)
+        
+        self._run_operation(
+            "⏳ Renomeando câmera",
+            lambda stats, cancel: rename_camera_in_registry(old_name, new_name, cancel_event=cancel, stats=stats),
+            on_done,
+        )
+    
+    def _restore_camera(self):
+        """Restaura o nome original de uma câmera."""
+        backed_up = get_backed_up_cameras()
+        
+        if not backed_up:
+            messagebox.showinfo("Info", "Nenhum backup encontrado.")
+            return
+        
+        # Mostra lista de backups para restaurar
+        restore_window = ctk.CTkToplevel(self)
+        restore_window.title("Restaurar Câmera")
+        restore_window.geometry("400x300")
+        restore_window.configure(fg_color=self.colors['bg'])
+        restore_window.transient(self)
+        restore_window.grab_set()
+        
+        label = ctk.CTkLabel(
+            restore_window,
+            text="Selecione uma câmera para restaurar:",
+            font=ctk.CTkFont(size=14)
+        )
+        label.pack(pady=15)
+        
+        listbox = ctk.CTkScrollableFrame(
+            restore_window,
+            fg_color=self.colors['card'],
+            corner_radius=10
+        )
+        listbox.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        
+        for camera_name in backed_up:
+            btn = ctk.CTkButton(
+                listbox,
+                text=camera_name,
+                fg_color=self.colors['accent'],
+                hover_color="#1a4a7a",
+                command=lambda n=camera_name, w=restore_window: self._do_restore(n, w)
+            )
+            btn.pack(fill="x", pady=3)
+    
+    def _do_restore(self, camera_name: str, window):
+        """Executa a restauração de uma câmera."""
+        window.destroy()
+        
+        def on_done(success: bool, message: str):
+            if success:
+                self._update_status(f"✅ {message}", "success")
+                messagebox.showinfo("Sucesso", message)
+                self._load_cameras_async()
+            else:
+                self._update_status(f"❌ {message}", "error")
+                messagebox.showerror("Erro", message)
+        
+        # A restauração não percorre o registro: só há escritas, que não são canceladas
+        self._run_operation(
+            "⏳ Restaurando nome original",
+            lambda stats, cancel: restore_camera_name(camera_name, stats=stats),
+            on_done,
+            cancellable=False,
+        )
+    
+    def _run_operation(self, title: str,
+                       operation: Callable[[OperationStats, threading.Event], Tuple[bool, str]],
+                       on_done: Callable[[bool, str], None], cancellable: bool = True):
+        """
+        Executa uma operação no registro em uma thread, mostrando o progresso.
+        
+        Args:
+            title: Texto da barra de status durante a operação
+            operation: Função (stats, evento de cancelamento) -> (sucesso, mensagem)
+            on_done: Chamada na thread da interface com o resultado
+            cancellable: Mostra o botão Cancelar enquanto o registro é percorrido
+        """
+        stats = OperationStats()
+        cancel_event = threading.Event()
+        result = []
+        
+        def work():
+            result.append(operation(stats, cancel_event))
+        
+        self._operation_cancel = cancel_event
+        self.rename_btn.configure(state="disabled")
+        self.restore_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="normal" if cancellable else "disabled", text="Cancelar")
+        self.progress_bar.configure(mode="indeterminate")
+        self.progress_bar.start()
+        self.progress_frame.pack(fill="x", padx=15, pady=(6, 0), before=self.stats_label)
+        self._update_status(f"{title}...", "info")
+        
+        thread = threading.Thread(target=work, daemon=True)
+        thread.start()
+        self.after(100, self._poll_operation, thread, title, stats, result, on_done)
+    
+    def _poll_operation(self, thread: threading.Thread, title: str, stats: OperationStats,
+                        result: list, on_done: Callable[[bool, str], None]):
+        """Atualiza o progresso a partir dos contadores até a operação terminar."""
+        if thread.is_alive():
+            if stats.matches:
+                # Entradas encontradas: o progresso passa a ser a fração já escrita
+                if self.progress_bar.cget("mode") != "determinate":
+                    self.progress_bar.stop()
+                    self.progress_bar.configure(mode="determinate")
+                    # Depois da busca não há mais como cancelar sem deixar escritas pela metade
+                    self.cancel_btn.configure(state="disabled")
+                self.progress_bar.set(min(stats.writes / stats.matches, 1.0))
+            self._update_status(
+                f"{title}... {stats.keys_opened} chaves lidas · {stats.matches} encontradas · "
+                f"{stats.writes} escritas", "info")
+            self.after(100, self._poll_operation, thread, title, stats, result, on_done)
+            return
+        
+        self.progress_bar.stop()
+        self.progress_frame.pack_forget()
+        self._operation_cancel = None
+        self._show_stats(stats)
+        if self.selected_camera:
+            self.rename_btn.configure(state="normal")
+        self._check_and_enable_restore()
+        
+        success, message = result[0] if result else (False, "A operação terminou sem resultado.")
+        on_done(success, message)
+    
+    def _cancel_operation(self):
+        """Pede o cancelamento da busca em andamento (antes de qualquer escrita)."""
+        if self._operation_cancel is not None:
+            self._operation_cancel.set()
+            self.cancel_btn.configure(state="disabled", text="Cancelando...")
+    
+    def _update_status(self, message: str, status_type: str = "info"):
+        """Atualiza a barra de status."""
+        colors = {
+            "info": "#888888",
+            "success": self.colors['success'],
+            "warning": self.colors['warning'],
+            "error": self.colors['danger']
+        }
+        self.status_label.configure(text=message, text_color=colors.get(status_type, "#888888"))
+    
+    def _show_stats(self, stats: OperationStats):
+        """Mostra os contadores da última operação abaixo da barra de status."""
+        self.stats_label.configure(text=f"📊 {stats.summary()}")
+    
+    def _toggle_custom_name(self):
+        """Alterna entre modo preset e modo personalizado."""
+        if self.use_custom_var.get():
+            self.custom_name_entry.configure(state="normal")
+            self.real_camera_combo.configure(state="disabled")
+        else:
+            self.custom_name_entry.configure(state="disabled")
+            self.real_camera_combo.configure(state="normal")
+    
+    def _check_and_enable_restore(self):
+        """Verifica se existem backups e habilita o botão de restaurar."""
+        backed_up = get_backed_up_cameras()
+        if backed_up:
+            self.restore_btn.configure(state="normal")
+        else:
+            self.restore_btn.configure(state="disabled")
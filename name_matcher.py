@@ -0,0 +1,84 @@
+"""
+Camera Spoofer - Busca de Múltiplos Nomes
+Autômato Aho-Corasick para encontrar vários nomes em um texto com uma única passada.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+from registry_index import fold_text
+
+
+class NameMatcher:
+    """
+    Autômato compilado que verifica quais padrões aparecem como substring de um texto.
+    A comparação não diferencia maiúsculas de minúsculas.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = list(patterns)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in fold_text(pattern):
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # Calcula os links de falha em largura
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def match_indices(self, text: str, folded: bool = False) -> Set[int]:
+        """
+        Retorna os índices dos padrões contidos no texto.
+
+        Args:
+            text: Texto a verificar
+            folded: True se o texto já foi normalizado com fold_text
+        """
+        if not folded:
+            text = fold_text(text)
+
+        found = set(self._output[0])
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def matches(self, text: str) -> List[str]:
+        """Retorna os padrões contidos no texto, na ordem em que foram informados."""
+        return [self.patterns[i] for i in sorted(self.match_indices(text))]
+
+    def first_match(self, text: str) -> int:
+        """Retorna o índice do primeiro padrão (na ordem informada) contido no texto, ou -1."""
+        found = self.match_indices(text)
+        return min(found) if found else -1
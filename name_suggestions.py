@@ -0,0 +1,379 @@
+"""
+Camera Spoofer - Sugestões de Nomes
+Sugere nomes do catálogo de câmeras reais para cada câmera detectada,
+ordenados pela semelhança (n-gramas de caracteres) com o nome atual e por
+dicas de fabricante, VID/PID USB e resolução. O índice de n-gramas é
+construído uma vez por catálogo e guardado em disco.
+"""
+
+import base64
+import gzip
+import heapq
+import json
+import re
+import sys
+import threading
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from camera_catalog import CameraCatalog, get_catalog
+from registry_index import fold_text
+
+PathLike = Union[str, Path]
+
+# Tamanho dos n-gramas de caracteres
+NGRAM_SIZE = 3
+
+# Cache do índice, ao lado do arquivo de backup
+CACHE_FILE = "name_suggestions.cache.gz"
+CACHE_VERSION = 1
+
+# Sugestões por câmera
+DEFAULT_TOP_K = 5
+
+# Pesos somados à semelhança de n-gramas (0 a 1)
+VENDOR_WEIGHT = 0.3          # Fabricante citado no nome atual
+USB_VENDOR_WEIGHT = 0.4      # Mesmo VID do dispositivo
+USB_MODEL_WEIGHT = 1.0       # Mesmo VID e PID do dispositivo
+RESOLUTION_WEIGHT = 0.2      # Mesma classe de resolução
+POPULAR_WEIGHT = 0.05        # Câmeras populares (real_cameras.REAL_CAMERA_NAMES), pela ordem
+
+# Candidatos por semelhança de n-gramas (e por fabricante) reavaliados com as dicas
+_CANDIDATES = 32
+
+# Máximo de entradas das listas de n-gramas somadas por consulta
+_POSTING_BUDGET = 2048
+
+# Quando o orçamento corta n-gramas comuns, a semelhança dos melhores
+# _RESCORE_FACTOR * k + _CANDIDATES // 8 candidatos é recalculada com todos
+_RESCORE_FACTOR = 4
+
+# Classes de resolução, da maior para a menor (a primeira encontrada no nome vale)
+RESOLUTION_CLASSES = [
+    ("4k", re.compile(r"\b(4k|uhd|2160p)\b")),
+    ("2k", re.compile(r"\b(2k|qhd|1440p)\b")),
+    ("1080p", re.compile(r"\b(1080p?|fhd|full hd)\b")),
+    ("720p", re.compile(r"\b(720p|hd)\b")),
+    ("vga", re.compile(r"\b(vga|480p)\b")),
+]
+
+# Código de cada classe nos arrays do índice (0: nenhuma)
+_RESOLUTION_IDS = {resolution: code for code, (resolution, _) in enumerate(RESOLUTION_CLASSES, 1)}
+
+_USB_ID = re.compile(r"vid_([0-9a-f]{4})&pid_([0-9a-f]{4})", re.IGNORECASE)
+_WORD = re.compile(r"[^\W_]+")
+
+
+class Suggestion(NamedTuple):
+    """Um nome sugerido e os motivos da pontuação."""
+    name: str
+    vendor: str
+    score: float
+    reasons: Tuple[str, ...]  # "ngram", "vendor", "usb_vendor", "usb_model", "resolution", "popular"
+
+    def to_dict(self) -> Dict:
+        data = self._asdict()
+        data['score'] = round(self.score, 4)
+        data['reasons'] = list(self.reasons)
+        return data
+
+
+def _ngrams(folded: str) -> Set[str]:
+    padded = f" {folded} "
+    return {padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+def resolution_class(name: str) -> Optional[str]:
+    """Classe de resolução citada em um nome ("4k", "2k", "1080p", "720p", "vga") ou None."""
+    folded = fold_text(name)
+    for resolution, pattern in RESOLUTION_CLASSES:
+        if pattern.search(folded):
+            return resolution
+    return None
+
+
+def usb_ids(device_path: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """VID e PID de um caminho de dispositivo USB ("...vid_046d&pid_082d..."), ou (None, None)."""
+    match = _USB_ID.search(device_path or "")
+    if match is None:
+        return None, None
+    return int(match.group(1), 16), int(match.group(2), 16)
+
+
+def _encode(values: array) -> str:
+    return base64.b64encode(values.tobytes()).decode('ascii')
+
+
+def _decode(typecode: str, text: str, swap: bool) -> array:
+    values = array(typecode)
+    values.frombytes(base64.b64decode(text))
+    if swap:
+        values.byteswap()
+    return values
+
+
+class SuggestionIndex:
+    """
+    Índice de n-gramas dos nomes do catálogo.
+
+    Cada consulta soma as listas de modelos dos n-gramas do nome atual,
+    reavalia os modelos com mais n-gramas em comum (mais os do fabricante e
+    do VID/PID informados e os populares) com as dicas e retorna os melhores.
+    """
+
+    def __init__(self, catalog: CameraCatalog, postings: Optional[Dict[str, array]] = None,
+                 gram_counts: Optional[array] = None, resolutions: Optional[array] = None):
+        self.catalog = catalog
+        if postings is None:
+            postings, gram_counts, resolutions = self._build(catalog)
+        self._postings = postings
+        self._gram_counts = gram_counts
+        self._resolutions = resolutions
+
+        # Dicas: fabricante pelas palavras do nome, modelos por fabricante e por VID
+        self._vendor_words: Dict[str, List[Tuple[Tuple[str, ...], int]]] = {}
+        for vendor_id, vendor in enumerate(catalog.vendors):
+            words = tuple(_WORD.findall(fold_text(vendor)))
+            if words:
+                self._vendor_words.setdefault(words[0], []).append((words, vendor_id))
+        vendor_ids = {vendor: vendor_id for vendor_id, vendor in enumerate(catalog.vendors)}
+        self._vendor_of = array('H')
+        self._by_vendor: Dict[int, List[int]] = {}
+        self._by_vid: Dict[int, List[int]] = {}
+        for index, model in enumerate(catalog):
+            vendor_id = vendor_ids[model.vendor]
+            self._vendor_of.append(vendor_id)
+            self._by_vendor.setdefault(vendor_id, []).append(index)
+            if model.vid is not None:
+                self._by_vid.setdefault(model.vid, []).append(index)
+
+        from real_cameras import get_all_real_camera_names
+        popular = [fold_text(name) for name in get_all_real_camera_names()]
+        positions = {fold_text(catalog.name(index)): index for index in range(len(catalog))}
+        self._popular = {
+            positions[name]: 1 - rank / len(popular)
+            for rank, name in enumerate(popular) if name in positions
+        }
+
+    @staticmethod
+    def _build(catalog: CameraCatalog) -> Tuple[Dict[str, array], array, array]:
+        postings: Dict[str, array] = {}
+        gram_counts = array('H')
+        resolutions = array('B')
+        for index in range(len(catalog)):
+            name = catalog.name(index)
+            grams = _ngrams(fold_text(name))
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array('I')
+                posting.append(index)
+            gram_counts.append(len(grams))
+            resolution = resolution_class(name)
+            resolutions.append(_RESOLUTION_IDS.get(resolution, 0))
+        return postings, gram_counts, resolutions
+
+    def _vendor_hints(self, folded: str) -> Set[int]:
+        words = _WORD.findall(folded)
+        hints = set()
+        for i, word in enumerate(words):
+            for vendor_words, vendor_id in self._vendor_words.get(word, ()):
+                if tuple(words[i:i + len(vendor_words)]) == vendor_words:
+                    hints.add(vendor_id)
+        return hints
+
+    def _hint_score(self, index: int, vendors: Set[int], vid: Optional[int], pid: Optional[int],
+                    resolution_id: int) -> Tuple[float, Tuple[str, ...]]:
+        """Pontuação das dicas (tudo menos a semelhança de n-gramas) de um modelo."""
+        reasons = []
+        score = 0.0
+        if self._vendor_of[index] in vendors:
+            score += VENDOR_WEIGHT
+            reasons.append("vendor")
+        if vid is not None:
+            model = self.catalog[index]
+            if model.vid == vid:
+                score += USB_VENDOR_WEIGHT
+                reasons.append("usb_vendor")
+                if model.pid == pid:
+                    score += USB_MODEL_WEIGHT
+                    reasons.append("usb_model")
+        if resolution_id and self._resolutions[index] == resolution_id:
+            score += RESOLUTION_WEIGHT
+            reasons.append("resolution")
+        popular = self._popular.get(index)
+        if popular is not None:
+            score += POPULAR_WEIGHT * popular
+            reasons.append("popular")
+        return score, tuple(reasons)
+
+    def suggest(self, name: str, device_path: Optional[str] = None,
+                resolution: Optional[str] = None, k: int = DEFAULT_TOP_K) -> List[Suggestion]:
+        """
+        Sugere nomes do catálogo para uma câmera.
+
+        Args:
+            name: Nome atual da câmera
+            device_path: Caminho do dispositivo (fornece o VID/PID de câmeras USB)
+            resolution: Classe de resolução (padrão: a citada no nome, se houver)
+            k: Número de sugestões
+
+        Returns:
+            Até k sugestões, da mais para a menos indicada (o próprio nome atual
+            nunca é sugerido)
+        """
+        folded = fold_text(name or "")
+        grams = _ngrams(folded) if folded else set()
+
+        # N-gramas mais raros primeiro; os comuns demais para o orçamento não
+        # geram candidatos e as contagens dos candidatos são refeitas no fim
+        postings = sorted((posting for posting in map(self._postings.get, grams) if posting), key=len)
+        shared: Counter = Counter()
+        budget = _POSTING_BUDGET
+        exact = True
+        for posting in postings:
+            if len(posting) > budget:
+                exact = False
+                break
+            shared.update(posting)
+            budget -= len(posting)
+
+        vendors = self._vendor_hints(folded)
+        vid, pid = usb_ids(device_path)
+        if resolution is None:
+            resolution = resolution_class(name or "")
+        resolution_id = _RESOLUTION_IDS.get(resolution, 0)
+
+        candidates = {index for index, _ in shared.most_common(_CANDIDATES)}
+        for vendor_id in vendors:
+            candidates.update(self._by_vendor.get(vendor_id, ())[:_CANDIDATES])
+        if vid is not None:
+            candidates.update(self._by_vid.get(vid, ())[:_CANDIDATES])
+        candidates.update(self._popular)
+
+        catalog = self.catalog
+        scored = []
+        for index in candidates:
+            common = shared.get(index, 0)
+            similarity = 2 * common / (len(grams) + self._gram_counts[index]) if common else 0.0
+            hints, reasons = self._hint_score(index, vendors, vid, pid, resolution_id)
+            scored.append((similarity + hints, -index, similarity, reasons))
+
+        if not exact:
+            # Contagens parciais: refaz a semelhança dos melhores com todos os n-gramas
+            rescored = []
+            for score, index, similarity, reasons in heapq.nlargest(_RESCORE_FACTOR * k + _CANDIDATES // 8, scored):
+                common = len(grams & _ngrams(fold_text(catalog.name(-index))))
+                exact_similarity = 2 * common / (len(grams) + self._gram_counts[-index])
+                rescored.append((score - similarity + exact_similarity, index, exact_similarity, reasons))
+            scored = rescored
+
+        suggestions = []
+        for score, index, similarity, reasons in heapq.nlargest(k + 1, scored):
+            candidate = catalog.name(-index)
+            if fold_text(candidate) == folded:
+                continue
+            if similarity:
+                reasons = ("ngram",) + reasons
+            suggestions.append(Suggestion(candidate, catalog.vendor(-index), score, reasons))
+        return suggestions[:k]
+
+    def suggest_many(self, cameras: Iterable[Union[str, Dict]], k: int = DEFAULT_TOP_K) -> List[List[Suggestion]]:
+        """
+        Sugere nomes para várias câmeras de uma vez.
+
+        Args:
+            cameras: Nomes ou dicionários de câmera ('name' e, se houver,
+                'device_path' e 'resolution')
+            k: Número de sugestões por câmera
+
+        Returns:
+            Lista de sugestões de cada câmera, na ordem de cameras
+        """
+        results: List[List[Suggestion]] = []
+        seen: Dict[Tuple, List[Suggestion]] = {}
+        for camera in cameras:
+            if isinstance(camera, str):
+                camera = {'name': camera}
+            key = (camera.get('name'), camera.get('device_path'), camera.get('resolution'))
+            if key not in seen:
+                seen[key] = self.suggest(*key, k=k)
+            results.append(seen[key])
+        return results
+
+    def save(self, path: PathLike):
+        """Grava o índice de n-gramas (com a impressão digital do catálogo)."""
+        data = {
+            'version': CACHE_VERSION,
+            'fingerprint': self.catalog.fingerprint(),
+            'ngram_size': NGRAM_SIZE,
+            'byteorder': sys.byteorder,
+            'postings': {gram: _encode(posting) for gram, posting in self._postings.items()},
+            'gram_counts': _encode(self._gram_counts),
+            'resolutions': _encode(self._resolutions),
+        }
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: PathLike, catalog: CameraCatalog) -> Optional["SuggestionIndex"]:
+        """
+        Carrega um índice gravado com save.
+
+        Returns:
+            O índice, ou None se o arquivo é de outro catálogo ou de outra versão
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if (data.get('version') != CACHE_VERSION or data.get('ngram_size') != NGRAM_SIZE
+                or data.get('fingerprint') != catalog.fingerprint()):
+            return None
+        swap = data['byteorder'] != sys.byteorder
+        postings = {gram: _decode('I', text, swap) for gram, text in data['postings'].items()}
+        return cls(catalog, postings, _decode('H', data['gram_counts'], swap),
+                   _decode('B', data['resolutions'], swap))
+
+
+_index: Optional[SuggestionIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_cache_path() -> Path:
+    """Caminho do cache do índice (no diretório do arquivo de backup)."""
+    from camera_utils import get_backup_path
+    return get_backup_path().parent / CACHE_FILE
+
+
+def get_suggestion_index() -> SuggestionIndex:
+    """
+    Retorna o índice do catálogo padrão: carregado do cache em disco ou,
+    se o cache não existe ou é de outro catálogo, construído e gravado.
+    """
+    global _index
+    catalog = get_catalog()
+    with _index_lock:
+        if _index is not None and _index.catalog is catalog:
+            return _index
+
+        cache_path = get_cache_path()
+        index = None
+        if cache_path.exists():
+            try:
+                index = SuggestionIndex.load(cache_path, catalog)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Cache de sugestões inválido ({cache_path}): {e}")
+        if index is None:
+            index = SuggestionIndex(catalog)
+            try:
+                index.save(cache_path)
+            except OSError as e:
+                print(f"Erro ao gravar cache de sugestões: {e}")
+        _index = index
+        return index
+
+
+def suggest_names(cameras: Iterable[Union[str, Dict]], k: int = DEFAULT_TOP_K) -> List[List[Suggestion]]:
+    """Sugere nomes para várias câmeras com o índice padrão (veja SuggestionIndex.suggest_many)."""
+    return get_suggestion_index().suggest_many(cameras, k)
@@ -0,0 +1,118 @@
+"""
+Camera Spoofer - Estatísticas das Operações
+Contadores das operações no registro (chaves abertas, valores enumerados, bytes
+comparados, acessos negados, entradas encontradas, escritas) e tempo de cada
+fase de uma operação.
+
+As funções instrumentadas recebem stats=None por padrão; nesse caso nada é
+contado nem cronometrado.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+# Fases de uma operação
+PHASE_ENUMERATION = "enumeration"  # Percorrer o registro (varredura ou construção do índice)
+PHASE_SEARCH = "search"            # Procurar os nomes em dados já lidos (índice)
+PHASE_BACKUP = "backup"            # Ler e gravar o backup
+PHASE_WRITE = "write"              # Escrever no registro
+
+PHASE_LABELS = {
+    PHASE_ENUMERATION: "enumeração",
+    PHASE_SEARCH: "busca",
+    PHASE_BACKUP: "backup",
+    PHASE_WRITE: "escrita",
+}
+
+COUNTERS = ("keys_opened", "values_enumerated", "bytes_compared", "access_denied", "matches", "writes")
+
+
+class OperationStats:
+    """
+    Contadores e tempos de uma operação.
+
+    Os contadores são atributos incrementados diretamente pelo código que
+    percorre o registro. Cada thread da varredura paralela usa o seu próprio
+    objeto, somado periodicamente ao da operação com merge(since=...). Outra
+    thread pode ler os contadores durante a operação para mostrar o progresso.
+    """
+
+    __slots__ = COUNTERS + ("phases", "_lock")
+
+    def __init__(self):
+        self.keys_opened = 0
+        self.values_enumerated = 0
+        self.bytes_compared = 0  # Valores de texto comparados, em UTF-16 (2 bytes por caractere)
+        self.access_denied = 0   # Chaves ignoradas por falta de permissão
+        self.matches = 0         # Entradas encontradas que serão escritas
+        self.writes = 0
+        self.phases: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def merge(self, other: "OperationStats", since: Optional["OperationStats"] = None):
+        """
+        Soma os contadores e tempos de outro objeto a este.
+
+        Args:
+            other: Contadores a somar
+            since: Cópia anterior de other (snapshot) já somada; só a diferença é somada
+        """
+        with self._lock:
+            for counter in COUNTERS:
+                delta = getattr(other, counter) - (getattr(since, counter) if since is not None else 0)
+                setattr(self, counter, getattr(self, counter) + delta)
+            for name, seconds in other.phases.items():
+                delta = seconds - (since.phases.get(name, 0.0) if since is not None else 0.0)
+                self.phases[name] = self.phases.get(name, 0.0) + delta
+
+    def snapshot(self) -> "OperationStats":
+        """Cópia dos contadores e tempos atuais."""
+        copy = OperationStats()
+        with self._lock:
+            for counter in COUNTERS:
+                setattr(copy, counter, getattr(self, counter))
+            copy.phases = dict(self.phases)
+        return copy
+
+    @contextmanager
+    def phase(self, name: str):
+        """Soma o tempo do bloco à fase (fases repetidas são acumuladas)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def to_dict(self) -> Dict:
+        """Representação para JSON (tempos em milissegundos)."""
+        data = {counter: getattr(self, counter) for counter in COUNTERS}
+        data['phases_ms'] = {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()}
+        return data
+
+    def summary(self) -> str:
+        """Resumo curto para a barra de status."""
+        parts = [f"{self.keys_opened} chaves", f"{self.values_enumerated} valores"]
+        if self.access_denied:
+            parts.append(f"{self.access_denied} sem acesso")
+        if self.matches:
+            parts.append(f"{self.matches} encontradas")
+        if self.writes:
+            parts.append(f"{self.writes} escritas")
+        for name, seconds in self.phases.items():
+            parts.append(f"{PHASE_LABELS.get(name, name)} {seconds * 1000:.0f} ms")
+        return " · ".join(parts)
+
+
+@contextmanager
+def measure(stats: Optional[OperationStats], name: str):
+    """Cronometra o bloco na fase indicada (sem custo quando stats é None)."""
+    if stats is None:
+        yield
+        return
+    with stats.phase(name):
+        yield
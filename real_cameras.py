@@ -3,77 +3,102 @@ Camera Spoofer - Listas de Câmeras
 Contém padrões para detectar câmeras virtuais e nomes de câmeras reais para substituição.
 """
 
-# Padrões para identificar câmeras virtuais (case-insensitive)
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from name_matcher import NameMatcher
+
+# Padrões para identificar câmeras virtuais, agrupados por família de driver (case-insensitive)
+VIRTUAL_CAMERA_FAMILIES = {
+    "OBS Studio": [
+        "obs virtual camera",
+        "obs-camera",
+        "obs virtual",
+    ],
+    "NDI": [  # NewTek Network Device Interface
+        "newtek ndi video",
+        "ndi virtual input",
+        "ndi webcam input",
+        "ndi video",
+    ],
+    "vMix": [
+        "vmix video",
+        "vmix video virtual webcam",
+        "vmix virtual",
+    ],
+    "ManyCam": [
+        "manycam virtual webcam",
+        "manycam",
+    ],
+    "XSplit": [
+        "xsplit vcam",
+        "xsplit broadcaster",
+    ],
+    "Snap Camera": [
+        "snap camera",
+        "snapcamera",
+    ],
+    "SplitCam": [
+        "splitcam video driver",
+        "splitcam",
+    ],
+    "CyberLink YouCam": [
+        "cyberlink youcam",
+        "youcam",
+    ],
+    "Prism Live Studio": [
+        "prism live studio",
+        "prism live",
+    ],
+    "e2eSoft VCam": [
+        "e2esoft vcam",
+        "e2esoft ivcam",
+        "vcam",
+    ],
+    "EpocCam": [
+        "epoccam camera",
+        "epoccam",
+    ],
+    "AlterCam": [
+        "altercam virtual webcam",
+        "altercam",
+    ],
+    "DroidCam": [
+        "droidcam source",
+        "droidcam",
+    ],
+    "iVCam": [
+        "ivcam",
+    ],
+    "CamTwist": [
+        "camtwist",
+    ],
+    "Outros": [
+        "virtual camera",
+        "virtual webcam",
+        "fake camera",
+        "screen capture",
+        "capture card",
+    ],
+}
+
+# Lista plana de padrões, na ordem das famílias
 VIRTUAL_CAMERA_PATTERNS = [
-    # OBS Studio
-    "obs virtual camera",
-    "obs-camera",
-    "obs virtual",
-    
-    # NDI (NewTek Network Device Interface)
-    "newtek ndi video",
-    "ndi virtual input",
-    "ndi webcam input",
-    "ndi video",
-    
-    # vMix
-    "vmix video",
-    "vmix video virtual webcam",
-    "vmix virtual",
-    
-    # ManyCam
-    "manycam virtual webcam",
-    "manycam",
-    
-    # XSplit
-    "xsplit vcam",
-    "xsplit broadcaster",
-    
-    # Snap Camera
-    "snap camera",
-    "snapcamera",
-    
-    # SplitCam
-    "splitcam video driver",
-    "splitcam",
-    
-    # CyberLink YouCam
-    "cyberlink youcam",
-    "youcam",
-    
-    # Prism Live Studio
-    "prism live studio",
-    "prism live",
-    
-    # e2eSoft VCam
-    "e2esoft vcam",
-    "e2esoft ivcam",
-    "vcam",
-    
-    # EpocCam
-    "epoccam camera",
-    "epoccam",
-    
-    # AlterCam
-    "altercam virtual webcam",
-    "altercam",
-    
-    # DroidCam
-    "droidcam source",
-    "droidcam",
-    
-    # iVCam
-    "ivcam",
-    
-    # CamTwist
-    "camtwist",
-    
-    # Outros
-    "virtual camera",
-    "virtual webcam",
-    "fake camera",
-    "screen capture",
-    "capture card",
+    pattern for patterns in VIRTUAL_CAMERA_FAMILIES.values() for pattern in patterns
+]
+
+# Família de cada padrão
+VIRTUAL_CAMERA_PATTERN_FAMILIES = {
+    pattern: family
+    for family, patterns in VIRTUAL_CAMERA_FAMILIES.items()
+    for pattern in patterns
+}
+
+# Marcas de câmeras físicas conhecidas (case-insensitive)
+KNOWN_BRANDS = [
+    'logitech', 'microsoft', 'dell', 'hp', 'lenovo', 'asus', 'razer',
+    'creative', 'acer', 'genius', 'trust', 'elgato', 'anker', 'obsbot',
+    'insta360', 'avermedia', 'a4tech', 'canyon', 'papalook', 'webcam',
+    'facecam', 'lifecam', 'brio', 'kiyo', 'integrated', 'built-in', 'usb'
 ]
 
 # Nomes de câmeras reais para substituição (apenas as mais populares)
@@ -110,17 +135,104 @@ REAL_CAMERA_NAMES = {
     ],
 }
 
+# Lista plana dos nomes de REAL_CAMERA_NAMES, montada uma única vez
+_ALL_REAL_CAMERA_NAMES = tuple(name for brand_names in REAL_CAMERA_NAMES.values() for name in brand_names)
+
 def get_all_real_camera_names() -> list:
-    """Retorna lista plana com todos os nomes de câmeras reais."""
-    all_names = []
-    for brand_names in REAL_CAMERA_NAMES.values():
-        all_names.extend(brand_names)
-    return all_names
+    """
+    Retorna lista plana com os nomes de câmeras reais mais populares.
+    O catálogo completo (com busca) está em camera_catalog.
+    """
+    return list(_ALL_REAL_CAMERA_NAMES)
 
 def get_real_cameras_by_brand() -> dict:
     """Retorna dicionário de câmeras reais organizadas por marca."""
     return REAL_CAMERA_NAMES.copy()
 
+class CameraClassification(NamedTuple):
+    """Resultado da classificação de um nome de câmera."""
+    name: str
+    is_virtual: bool
+    pattern: Optional[str]
+    brand: Optional[str]
+    family: Optional[str] = None
+
+
+class CameraClassifier:
+    """
+    Classificador de nomes de câmera compilado uma única vez.
+    Usa autômatos de múltiplos padrões para os padrões virtuais e as marcas conhecidas,
+    com cache dos nomes já classificados.
+    """
+    
+    def __init__(self, virtual_patterns: Iterable[str], brands: Iterable[str],
+                 cache_size: int = 4096):
+        self._patterns = NameMatcher(virtual_patterns)
+        self._brands = NameMatcher(brands)
+        self._cache: Dict[str, CameraClassification] = {}
+        self._cache_size = cache_size
+    
+    def classify(self, camera_name: str) -> CameraClassification:
+        """
+        Classifica um nome de câmera.
+        A câmera é virtual se contém um padrão virtual ou se não é de uma marca
+        conhecida (na dúvida, assume virtual por ser mais seguro).
+        
+        Args:
+            camera_name: Nome da câmera para classificar
+            
+        Returns:
+            Classificação com o padrão virtual e a marca encontrados
+        """
+        result = self._cache.get(camera_name)
+        if result is not None:
+            return result
+        
+        pattern_index = self._patterns.first_match(camera_name) if camera_name else -1
+        pattern = self._patterns.patterns[pattern_index] if pattern_index >= 0 else None
+        brand_index = self._brands.first_match(camera_name) if camera_name else -1
+        brand = self._brands.patterns[brand_index] if brand_index >= 0 else None
+        
+        result = CameraClassification(
+            name=camera_name,
+            is_virtual=pattern is not None or brand is None,
+            pattern=pattern,
+            brand=brand,
+            family=VIRTUAL_CAMERA_PATTERN_FAMILIES.get(pattern),
+        )
+        
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        self._cache[camera_name] = result
+        return result
+    
+    def classify_many(self, camera_names: Iterable[str]) -> List[CameraClassification]:
+        """Classifica vários nomes de câmera de uma vez."""
+        return [self.classify(name) for name in camera_names]
+
+
+# Classificador padrão, compilado uma única vez no primeiro uso
+_camera_classifier: Optional[CameraClassifier] = None
+
+
+def get_camera_classifier() -> CameraClassifier:
+    """Retorna o classificador padrão (compilado no primeiro uso)."""
+    global _camera_classifier
+    if _camera_classifier is None:
+        _camera_classifier = CameraClassifier(VIRTUAL_CAMERA_PATTERNS, KNOWN_BRANDS)
+    return _camera_classifier
+
+
+def classify_camera(camera_name: str) -> CameraClassification:
+    """Classifica um nome de câmera com o classificador padrão."""
+    return get_camera_classifier().classify(camera_name)
+
+
+def classify_many(camera_names: Iterable[str]) -> List[CameraClassification]:
+    """Classifica vários nomes de câmera com o classificador padrão."""
+    return get_camera_classifier().classify_many(camera_names)
+
+
 def is_virtual_camera(camera_name: str) -> bool:
     """
     Verifica se o nome da câmera corresponde a uma câmera virtual conhecida.
@@ -134,24 +246,26 @@ def is_virtual_camera(camera_name: str) -> bool:
     if not camera_name:
         return False
     
-    camera_lower = camera_name.lower()
-    
-    for pattern in VIRTUAL_CAMERA_PATTERNS:
-        if pattern in camera_lower:
-            return True
-    
-    return False
+    return classify_camera(camera_name).pattern is not None
+
+# Sugestão sem nome original: Logitech C920 é a webcam mais popular do mundo
+DEFAULT_SUGGESTED_NAME = "Logitech HD Webcam C920"
 
 def get_suggested_name(original_name: str = None) -> str:
     """
     Retorna um nome de câmera real sugerido.
-    Por padrão, sugere Logitech C920 por ser a mais comum.
+    Com o nome original, usa a melhor sugestão do catálogo (veja
+    name_suggestions); sem ele, sugere a Logitech C920.
     
     Args:
-        original_name: Nome original da câmera (não usado atualmente)
+        original_name: Nome original da câmera
         
     Returns:
         Nome sugerido de câmera real
     """
-    # Logitech C920 é a webcam mais popular do mundo
-    return "Logitech HD Webcam C920"
+    if not original_name:
+        return DEFAULT_SUGGESTED_NAME
+    
+    from name_suggestions import suggest_names
+    suggestions = suggest_names([original_name], k=1)[0]
+    return suggestions[0].name if suggestions else DEFAULT_SUGGESTED_NAME
@@ -0,0 +1,362 @@
+"""
+Camera Spoofer - Exportações .reg
+Reescreve exportações do regedit (`regedit /e`) sem acessar o registro, para
+preparar imagens offline. O arquivo é lido em streaming (memória constante),
+usando a mesma lógica de busca de find_camera_registry_entries.
+
+Funciona em qualquer sistema operacional (não usa winreg).
+"""
+
+import codecs
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from camera_utils import REGISTRY_SEARCH_PATHS, make_backup_record, rename_pattern, rename_text
+from registry_index import fold_text, is_searchable_value
+from registry_scan import MAX_SEARCH_DEPTH
+
+
+# Tipos de valor que o winreg devolve como texto (e que a busca ao vivo compara)
+REG_SZ = 1
+REG_EXPAND_SZ = 2
+REG_MULTI_SZ = 7
+
+_HKLM_PREFIXES = ("hkey_local_machine\\", "hklm\\")
+_CONTROL_SET = re.compile(r"^SYSTEM\\ControlSet\d{3}(?=\\|$)", re.IGNORECASE)
+
+# Largura das linhas hex geradas (mesma quebra usada pelo regedit)
+_HEX_LINE_WIDTH = 76
+
+PathLike = Union[str, Path]
+
+
+def detect_encoding(path: PathLike) -> str:
+    """Detecta a codificação de uma exportação .reg pelo BOM."""
+    with open(path, 'rb') as f:
+        head = f.read(4)
+    if head.startswith(codecs.BOM_UTF16_LE) or head.startswith(codecs.BOM_UTF16_BE):
+        return 'utf-16'
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    return 'cp1252'
+
+
+def detect_hex_text_encoding(path: PathLike, encoding: str) -> str:
+    """
+    Codificação dos textos em dados hex(1)/hex(2)/hex(7) de uma exportação.
+
+    Depende do cabeçalho e não do BOM: "Windows Registry Editor Version 5.00"
+    grava sempre UTF-16LE, mesmo que o arquivo tenha sido regravado em UTF-8
+    ou ASCII; apenas o REGEDIT4 usa a página de código ANSI.
+    """
+    with open(path, 'r', encoding=encoding, errors='replace') as f:
+        header = f.readline().strip()
+    return 'cp1252' if header.upper() == 'REGEDIT4' else 'utf-16-le'
+
+
+def _unescape(text: str) -> str:
+    return re.sub(r'\\(.)', r'\1', text)
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _read_quoted(text: str, start: int) -> Tuple[str, int]:
+    """Lê uma string entre aspas a partir de text[start] == '"'. Retorna (texto, índice após a aspa)."""
+    i = start + 1
+    while i < len(text):
+        if text[i] == '\\':
+            i += 2
+            continue
+        if text[i] == '"':
+            return _unescape(text[start + 1:i]), i + 1
+        i += 1
+    raise ValueError(f"String sem aspas de fechamento: {text[:60]}")
+
+
+class RegValue:
+    """Valor lido de uma linha lógica de uma exportação .reg."""
+
+    def __init__(self, name: str, kind: str, data: str):
+        self.name = name
+        self.kind = kind      # 'string', 'hex(N)', 'hex', 'dword', ... ou '-'
+        self.data = data      # Texto após o tipo (sem continuações)
+
+    @property
+    def reg_type(self) -> Optional[int]:
+        if self.kind == 'string':
+            return REG_SZ
+        match = re.fullmatch(r'hex\(([0-9a-fA-F]+)\)', self.kind)
+        return int(match.group(1), 16) if match else None
+
+
+def parse_value_line(logical_line: str) -> Optional[RegValue]:
+    """
+    Interpreta uma linha lógica de valor ("nome"=dados ou @=dados).
+
+    Returns:
+        RegValue, ou None se a linha não é um valor
+    """
+    if logical_line.startswith('@='):
+        name, rest = "", logical_line[2:]
+    elif logical_line.startswith('"'):
+        name, end = _read_quoted(logical_line, 0)
+        if logical_line[end:end + 1] != '=':
+            return None
+        rest = logical_line[end + 1:]
+    else:
+        return None
+
+    if rest.startswith('"'):
+        value, _ = _read_quoted(rest, 0)
+        return RegValue(name, 'string', value)
+    if rest == '-':
+        return RegValue(name, '-', '')
+    kind, _, data = rest.partition(':')
+    return RegValue(name, kind.lower(), data)
+
+
+def decode_hex_string(data: str, reg_type: int, text_encoding: str = 'utf-16-le') -> Union[str, List[str]]:
+    """Decodifica dados hex(1)/hex(2) (texto) ou hex(7) (lista de textos)."""
+    raw = bytes(int(b, 16) for b in data.replace(' ', '').split(',') if b)
+    text = raw.decode(text_encoding, errors='replace')
+    if reg_type == REG_MULTI_SZ:
+        items = text.split('\0')
+        while items and items[-1] == '':
+            items.pop()
+        return items
+    return text.split('\0', 1)[0]
+
+
+def encode_hex_string(value: Union[str, List[str]], reg_type: int, text_encoding: str = 'utf-16-le') -> str:
+    """Codifica texto (ou lista de textos) no formato hex do regedit, sem quebras de linha."""
+    if reg_type == REG_MULTI_SZ:
+        text = ''.join(item + '\0' for item in value) + '\0'
+    else:
+        text = value + '\0'
+    return ','.join(f'{b:02x}' for b in text.encode(text_encoding))
+
+
+def format_value_line(name: str, kind: str, data: str, newline: str) -> str:
+    """Monta a(s) linha(s) físicas de um valor, quebrando dados hex como o regedit."""
+    prefix = '@=' if name == "" else f'"{_escape(name)}"='
+    if kind == 'string':
+        return f'{prefix}"{_escape(data)}"{newline}'
+
+    line = f'{prefix}{kind}:'
+    lines = []
+    pieces = data.split(',') if data else []
+    for i, byte in enumerate(pieces):
+        piece = byte + (',' if i < len(pieces) - 1 else '')
+        if len(line) + len(piece) > _HEX_LINE_WIDTH:
+            lines.append(line + '\\')
+            line = '  '
+        line += piece
+    lines.append(line)
+    return newline.join(lines) + newline
+
+
+def _iter_logical_lines(f) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Agrupa linhas físicas terminadas em '\\' em uma linha lógica.
+
+    Yields:
+        Tuplas (linha lógica sem quebras, linhas físicas originais)
+    """
+    physical: List[str] = []
+    logical = ""
+    for raw in f:
+        content = raw.rstrip('\r\n')
+        physical.append(raw)
+        if physical[1:]:
+            content = content.lstrip()
+        if content.endswith('\\'):
+            logical += content[:-1]
+            continue
+        logical += content
+        yield logical, physical
+        physical = []
+        logical = ""
+    if physical:
+        yield logical, physical
+
+
+class RegExportRewriter:
+    """
+    Reescreve exportações .reg substituindo nomes de câmera.
+
+    Args:
+        renames: Dicionário nome atual -> novo nome
+        mount_map: Prefixos de montagem de hives offline para o caminho real
+                   (ex.: {"HKEY_LOCAL_MACHINE\\OFFLINE_SYSTEM": "SYSTEM"})
+
+    Valores hex(7) (REG_MULTI_SZ) são lidos e copiados sem alteração, assim como
+    na busca ao vivo, em que o winreg os devolve como lista e não como texto
+    (o backup guarda textos, e restaurar um item da lista gravaria REG_SZ).
+    """
+
+    def __init__(self, renames: Dict[str, str], mount_map: Optional[Dict[str, str]] = None):
+        from name_matcher import NameMatcher
+
+        self.renames = dict(renames)
+        self.names = list(self.renames)
+        self.matcher = NameMatcher(self.names)
+        self._pattern = rename_pattern(self.names)
+        self.mount_map = [(fold_text(prefix).rstrip('\\'), target) for prefix, target in (mount_map or {}).items()]
+        self._roots = [fold_text(path) for _, path in REGISTRY_SEARCH_PATHS]
+
+    def relative_path(self, key_path: str) -> Optional[str]:
+        """Converte o caminho de uma chave da exportação para o caminho relativo ao HKLM."""
+        folded = fold_text(key_path)
+        for prefix, target in self.mount_map:
+            if folded == prefix or folded.startswith(prefix + '\\'):
+                key_path = target + key_path[len(prefix):]
+                return _CONTROL_SET.sub(r"SYSTEM\\CurrentControlSet", key_path)
+        for prefix in _HKLM_PREFIXES:
+            if folded.startswith(prefix):
+                return _CONTROL_SET.sub(r"SYSTEM\\CurrentControlSet", key_path[len(prefix):])
+        return None
+
+    def in_search_scope(self, relative_path: str) -> bool:
+        """Verifica se a chave seria visitada por find_camera_registry_entries."""
+        folded = fold_text(relative_path)
+        for root in self._roots:
+            if folded == root:
+                return True
+            if folded.startswith(root + '\\'):
+                return folded.count('\\') - root.count('\\') <= MAX_SEARCH_DEPTH
+        return False
+
+    def _rename_text(self, path: str, value_name: str, text: str,
+                     matched: Dict[str, List[Tuple[str, str, str]]]) -> str:
+        # Mesmo filtro da busca ao vivo: caminhos e identificadores ficam intactos
+        if not is_searchable_value(text) or not self.matcher.match_indices(text):
+            return text
+        new_text, replaced = rename_text(text, self.renames, self._pattern)
+        for old_name in replaced:
+            matched.setdefault(old_name, []).append((path, value_name, text))
+        return new_text
+
+    def rewrite(self, src_path: PathLike, out_path: Optional[PathLike] = None,
+                delta_path: Optional[PathLike] = None) -> Dict[str, List[Tuple[str, str, str]]]:
+        """
+        Lê a exportação e grava a versão reescrita e/ou um .reg apenas com as diferenças.
+
+        Args:
+            src_path: Exportação original
+            out_path: Destino da exportação completa reescrita (opcional)
+            delta_path: Destino do .reg mínimo com as chaves alteradas (opcional)
+
+        Returns:
+            Entradas encontradas por nome: {nome: [(caminho, nome do valor, valor original)]}
+        """
+        encoding = detect_encoding(src_path)
+        text_encoding = detect_hex_text_encoding(src_path, encoding)
+        matched: Dict[str, List[Tuple[str, str, str]]] = {}
+
+        out_file = open(out_path, 'w', encoding=encoding, newline='') if out_path else None
+        delta_file = open(delta_path, 'w', encoding=encoding, newline='') if delta_path else None
+        try:
+            newline = '\r\n'
+            current_key = None
+            current_path = None
+            in_scope = False
+            delta_key_written = False
+
+            with open(src_path, 'r', encoding=encoding, newline='') as f:
+                for index, (logical, physical) in enumerate(_iter_logical_lines(f)):
+                    if index == 0:
+                        newline = '\r\n' if physical[0].endswith('\r\n') else '\n'
+                        if delta_file:
+                            delta_file.write(logical.strip() + newline + newline)
+
+                    output = ''.join(physical)
+                    stripped = logical.strip()
+
+                    if stripped.startswith('[') and stripped.endswith(']'):
+                        current_key = stripped[1:-1]
+                        current_path = None if current_key.startswith('-') else self.relative_path(current_key)
+                        in_scope = current_path is not None and self.in_search_scope(current_path)
+                        delta_key_written = False
+                    elif in_scope:
+                        value = parse_value_line(stripped)
+                        if value is not None:
+                            new_line = self._rewrite_value(value, current_path, text_encoding, newline, matched)
+                            if new_line is not None:
+                                output = new_line
+                                if delta_file:
+                                    if not delta_key_written:
+                                        delta_file.write(f'[{current_key}]{newline}')
+                                        delta_key_written = True
+                                    delta_file.write(new_line)
+
+                    if out_file:
+                        out_file.write(output)
+        finally:
+            if out_file:
+                out_file.close()
+            if delta_file:
+                delta_file.close()
+
+        return matched
+
+    def _rewrite_value(self, value: RegValue, path: str, text_encoding: str, newline: str,
+                       matched: Dict[str, List[Tuple[str, str, str]]]) -> Optional[str]:
+        """Retorna as novas linhas do valor, ou None se ele não muda."""
+        reg_type = value.reg_type
+        if value.kind == 'string':
+            new_text = self._rename_text(path, value.name, value.data, matched)
+            if new_text == value.data:
+                return None
+            return format_value_line(value.name, 'string', new_text, newline)
+
+        if reg_type in (REG_SZ, REG_EXPAND_SZ):
+            text = decode_hex_string(value.data, reg_type, text_encoding)
+            new_text = self._rename_text(path, value.name, text, matched)
+            if new_text == text:
+                return None
+            data = encode_hex_string(new_text, reg_type, text_encoding)
+            return format_value_line(value.name, value.kind, data, newline)
+
+        return None
+
+
+def collect_friendly_names(src_path: PathLike, mount_map: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Lista os valores FriendlyName dentro das raízes de busca de uma exportação.
+    Usado para aplicar perfis de renomeação a imagens offline.
+    """
+    rewriter = RegExportRewriter({}, mount_map)
+    encoding = detect_encoding(src_path)
+    text_encoding = detect_hex_text_encoding(src_path, encoding)
+    names: Dict[str, None] = {}
+    in_scope = False
+
+    with open(src_path, 'r', encoding=encoding, newline='') as f:
+        for logical, _ in _iter_logical_lines(f):
+            stripped = logical.strip()
+            if stripped.startswith('[') and stripped.endswith(']'):
+                key = stripped[1:-1]
+                path = None if key.startswith('-') else rewriter.relative_path(key)
+                in_scope = path is not None and rewriter.in_search_scope(path)
+                continue
+            if not in_scope:
+                continue
+            value = parse_value_line(stripped)
+            if value is None or fold_text(value.name) != 'friendlyname':
+                continue
+            if value.kind == 'string':
+                names[value.data] = None
+            elif value.reg_type in (REG_SZ, REG_EXPAND_SZ):
+                names[decode_hex_string(value.data, value.reg_type, text_encoding)] = None
+    return list(names)
+
+
+def write_backup_file(matched: Dict[str, List[Tuple[str, str, str]]], backup_path: PathLike):
+    """Grava as entradas encontradas no mesmo formato do camera_backup.json."""
+    data = {name: make_backup_record(name, entries) for name, entries in matched.items()}
+    with open(backup_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,259 @@
+"""
+Camera Spoofer - Backend do Registro
+Ponto único de acesso ao registro. Por padrão usa o módulo winreg; um
+MemoryRegistry com a mesma interface pode substituí-lo em benchmarks,
+simulações e em sistemas sem winreg.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+# Constantes com os mesmos valores do winreg
+HKEY_LOCAL_MACHINE = 0x80000002
+KEY_QUERY_VALUE = 0x0001
+KEY_SET_VALUE = 0x0002
+KEY_ENUMERATE_SUB_KEYS = 0x0008
+KEY_READ = 0x20019
+KEY_WRITE = 0x20006
+REG_SZ = 1
+REG_EXPAND_SZ = 2
+REG_BINARY = 3
+REG_DWORD = 4
+REG_MULTI_SZ = 7
+
+_backend = None
+
+
+def get_backend():
+    """Retorna o backend atual (o módulo winreg, se nenhum outro foi definido)."""
+    global _backend
+    if _backend is None:
+        import winreg
+        _backend = winreg
+    return _backend
+
+
+def set_backend(backend):
+    """Define o backend usado por todo o acesso ao registro (None volta ao winreg)."""
+    global _backend
+    _backend = backend
+
+
+@contextmanager
+def use_backend(backend):
+    """Usa um backend temporariamente."""
+    previous = _backend
+    set_backend(backend)
+    try:
+        yield backend
+    finally:
+        set_backend(previous)
+
+
+class _Node:
+    __slots__ = ("name", "values", "subkeys", "last_write", "_value_list", "_subkey_list")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.values: Dict[str, Tuple[str, object, int]] = {}
+        self.subkeys: Dict[str, "_Node"] = {}
+        self.last_write = 0
+        self._value_list: Optional[List[Tuple[str, object, int]]] = None
+        self._subkey_list: Optional[List[str]] = None
+
+    def value_list(self) -> List[Tuple[str, object, int]]:
+        # Listas em cache para EnumValue/EnumKey por índice em O(1)
+        if self._value_list is None:
+            self._value_list = list(self.values.values())
+        return self._value_list
+
+    def subkey_list(self) -> List[str]:
+        if self._subkey_list is None:
+            self._subkey_list = [child.name for child in self.subkeys.values()]
+        return self._subkey_list
+
+    def changed(self, tick: int):
+        self.last_write = tick
+        self._value_list = None
+        self._subkey_list = None
+
+
+class MemoryKey:
+    """Handle de uma chave aberta no MemoryRegistry."""
+
+    __slots__ = ("node", "path", "access")
+
+    def __init__(self, node: _Node, path: str, access: int):
+        self.node = node
+        self.path = path
+        self.access = access
+
+    def Close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class MemoryRegistry:
+    """
+    Registro em memória com a mesma interface do winreg (OpenKey, EnumKey,
+    EnumValue, QueryValueEx, SetValueEx, QueryInfoKey, CreateKey...).
+
+    Apenas HKEY_LOCAL_MACHINE é suportada. Chaves marcadas com deny() geram
+    PermissionError ao serem abertas.
+    """
+
+    HKEY_LOCAL_MACHINE = HKEY_LOCAL_MACHINE
+    KEY_QUERY_VALUE = KEY_QUERY_VALUE
+    KEY_SET_VALUE = KEY_SET_VALUE
+    KEY_ENUMERATE_SUB_KEYS = KEY_ENUMERATE_SUB_KEYS
+    KEY_READ = KEY_READ
+    KEY_WRITE = KEY_WRITE
+    REG_SZ = REG_SZ
+    REG_EXPAND_SZ = REG_EXPAND_SZ
+    REG_BINARY = REG_BINARY
+    REG_DWORD = REG_DWORD
+    REG_MULTI_SZ = REG_MULTI_SZ
+
+    def __init__(self):
+        self._root = _Node("")
+        self._lock = threading.Lock()
+        self._denied: Set[str] = set()
+
+    # Construção -------------------------------------------------------------
+
+    def _tick(self) -> int:
+        return time.time_ns() // 100  # Unidades de 100 ns, como o FILETIME
+
+    def _find(self, path: str, node: Optional[_Node] = None) -> Optional[_Node]:
+        node = self._root if node is None else node
+        for part in path.split("\\") if path else []:
+            node = node.subkeys.get(part.casefold())
+            if node is None:
+                return None
+        return node
+
+    def _create(self, path: str) -> _Node:
+        node = self._root
+        for part in path.split("\\") if path else []:
+            child = node.subkeys.get(part.casefold())
+            if child is None:
+                child = _Node(part)
+                node.subkeys[part.casefold()] = child
+                node.changed(self._tick())
+            node = child
+        return node
+
+    def set(self, path: str, value_name: str, value, value_type: int = REG_SZ):
+        """Cria a chave (se necessário) e grava um valor, sem abrir handles."""
+        with self._lock:
+            node = self._create(path)
+            node.values[value_name.casefold()] = (value_name, value, value_type)
+            node.changed(self._tick())
+
+    def deny(self, path: str):
+        """Faz a abertura da chave (e das subchaves) gerar PermissionError."""
+        self._denied.add(path.casefold())
+
+    def add_key(self, path: str):
+        """Cria uma chave vazia (e as chaves pai)."""
+        with self._lock:
+            self._create(path)
+
+    def delete_key(self, path: str):
+        """Remove uma chave e suas subchaves."""
+        parent_path, _, name = path.rpartition("\\")
+        with self._lock:
+            parent = self._find(parent_path)
+            if parent is not None and parent.subkeys.pop(name.casefold(), None) is not None:
+                parent.changed(self._tick())
+
+    def iter_keys(self, path: str = "") -> Iterator[str]:
+        """Percorre os caminhos de todas as chaves abaixo de path."""
+        node = self._find(path)
+        if node is None:
+            return
+        stack = [(path, node)]
+        while stack:
+            current, node = stack.pop()
+            yield current
+            for child in reversed(list(node.subkeys.values())):
+                stack.append((f"{current}\\{child.name}" if current else child.name, child))
+
+    def key_count(self, path: str = "") -> int:
+        return sum(1 for _ in self.iter_keys(path))
+
+    # Interface do winreg ----------------------------------------------------
+
+    def _resolve(self, key, sub_key: str) -> str:
+        if isinstance(key, MemoryKey):
+            return f"{key.path}\\{sub_key}" if sub_key else key.path
+        if key != HKEY_LOCAL_MACHINE:
+            raise FileNotFoundError(f"Chave raiz não suportada: {key}")
+        return sub_key
+
+    def OpenKey(self, key, sub_key: str, reserved: int = 0, access: int = KEY_READ) -> MemoryKey:
+        path = self._resolve(key, sub_key)
+        if self._denied:
+            folded = path.casefold()
+            if any(folded == denied or folded.startswith(denied + "\\") for denied in self._denied):
+                raise PermissionError(13, "Acesso negado", path)
+        # Como no winreg, abrir relativo a um handle percorre apenas o caminho relativo
+        node = self._find(sub_key, key.node) if isinstance(key, MemoryKey) else self._find(path)
+        if node is None:
+            raise FileNotFoundError(2, "O sistema não pode encontrar o arquivo especificado", path)
+        return MemoryKey(node, path, access)
+
+    OpenKeyEx = OpenKey
+
+    def CreateKey(self, key, sub_key: str) -> MemoryKey:
+        path = self._resolve(key, sub_key)
+        with self._lock:
+            node = self._create(path)
+        return MemoryKey(node, path, KEY_WRITE)
+
+    def CloseKey(self, key):
+        pass
+
+    def EnumKey(self, key: MemoryKey, index: int) -> str:
+        subkeys = key.node.subkey_list()
+        if index >= len(subkeys):
+            raise OSError(259, "Não há mais dados disponíveis")
+        return subkeys[index]
+
+    def EnumValue(self, key: MemoryKey, index: int) -> Tuple[str, object, int]:
+        values = key.node.value_list()
+        if index >= len(values):
+            raise OSError(259, "Não há mais dados disponíveis")
+        return values[index]
+
+    def QueryValueEx(self, key: MemoryKey, value_name: str) -> Tuple[object, int]:
+        entry = key.node.values.get((value_name or "").casefold())
+        if entry is None:
+            raise FileNotFoundError(2, "O sistema não pode encontrar o arquivo especificado", value_name)
+        return entry[1], entry[2]
+
+    def QueryInfoKey(self, key: MemoryKey) -> Tuple[int, int, int]:
+        node = key.node
+        return len(node.subkeys), len(node.values), node.last_write
+
+    def SetValueEx(self, key: MemoryKey, value_name: str, reserved: int, value_type: int, value):
+        if not key.access & KEY_SET_VALUE:
+            raise PermissionError(5, "Acesso negado", key.path)
+        with self._lock:
+            key.node.values[(value_name or "").casefold()] = (value_name or "", value, value_type)
+            key.node.changed(self._tick())
+
+    def DeleteValue(self, key: MemoryKey, value_name: str):
+        with self._lock:
+            if key.node.values.pop((value_name or "").casefold(), None) is None:
+                raise FileNotFoundError(2, "O sistema não pode encontrar o arquivo especificado", value_name)
+            key.node.changed(self._tick())
+
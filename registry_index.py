@@ -0,0 +1,266 @@
+"""
+Camera Spoofer - Índice do Registro
+Índice invertido em memória dos valores de texto encontrados nas raízes do registro.
+Permite buscar, renomear e restaurar sem percorrer o registro novamente.
+"""
+
+import re
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Orçamento padrão de memória do índice (64 MiB)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Tamanho dos n-gramas usados na tabela de substrings
+NGRAM_SIZE = 3
+
+# Com até tantos candidatos a busca para de intersectar listas e compara o texto direto
+_VERIFY_LIMIT = 64
+
+# Valores que identificam dispositivos ou arquivos e nunca contêm o nome de
+# exibição de uma câmera: caminhos de símbolo (\\?\, \??\), caminhos de arquivo,
+# GUIDs e ids de instância sem espaços ("USB\VID_046D&PID_0825\5&1a2b")
+_IDENTIFIER_VALUE = re.compile(
+    r'^(?:\\\\\?\\|\\\?\?\\|[A-Za-z]:\\|%\w+%\\|\{[0-9A-Fa-f-]{36}\}$|\S*\\\S*$)')
+
+# Custo aproximado (bytes) de cada entrada nas tabelas internas: um id de
+# 4 bytes por n-grama e o registro (tupla, id, entradas nos dicionários,
+# chave e caminho normalizado), além dos próprios textos
+_POSTING_COST = 4
+_RECORD_COST = 570
+
+
+def fold_text(text: str) -> str:
+    """Normaliza um texto para comparação sem diferenciar maiúsculas/minúsculas."""
+    return text.casefold()
+
+
+def is_searchable_value(value: str) -> bool:
+    """Indica se um valor de texto pode conter um nome de câmera (não é um identificador)."""
+    return _IDENTIFIER_VALUE.match(value) is None
+
+
+def _ngrams(folded: str) -> Set[str]:
+    """Retorna o conjunto de n-gramas de um texto já normalizado."""
+    return {folded[i:i + NGRAM_SIZE] for i in range(len(folded) - NGRAM_SIZE + 1)}
+
+
+class RegistryIndex:
+    """
+    Índice invertido de valores de texto do registro.
+
+    Cada registro é uma tupla (caminho, nome do valor, valor). O índice mantém
+    uma tabela de n-gramas do valor normalizado para localizar rapidamente os
+    registros que contêm uma substring. Identificadores (veja
+    is_searchable_value) ficam de fora.
+
+    As listas de n-gramas são arrays de ids em ordem crescente. Remover um
+    registro não mexe nelas: os ids removidos são ignorados na busca e as
+    listas são reconstruídas quando passam a ter mais ids mortos que vivos.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.over_budget = False
+        self._ready = False
+        self._records: Dict[int, Tuple[str, str, str]] = {}
+        self._keys: Dict[Tuple[str, str], int] = {}
+        self._folded_paths: Dict[str, str] = {}
+        self._value_names: Dict[str, str] = {}
+        self._postings: Dict[str, array] = {}
+        self._next_id = 0
+        self._size = 0
+        self._dead_postings = 0
+        self._stale_paths: List[str] = []
+        self._stale_keys: List[str] = []
+
+    @property
+    def is_ready(self) -> bool:
+        """True se o índice foi construído e está dentro do orçamento."""
+        return self._ready and not self.over_budget
+
+    @property
+    def stale_paths(self) -> List[str]:
+        """Subárvores invalidadas que precisam ser percorridas novamente."""
+        return list(self._stale_paths)
+
+    @property
+    def stale_keys(self) -> List[str]:
+        """Chaves invalidadas cujos próprios valores (sem subchaves) precisam ser relidos."""
+        return list(self._stale_keys)
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimativa do uso de memória do índice."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def clear(self):
+        """Descarta todo o conteúdo do índice."""
+        self._ready = False
+        self.over_budget = False
+        self._records.clear()
+        self._keys.clear()
+        self._folded_paths.clear()
+        self._value_names.clear()
+        self._postings.clear()
+        self._next_id = 0
+        self._size = 0
+        self._dead_postings = 0
+        self._stale_paths.clear()
+        self._stale_keys.clear()
+
+    def build(self, records: Iterable[Tuple[str, str, str]]) -> bool:
+        """
+        Constrói o índice a partir de uma varredura completa.
+
+        Args:
+            records: Tuplas (caminho, nome do valor, valor)
+
+        Returns:
+            True se o índice coube no orçamento de memória
+        """
+        self.clear()
+        for path, value_name, value in records:
+            if not self.add(path, value_name, value):
+                return False
+        self._ready = True
+        return True
+
+    def add(self, path: str, value_name: str, value: str) -> bool:
+        """
+        Adiciona (ou substitui) um valor no índice.
+
+        Returns:
+            False se o orçamento de memória foi excedido
+        """
+        if self.over_budget:
+            return False
+
+        folded_path = fold_text(path)
+        folded_path = self._folded_paths.setdefault(folded_path, folded_path)
+        value_name = self._value_names.setdefault(value_name, value_name)
+        folded_name = fold_text(value_name)
+        key = (folded_path, self._value_names.setdefault(folded_name, folded_name))
+        if key in self._keys:
+            self._remove_id(self._keys[key])
+        if not is_searchable_value(value):
+            return True
+
+        grams = _ngrams(fold_text(value))
+        cost = _RECORD_COST + sys.getsizeof(path) + sys.getsizeof(value) + len(grams) * _POSTING_COST
+
+        if self._size + cost > self.max_bytes:
+            # Índice grande demais: descarta tudo e volta à varredura direta
+            self.clear()
+            self.over_budget = True
+            return False
+
+        record_id = self._next_id
+        self._next_id += 1
+        self._records[record_id] = (path, value_name, value)
+        self._keys[key] = record_id
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                posting = self._postings[gram] = array('I')
+            posting.append(record_id)
+        self._size += cost
+        return True
+
+    def update_value(self, path: str, value_name: str, new_value: str) -> bool:
+        """Atualiza o índice após uma escrita no registro."""
+        return self.add(path, value_name, new_value)
+
+    def remove(self, path: str, value_name: str):
+        """Remove um valor do índice."""
+        record_id = self._keys.get((fold_text(path), fold_text(value_name)))
+        if record_id is not None:
+            self._remove_id(record_id)
+
+    def _remove_id(self, record_id: int):
+        path, value_name, value = self._records.pop(record_id)
+        del self._keys[(fold_text(path), fold_text(value_name))]
+        grams = len(_ngrams(fold_text(value)))
+        self._dead_postings += grams
+        self._size -= _RECORD_COST + sys.getsizeof(path) + sys.getsizeof(value)
+        if self._dead_postings * _POSTING_COST * 2 > self._size:
+            self._compact()
+
+    def _compact(self):
+        """Reconstrói as listas de n-gramas sem os ids dos registros removidos."""
+        self._postings.clear()
+        self._folded_paths = {key[0]: key[0] for key in self._keys}
+        for record_id, (_, _, value) in self._records.items():
+            for gram in _ngrams(fold_text(value)):
+                posting = self._postings.get(gram)
+                if posting is None:
+                    posting = self._postings[gram] = array('I')
+                posting.append(record_id)
+        self._size -= self._dead_postings * _POSTING_COST
+        self._dead_postings = 0
+
+    def invalidate(self, path: Optional[str] = None, recursive: bool = True):
+        """
+        Invalida o índice inteiro, uma subárvore ou apenas os valores de uma chave.
+
+        Args:
+            path: Caminho da subárvore alterada. Se None, descarta o índice todo.
+            recursive: Se False, invalida só os valores da própria chave
+        """
+        if path is None:
+            self.clear()
+            return
+
+        prefix = fold_text(path)
+        for key, record_id in list(self._keys.items()):
+            if key[0] == prefix or (recursive and key[0].startswith(prefix + "\\")):
+                self._remove_id(record_id)
+        stale = self._stale_paths if recursive else self._stale_keys
+        if path not in stale:
+            stale.append(path)
+
+    def mark_fresh(self, path: str):
+        """Indica que uma subárvore (ou chave) invalidada foi percorrida novamente."""
+        if path in self._stale_paths:
+            self._stale_paths.remove(path)
+        if path in self._stale_keys:
+            self._stale_keys.remove(path)
+
+    def find(self, text: str) -> List[Tuple[str, str, str]]:
+        """
+        Busca os valores que contêm o texto (sem diferenciar maiúsculas).
+
+        Returns:
+            Lista de tuplas (caminho, nome do valor, valor) na ordem da varredura
+        """
+        query = fold_text(text)
+
+        if len(query) < NGRAM_SIZE:
+            candidates = self._records.keys()
+        else:
+            postings = []
+            for gram in _ngrams(query):
+                posting = self._postings.get(gram)
+                if not posting:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                if len(candidates) <= _VERIFY_LIMIT:
+                    break
+                candidates.intersection_update(posting)
+                if not candidates:
+                    return []
+
+        results = []
+        for record_id in sorted(candidates):
+            record = self._records.get(record_id)
+            if record is not None and query in fold_text(record[2]):
+                results.append(record)
+        return results
@@ -0,0 +1,421 @@
+"""
+Camera Spoofer - Varredura do Registro
+Percorre subárvores do registro em paralelo, dividindo o trabalho por raiz e
+por subchave de primeiro nível, mantendo a ordem da varredura sequencial.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from registry_backend import get_backend
+from operation_stats import OperationStats
+
+# Profundidade máxima da busca recursiva
+MAX_SEARCH_DEPTH = 6
+
+# Número padrão de threads da varredura
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Intervalo entre as somas dos contadores das threads em stats, em segundos
+STATS_FLUSH_INTERVAL = 0.1
+
+ValueFilter = Optional[Callable[[str], bool]]
+
+
+class ScanCancelled(Exception):
+    """Varredura interrompida por pedido de cancelamento."""
+
+
+class ScanProgress(NamedTuple):
+    """Sinal de progresso emitido periodicamente por stream_values."""
+    keys_scanned: int
+    values_scanned: int
+    matches: int
+    elapsed: float       # Segundos desde o início da varredura
+    done: bool = False   # True no último sinal, ao fim da varredura
+
+
+ScanItem = Union[Tuple[str, str, str], ScanProgress]
+
+
+def _check_cancel(cancel_event: Optional[threading.Event]):
+    if cancel_event is not None and cancel_event.is_set():
+        raise ScanCancelled()
+
+
+def list_subkeys(hkey, path: str, stats: Optional[OperationStats] = None) -> List[str]:
+    """Retorna os nomes das subchaves diretas de uma chave (vazio se inacessível)."""
+    winreg = get_backend()
+
+    names = []
+    try:
+        with winreg.OpenKey(hkey, path, 0, winreg.KEY_READ) as key:
+            if stats is not None:
+                stats.keys_opened += 1
+            i = 0
+            while True:
+                try:
+                    names.append(winreg.EnumKey(key, i))
+                except OSError:
+                    break
+                i += 1
+    except PermissionError:
+        if stats is not None:
+            stats.access_denied += 1
+    except OSError:
+        pass
+    return names
+
+
+class _Frame:
+    """Chave aberta na pilha da travessia."""
+
+    __slots__ = ("handle", "name", "parent", "depth", "subkey_count", "next_subkey", "path")
+
+    def __init__(self, handle, name: str, parent: Optional["_Frame"], depth: int):
+        self.handle = handle
+        self.name = name
+        self.parent = parent
+        self.depth = depth
+        self.subkey_count = 0
+        self.next_subkey = 0
+        self.path: Optional[str] = None
+
+    def full_path(self) -> str:
+        # Montado apenas quando a chave tem um valor a retornar
+        if self.path is None:
+            self.path = f"{self.parent.full_path()}\\{self.name}"
+        return self.path
+
+
+def iter_key_values(hkey, path: str, depth: int = 0, recursive: bool = True,
+                    value_filter: ValueFilter = None,
+                    cancel_event: Optional[threading.Event] = None,
+                    stats: Optional[OperationStats] = None) -> Iterator[Tuple[str, str, str]]:
+    """
+    Percorre uma chave do registro e as suas subchaves retornando os valores de texto.
+
+    A travessia é iterativa, em profundidade e na mesma ordem de uma busca
+    recursiva. Cada subchave é aberta relativa ao handle da chave pai, que
+    fica aberto enquanto as filhas são percorridas: no máximo
+    MAX_SEARCH_DEPTH + 1 handles ficam abertos ao mesmo tempo. Os valores de
+    cada chave são lidos em uma única passada (a quantidade vem do
+    QueryInfoKey) e o caminho completo só é montado para chaves com valores a
+    retornar.
+
+    Args:
+        hkey: Chave raiz (ex.: HKEY_LOCAL_MACHINE)
+        path: Caminho da chave
+        depth: Profundidade da chave em relação à raiz de busca
+        recursive: Se False, lê apenas os valores da própria chave
+        value_filter: Função que recebe o valor e diz se ele deve ser retornado
+        cancel_event: Evento que interrompe a varredura com ScanCancelled
+        stats: Contadores a incrementar (None desativa a contagem)
+
+    Yields:
+        Tuplas (caminho, nome do valor, valor)
+    """
+    if depth > MAX_SEARCH_DEPTH:  # Limita profundidade
+        return
+
+    _check_cancel(cancel_event)
+
+    winreg = get_backend()
+
+    try:
+        handle = winreg.OpenKey(hkey, path, 0, winreg.KEY_READ)
+    except PermissionError:
+        if stats is not None:
+            stats.access_denied += 1
+        return
+    except OSError:
+        return
+
+    count_bytes = stats is not None and value_filter is not None
+    frame: Optional[_Frame] = _Frame(handle, path, None, depth)
+    frame.path = path
+    stack: List[_Frame] = []
+    try:
+        while frame is not None or stack:
+            if frame is not None:
+                # Chave recém-aberta: valores em uma passada
+                try:
+                    subkey_count, value_count, _ = winreg.QueryInfoKey(frame.handle)
+                except OSError:
+                    subkey_count = value_count = 0
+                compared = 0
+                enumerated = 0
+                for i in range(value_count):
+                    try:
+                        name, value, _ = winreg.EnumValue(frame.handle, i)
+                    except OSError:
+                        break
+                    enumerated += 1
+                    if isinstance(value, str):
+                        if count_bytes:
+                            compared += len(value)
+                        if value_filter is None or value_filter(value):
+                            yield (frame.full_path(), name, value)
+
+                if stats is not None:
+                    stats.keys_opened += 1
+                    stats.values_enumerated += enumerated
+                    stats.bytes_compared += compared * 2
+
+                if recursive and subkey_count and frame.depth < MAX_SEARCH_DEPTH:
+                    frame.subkey_count = subkey_count
+                    stack.append(frame)
+                else:
+                    winreg.CloseKey(frame.handle)
+                frame = None
+                continue
+
+            # Próxima subchave da chave no topo da pilha
+            parent = stack[-1]
+            if parent.next_subkey >= parent.subkey_count:
+                stack.pop()
+                winreg.CloseKey(parent.handle)
+                continue
+            index = parent.next_subkey
+            parent.next_subkey += 1
+            try:
+                subkey_name = winreg.EnumKey(parent.handle, index)
+            except OSError:
+                parent.next_subkey = parent.subkey_count
+                continue
+
+            _check_cancel(cancel_event)
+            try:
+                handle = winreg.OpenKey(parent.handle, subkey_name, 0, winreg.KEY_READ)
+            except PermissionError:
+                if stats is not None:
+                    stats.access_denied += 1
+                continue
+            except OSError:
+                continue
+            frame = _Frame(handle, subkey_name, parent, parent.depth + 1)
+    finally:
+        if frame is not None:
+            winreg.CloseKey(frame.handle)
+        for open_frame in stack:
+            winreg.CloseKey(open_frame.handle)
+
+
+class _AnyEvent:
+    """Dois eventos vistos como um só (is_set se qualquer um estiver ativo)."""
+
+    def __init__(self, first: threading.Event, second: Optional[threading.Event]):
+        self.first = first
+        self.second = second
+
+    def is_set(self) -> bool:
+        return self.first.is_set() or (self.second is not None and self.second.is_set())
+
+
+class _Task:
+    """Uma subárvore da varredura em streaming e as entradas já encontradas."""
+
+    __slots__ = ("hkey", "path", "depth", "recursive", "entries", "done", "error")
+
+    def __init__(self, hkey, path: str, depth: int, recursive: bool):
+        self.hkey = hkey
+        self.path = path
+        self.depth = depth
+        self.recursive = recursive
+        self.entries: List[Tuple[str, str, str]] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+
+
+def _run_tasks(tasks: List[_Task], next_index: Callable[[], int], value_filter: ValueFilter,
+               cancel_event, condition: threading.Condition, stats: OperationStats):
+    # Cada thread pega a próxima tarefa livre e conta no seu próprio objeto
+    while True:
+        index = next_index()
+        if index >= len(tasks) or cancel_event.is_set():
+            return
+        task = tasks[index]
+        try:
+            for entry in iter_key_values(task.hkey, task.path, task.depth, task.recursive,
+                                         value_filter, cancel_event, stats):
+                with condition:
+                    task.entries.append(entry)
+                    condition.notify()
+        except BaseException as e:
+            task.error = e
+        finally:
+            with condition:
+                task.done = True
+                condition.notify()
+
+
+def stream_values(roots: List[Tuple], workers: Optional[int] = None,
+                  value_filter: ValueFilter = None,
+                  cancel_event: Optional[threading.Event] = None,
+                  stats: Optional[OperationStats] = None,
+                  heartbeat: Optional[float] = None) -> Iterator[ScanItem]:
+    """
+    Percorre várias raízes do registro devolvendo cada entrada assim que ela
+    é encontrada, intercaladas com sinais de progresso.
+
+    Cada raiz é dividida em uma tarefa para os próprios valores e uma tarefa
+    por subchave de primeiro nível, percorridas por threads. As entradas saem
+    na mesma ordem da varredura sequencial: as da tarefa atual imediatamente,
+    as das seguintes quando chega a vez delas. Fechar o gerador antes do fim
+    (break, por exemplo) interrompe a varredura.
+
+    Com uma única thread e sem heartbeat a varredura acontece na própria
+    thread de quem itera, sem dividir as raízes.
+
+    Args:
+        roots: Lista de (chave raiz, caminho) ou (chave raiz, caminho, profundidade)
+        workers: Número de threads (padrão DEFAULT_WORKERS)
+        value_filter: Função que recebe o valor e diz se ele deve ser retornado
+        cancel_event: Evento que interrompe a varredura com ScanCancelled
+        stats: Contadores a incrementar (None desativa a contagem)
+        heartbeat: Intervalo entre sinais de progresso, em segundos (None emite
+            apenas o sinal final)
+
+    Yields:
+        Tuplas (caminho, nome do valor, valor) e ScanProgress
+    """
+    workers = max(1, DEFAULT_WORKERS if workers is None else workers)
+    roots = [(root[0], root[1], root[2] if len(root) > 2 else 0) for root in roots]
+
+    start = time.monotonic()
+    counters = [OperationStats()]
+    matches = 0
+
+    def progress(done: bool = False) -> ScanProgress:
+        keys = sum(counter.keys_opened for counter in counters)
+        values = sum(counter.values_enumerated for counter in counters)
+        return ScanProgress(keys, values, matches, time.monotonic() - start, done)
+
+    if workers <= 1 and heartbeat is None:
+        # Na thread de quem itera os contadores vão direto para stats
+        counter = stats if stats is not None else counters[0]
+        keys, values = counter.keys_opened, counter.values_enumerated
+        for hkey, path, depth in roots:
+            for entry in iter_key_values(hkey, path, depth, value_filter=value_filter,
+                                         cancel_event=cancel_event, stats=counter):
+                matches += 1
+                yield entry
+        yield ScanProgress(counter.keys_opened - keys, counter.values_enumerated - values, matches,
+                           time.monotonic() - start, done=True)
+        return
+
+    import itertools
+
+    # Cópia de cada contador já somada em stats: cada soma leva só a diferença
+    flushed: Dict[int, OperationStats] = {}
+
+    def flush():
+        for i, counter in enumerate(counters):
+            current = counter.snapshot()
+            stats.merge(current, since=flushed.get(i))
+            flushed[i] = current
+
+    stop = threading.Event()
+    task_cancel = _AnyEvent(stop, cancel_event)
+    condition = threading.Condition()
+    tasks: List[_Task] = []
+    threads: List[threading.Thread] = []
+    try:
+        for hkey, path, depth in roots:
+            _check_cancel(cancel_event)
+            tasks.append(_Task(hkey, path, depth, False))
+            if depth >= MAX_SEARCH_DEPTH:
+                continue
+            for subkey_name in list_subkeys(hkey, path, counters[0]):
+                tasks.append(_Task(hkey, f"{path}\\{subkey_name}", depth + 1, True))
+
+        next_index = itertools.count().__next__
+        for i in range(min(workers, len(tasks))):
+            counters.append(OperationStats())
+            thread = threading.Thread(target=_run_tasks, name=f"registry-scan-{i}", daemon=True,
+                                      args=(tasks, next_index, value_filter, task_cancel, condition, counters[-1]))
+            thread.start()
+            threads.append(thread)
+
+        next_beat = start + heartbeat if heartbeat is not None else None
+        next_flush = start + STATS_FLUSH_INTERVAL if stats is not None else None
+        consumed = 0
+        for task in tasks:
+            while True:
+                with condition:
+                    while consumed == len(task.entries) and not task.done:
+                        deadlines = [deadline for deadline in (next_beat, next_flush) if deadline is not None]
+                        if not deadlines:
+                            condition.wait()
+                            continue
+                        remaining = min(deadlines) - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        condition.wait(remaining)
+                    pending = task.entries[consumed:]
+                    consumed += len(pending)
+                    finished = task.done and consumed == len(task.entries)
+
+                for entry in pending:
+                    matches += 1
+                    yield entry
+                if next_flush is not None and time.monotonic() >= next_flush:
+                    flush()
+                    next_flush = time.monotonic() + STATS_FLUSH_INTERVAL
+                if next_beat is not None and time.monotonic() >= next_beat:
+                    yield progress()
+                    next_beat = time.monotonic() + heartbeat
+                _check_cancel(cancel_event)
+
+                if finished:
+                    if task.error is not None:
+                        raise task.error
+                    task.entries = []
+                    consumed = 0
+                    break
+
+        yield progress(done=True)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        if stats is not None:
+            flush()
+
+
+def scan_values(roots: List[Tuple], workers: Optional[int] = None,
+                value_filter: ValueFilter = None,
+                cancel_event: Optional[threading.Event] = None,
+                stats: Optional[OperationStats] = None) -> Iterator[Tuple[str, str, str]]:
+    """
+    Percorre várias raízes do registro, em paralelo quando workers > 1.
+
+    Cada raiz é dividida em uma tarefa para os próprios valores e uma tarefa por
+    subchave de primeiro nível. Os resultados são devolvidos na mesma ordem da
+    varredura sequencial.
+
+    Args:
+        roots: Lista de (chave raiz, caminho) ou (chave raiz, caminho, profundidade)
+        workers: Número de threads (padrão DEFAULT_WORKERS)
+        value_filter: Função que recebe o valor e diz se ele deve ser retornado
+        cancel_event: Evento que interrompe a varredura com ScanCancelled
+        stats: Contadores a incrementar (None desativa a contagem)
+
+    Yields:
+        Tuplas (caminho, nome do valor, valor)
+    """
+    workers = DEFAULT_WORKERS if workers is None else workers
+
+    roots = [(root[0], root[1], root[2] if len(root) > 2 else 0) for root in roots]
+
+    if workers <= 1:
+        for hkey, path, depth in roots:
+            yield from iter_key_values(hkey, path, depth, value_filter=value_filter,
+                                       cancel_event=cancel_event, stats=stats)
+        return
+
+    for item in stream_values(roots, workers, value_filter, cancel_event, stats):
+        if not isinstance(item, ScanProgress):
+            yield item
@@ -0,0 +1,226 @@
+"""
+Camera Spoofer - Monitoramento do Registro
+Detecta câmeras conectadas, removidas ou renomeadas comparando o horário da
+última escrita (QueryInfoKey) de cada chave das raízes indexadas, e relê no
+índice apenas as chaves e subárvores que mudaram.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from registry_backend import HKEY_LOCAL_MACHINE, get_backend
+from registry_scan import MAX_SEARCH_DEPTH
+
+
+# Intervalo entre verificações, em segundos
+DEFAULT_INTERVAL = 2.0
+
+# Tempo sem novas mudanças antes de notificar (agrupa rajadas de escritas)
+DEFAULT_DEBOUNCE = 0.5
+
+# Espera máxima de uma rajada antes de notificar mesmo com mudanças em andamento
+DEFAULT_MAX_DELAY = 5.0
+
+
+def get_watch_locations() -> List[str]:
+    """
+    Subárvores monitoradas: todas as raízes indexadas (REGISTRY_SEARCH_PATHS),
+    que já contêm os locais comuns de câmeras e os de cada família.
+    """
+    from camera_utils import COMMON_CAMERA_LOCATIONS, REGISTRY_SEARCH_PATHS, SCOPED_SEARCH_LOCATIONS
+
+    locations = [path for _, path in REGISTRY_SEARCH_PATHS] + list(COMMON_CAMERA_LOCATIONS)
+    for family_locations in SCOPED_SEARCH_LOCATIONS.values():
+        locations.extend(family_locations)
+
+    folded = [path.lower() for path in locations]
+    return [
+        path for path in dict.fromkeys(locations)
+        if not any(path.lower().startswith(other + "\\") for other in folded)
+    ]
+
+
+def snapshot_last_write(locations: List[str]) -> Dict[str, int]:
+    """
+    Lê o horário da última escrita de todas as chaves das subárvores.
+    Apenas QueryInfoKey e EnumKey são usados: nenhum valor é lido.
+
+    Args:
+        locations: Caminhos em HKEY_LOCAL_MACHINE
+
+    Returns:
+        Dicionário caminho -> horário da última escrita
+    """
+    from camera_utils import _path_depth
+
+    winreg = get_backend()
+
+    times: Dict[str, int] = {}
+    stack = [(path, _path_depth(path)) for path in reversed(locations)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with winreg.OpenKey(HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_READ) as key:
+                subkey_count, _, last_write = winreg.QueryInfoKey(key)
+                times[path] = last_write
+                if depth >= MAX_SEARCH_DEPTH:
+                    continue
+                subkeys = []
+                for i in range(subkey_count):
+                    try:
+                        subkeys.append(winreg.EnumKey(key, i))
+                    except OSError:
+                        break
+        except OSError:
+            continue
+        stack.extend((f"{path}\\{name}", depth + 1) for name in reversed(subkeys))
+    return times
+
+
+def _outermost(paths) -> List[str]:
+    """Remove caminhos contidos em outro caminho da lista."""
+    result = []
+    for path in sorted(set(paths), key=str.lower):
+        if not result or not path.lower().startswith(result[-1].lower() + "\\"):
+            result.append(path)
+    return result
+
+
+class RegistryChanges(NamedTuple):
+    """Diferenças entre dois snapshots de horários de última escrita."""
+    changed: List[str]  # Chaves existentes cuja última escrita mudou (valores ou lista de subchaves)
+    added: List[str]    # Subárvores novas
+    removed: List[str]  # Subárvores removidas
+
+    def is_empty(self) -> bool:
+        return not (self.changed or self.added or self.removed)
+
+
+def diff_snapshots(before: Dict[str, int], after: Dict[str, int]) -> RegistryChanges:
+    """
+    Compara dois snapshots.
+
+    O horário de uma chave só muda quando os seus próprios valores ou a sua
+    lista de subchaves mudam, então uma chave alterada precisa apenas ter os
+    próprios valores relidos; as subchaves novas são relidas por inteiro.
+    """
+    changed = sorted(path for path, last_write in after.items()
+                     if path in before and before[path] != last_write)
+    added = _outermost(path for path in after if path not in before)
+    removed = _outermost(path for path in before if path not in after)
+    return RegistryChanges(changed, added, removed)
+
+
+class RegistryWatcher:
+    """
+    Verifica periodicamente as raízes indexadas e notifica as mudanças.
+
+    A cada verificação compara os horários de última escrita com os da
+    anterior. Quando algo muda, espera até `debounce` segundos sem novas
+    mudanças (no máximo `max_delay`), invalida no índice apenas o que mudou,
+    recarrega a lista com `load` e chama on_change(mudanças, resultado de
+    load) na thread do monitor.
+    """
+
+    def __init__(self, on_change: Callable[[RegistryChanges, object], None],
+                 load: Optional[Callable[[], object]] = None,
+                 locations: Optional[List[str]] = None,
+                 interval: float = DEFAULT_INTERVAL,
+                 debounce: float = DEFAULT_DEBOUNCE,
+                 max_delay: float = DEFAULT_MAX_DELAY,
+                 clock: Callable[[], float] = time.monotonic):
+        self.on_change = on_change
+        self.load = load
+        self.locations = locations
+        self.interval = interval
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.clock = clock
+
+        self._times: Optional[Dict[str, int]] = None
+        self._burst_base: Optional[Dict[str, int]] = None  # Snapshot anterior à rajada em andamento
+        self._first_change: Optional[float] = None
+        self._last_change: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _locations(self) -> List[str]:
+        if self.locations is None:
+            self.locations = get_watch_locations()
+        return self.locations
+
+    def poll(self) -> RegistryChanges:
+        """
+        Faz uma verificação e retorna as mudanças desde a anterior.
+        A primeira chamada apenas registra o estado inicial.
+        """
+        times = snapshot_last_write(self._locations())
+        previous, self._times = self._times, times
+        if previous is None:
+            return RegistryChanges([], [], [])
+        return diff_snapshots(previous, times)
+
+    def check(self) -> bool:
+        """
+        Verifica o registro e notifica se uma rajada de mudanças terminou.
+
+        Returns:
+            True se on_change foi chamado
+        """
+        base = self._times
+        changes = self.poll()
+        now = self.clock()
+        if not changes.is_empty():
+            if self._burst_base is None:
+                self._burst_base = base
+                self._first_change = now
+            self._last_change = now
+
+        if self._burst_base is None:
+            return False
+        if now - self._last_change < self.debounce and now - self._first_change < self.max_delay:
+            return False
+
+        # Uma única diferença entre o início e o fim da rajada
+        changes = diff_snapshots(self._burst_base, self._times)
+        self._burst_base = self._first_change = self._last_change = None
+        if changes.is_empty():
+            return False
+        self._notify(changes)
+        return True
+
+    def _notify(self, changes: RegistryChanges):
+        from camera_utils import invalidate_registry_index
+
+        for path in changes.removed + changes.added:
+            invalidate_registry_index(path)
+        for path in changes.changed:
+            invalidate_registry_index(path, recursive=False)
+        result = self.load() if self.load is not None else None
+        self.on_change(changes, result)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Erro ao monitorar o registro: {e}")
+            # Durante uma rajada, verifica no ritmo do debounce
+            wait = min(self.interval, self.debounce) if self._burst_base is not None else self.interval
+            self._stop.wait(wait)
+
+    def start(self):
+        """Inicia o monitoramento em uma thread em segundo plano."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="registry-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Interrompe o monitoramento."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,202 @@
+"""
+Camera Spoofer - Escrita no Registro
+Aplica uma lista de escritas de valores de texto agrupadas por chave: cada
+chave é aberta uma vez, o tipo original do valor é mantido, escritas que não
+mudariam o valor são puladas e cada valor escrito é relido para confirmação.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from registry_backend import HKEY_LOCAL_MACHINE, REG_EXPAND_SZ, REG_SZ, get_backend
+from operation_stats import OperationStats
+
+
+# Resultado de cada escrita
+WRITE_WRITTEN = "written"        # Valor gravado e confirmado na releitura
+WRITE_UNCHANGED = "unchanged"    # Valor já era o desejado: nada foi gravado
+WRITE_MISMATCH = "mismatch"      # Gravado, mas a releitura retornou outro valor
+WRITE_FAILED = "failed"          # Erro ao abrir a chave ou gravar o valor
+WRITE_SKIPPED = "skipped"        # Não tentada (stop_on_error após uma falha)
+
+# Tipos de texto mantidos na escrita; outros tipos são gravados como REG_SZ
+_TEXT_TYPES = (REG_SZ, REG_EXPAND_SZ)
+
+
+class WriteOutcome(NamedTuple):
+    """Resultado de uma escrita."""
+    path: str
+    value_name: str
+    status: str
+    value_type: Optional[int] = None
+    previous_value: Optional[str] = None  # Valor antes da escrita (None se não existia)
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status in (WRITE_WRITTEN, WRITE_UNCHANGED)
+
+    def to_dict(self) -> Dict:
+        data = self._asdict()
+        data['error'] = str(self.error) if self.error is not None else None
+        return data
+
+
+class WriteReport(NamedTuple):
+    """Resultados das escritas, na ordem em que foram pedidas."""
+    outcomes: List[WriteOutcome]
+
+    def count(self, status: str) -> int:
+        return sum(1 for outcome in self.outcomes if outcome.status == status)
+
+    @property
+    def written(self) -> int:
+        return self.count(WRITE_WRITTEN)
+
+    @property
+    def ok(self) -> bool:
+        return all(outcome.ok for outcome in self.outcomes)
+
+    @property
+    def first_error(self) -> Optional[Exception]:
+        """Erro da primeira escrita que falhou (ou None)."""
+        for outcome in self.outcomes:
+            if outcome.status == WRITE_MISMATCH:
+                return OSError(f"Valor relido diferente do gravado em {outcome.path}\\{outcome.value_name}")
+            if outcome.status == WRITE_FAILED:
+                return outcome.error
+        return None
+
+    def to_dict(self) -> Dict:
+        counts = {status: self.count(status)
+                  for status in (WRITE_WRITTEN, WRITE_UNCHANGED, WRITE_MISMATCH, WRITE_FAILED, WRITE_SKIPPED)}
+        return {'counts': counts, 'entries': [outcome.to_dict() for outcome in self.outcomes]}
+
+
+def group_writes(writes: List[Tuple[str, str, Optional[str]]]) -> Dict[str, List[Tuple[int, str, Optional[str]]]]:
+    """
+    Agrupa as escritas por chave (sem diferenciar maiúsculas), mantendo a ordem
+    da primeira escrita de cada chave.
+
+    Returns:
+        Dicionário caminho -> lista de (posição na lista original, nome do valor, valor)
+    """
+    groups: Dict[str, List[Tuple[int, str, Optional[str]]]] = {}
+    paths: Dict[str, str] = {}
+    for position, (path, value_name, value) in enumerate(writes):
+        path = paths.setdefault(path.lower(), path)
+        groups.setdefault(path, []).append((position, value_name, value))
+    return groups
+
+
+def _query(winreg, key, value_name: str) -> Tuple[Optional[object], Optional[int]]:
+    try:
+        return winreg.QueryValueEx(key, value_name)
+    except FileNotFoundError:
+        return None, None
+
+
+def read_values(values: List[Tuple[str, str]],
+                stats: Optional[OperationStats] = None) -> List[Tuple[Optional[object], Optional[int]]]:
+    """
+    Lê vários valores abrindo cada chave uma vez.
+
+    Args:
+        values: Lista de (caminho, nome do valor)
+        stats: Contadores a incrementar (None desativa a contagem)
+
+    Returns:
+        Lista de (valor, tipo) na ordem de values; (None, None) para valores
+        ou chaves que não existem ou não podem ser lidos
+    """
+    winreg = get_backend()
+
+    results: List[Tuple[Optional[object], Optional[int]]] = [(None, None)] * len(values)
+    for path, group in group_writes([(path, value_name, None) for path, value_name in values]).items():
+        try:
+            key = winreg.OpenKey(HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_READ)
+        except OSError as e:
+            if stats is not None and isinstance(e, PermissionError):
+                stats.access_denied += 1
+            continue
+        try:
+            if stats is not None:
+                stats.keys_opened += 1
+            for position, value_name, _ in group:
+                try:
+                    results[position] = _query(winreg, key, value_name)
+                except OSError:
+                    pass
+        finally:
+            winreg.CloseKey(key)
+    return results
+
+
+def write_values(writes: List[Tuple[str, str, str]],
+                 stats: Optional[OperationStats] = None,
+                 stop_on_error: bool = False) -> WriteReport:
+    """
+    Grava valores de texto em HKEY_LOCAL_MACHINE.
+
+    Args:
+        writes: Lista de (caminho, nome do valor, novo valor)
+        stats: Contadores a incrementar (None desativa a contagem)
+        stop_on_error: Para na primeira falha; as escritas restantes ficam
+            como WRITE_SKIPPED
+
+    Returns:
+        WriteReport com um resultado por escrita, na ordem de writes
+    """
+    winreg = get_backend()
+
+    outcomes: List[Optional[WriteOutcome]] = [None] * len(writes)
+    stopped = False
+    for path, group in group_writes(writes).items():
+        if stopped:
+            break
+        try:
+            key = winreg.OpenKey(HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_SET_VALUE | winreg.KEY_READ)
+        except OSError as e:
+            if stats is not None and isinstance(e, PermissionError):
+                stats.access_denied += 1
+            for position, value_name, _ in group:
+                outcomes[position] = WriteOutcome(path, value_name, WRITE_FAILED, error=e)
+            stopped = stop_on_error
+            continue
+
+        try:
+            if stats is not None:
+                stats.keys_opened += 1
+            for position, value_name, value in group:
+                previous, value_type = _query(winreg, key, value_name)
+                if previous == value:
+                    outcomes[position] = WriteOutcome(path, value_name, WRITE_UNCHANGED, value_type, previous)
+                    continue
+
+                value_type = value_type if value_type in _TEXT_TYPES else REG_SZ
+                previous = previous if isinstance(previous, str) else None
+                try:
+                    winreg.SetValueEx(key, value_name, 0, value_type, value)
+                    if stats is not None:
+                        stats.writes += 1
+                    written, _ = _query(winreg, key, value_name)
+                except OSError as e:
+                    if stats is not None and isinstance(e, PermissionError):
+                        stats.access_denied += 1
+                    outcomes[position] = WriteOutcome(path, value_name, WRITE_FAILED, value_type, previous, e)
+                    if stop_on_error:
+                        stopped = True
+                        break
+                    continue
+
+                status = WRITE_WRITTEN if written == value else WRITE_MISMATCH
+                outcomes[position] = WriteOutcome(path, value_name, status, value_type, previous)
+                if status == WRITE_MISMATCH and stop_on_error:
+                    stopped = True
+                    break
+        finally:
+            winreg.CloseKey(key)
+
+    return WriteReport([
+        outcome if outcome is not None else WriteOutcome(path, value_name, WRITE_SKIPPED)
+        for outcome, (path, value_name, _) in zip(outcomes, writes)
+    ])
@@ -0,0 +1,132 @@
+"""
+Camera Spoofer - Planos de Renomeação
+Resultado da busca de uma renomeação (cada valor a escrever, com o valor
+atual, o novo valor e o tipo), que pode ser revisado, salvo em arquivo e
+aplicado depois, inclusive em outras máquinas com o mesmo registro.
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from registry_writer import WriteReport
+
+
+# Versão do formato do arquivo de plano
+PLAN_VERSION = 1
+
+
+class PlannedWrite(NamedTuple):
+    """Um valor do registro que o plano vai alterar."""
+    path: str
+    value_name: str
+    old_value: str
+    new_value: str
+    value_type: int
+    names: Tuple[int, ...]  # Índices (em RenamePlan.renames) dos nomes contidos em old_value
+
+
+def compute_fingerprint(entries: Iterable[Tuple[str, str, Optional[str], Optional[int]]]) -> str:
+    """
+    Impressão digital do estado de um conjunto de valores do registro.
+
+    Args:
+        entries: Tuplas (caminho, nome do valor, valor, tipo); valor e tipo são
+            None para valores que não existem
+
+    Returns:
+        Hash hexadecimal que independe da ordem das entradas e da caixa dos
+        caminhos e nomes de valor
+    """
+    lines = sorted(
+        f"{path.lower()}\0{value_name.lower()}\0{value_type}\0{value}"
+        for path, value_name, value, value_type in entries
+    )
+    return hashlib.sha256("\n".join(lines).encode('utf-8')).hexdigest()[:32]
+
+
+class RenamePlan:
+    """
+    Escritas calculadas para um conjunto de renomeações.
+
+    fingerprint identifica o estado dos valores do plano no momento em que ele
+    foi calculado: enquanto o registro tiver os mesmos valores (e tipos), o
+    plano pode ser aplicado sem nova busca.
+    """
+
+    def __init__(self, renames: Dict[str, str], writes: Iterable[PlannedWrite],
+                 fingerprint: Optional[str] = None):
+        self.renames = dict(renames)
+        self.writes: List[PlannedWrite] = list(writes)
+        self.fingerprint = fingerprint if fingerprint is not None else compute_fingerprint(
+            (write.path, write.value_name, write.old_value, write.value_type) for write in self.writes
+        )
+
+    def __len__(self) -> int:
+        return len(self.writes)
+
+    def staged_writes(self) -> List[Tuple[str, str, str, str]]:
+        """Escritas no formato de stage_renames: (caminho, nome do valor, valor original, novo valor)."""
+        return [(write.path, write.value_name, write.old_value, write.new_value) for write in self.writes]
+
+    def entries_by_name(self) -> Dict[str, List[Tuple[str, str, str]]]:
+        """Entradas encontradas de cada nome atual (para o backup)."""
+        old_names = list(self.renames)
+        entries: Dict[str, List[Tuple[str, str, str]]] = {name: [] for name in old_names}
+        for write in self.writes:
+            for index in write.names:
+                entries[old_names[index]].append((write.path, write.value_name, write.old_value))
+        return entries
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": PLAN_VERSION,
+            "fingerprint": self.fingerprint,
+            "renames": [[old, new] for old, new in self.renames.items()],
+            "writes": [
+                [write.path, write.value_name, write.old_value, write.new_value, write.value_type,
+                 list(write.names)]
+                for write in self.writes
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RenamePlan":
+        if data.get("version") != PLAN_VERSION:
+            raise ValueError(f"Versão de plano não suportada: {data.get('version')}")
+        writes = [
+            PlannedWrite(path, value_name, old_value, new_value, value_type, tuple(names))
+            for path, value_name, old_value, new_value, value_type, names in data["writes"]
+        ]
+        return cls(dict(data["renames"]), writes, data["fingerprint"])
+
+    def save(self, path: Union[str, Path]):
+        """Grava o plano em JSON compacto (comprimido com gzip se o arquivo termina em .gz)."""
+        text = json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':'))
+        if str(path).endswith('.gz'):
+            with gzip.open(path, 'wt', encoding='utf-8') as f:
+                f.write(text)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+    def __repr__(self) -> str:
+        return f"RenamePlan({len(self.renames)} nomes, {len(self.writes)} escritas, {self.fingerprint[:8]})"
+
+
+class PlanResult(NamedTuple):
+    """Resultado da aplicação de um plano."""
+    success: bool
+    message: str
+    report: Optional["WriteReport"]  # Resultado de cada escrita (None se nada foi escrito)
+    replanned_keys: List[str]        # Chaves relidas porque mudaram desde o plano
+
+
+def load_plan(path: Union[str, Path]) -> RenamePlan:
+    """Carrega um plano gravado com RenamePlan.save."""
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return RenamePlan.from_dict(json.load(f))
@@ -0,0 +1,104 @@
+"""
+Camera Spoofer - Perfis de Renomeação
+Regras declarativas (glob ou regex) que mapeiam nomes atuais de câmeras para novos nomes.
+"""
+
+import fnmatch
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from registry_index import fold_text
+
+
+class RenameRule:
+    """
+    Regra de renomeação.
+
+    Regras glob comparam o nome inteiro (sem diferenciar maiúsculas) e usam
+    rename_to como está. Regras regex usam re.fullmatch e aceitam referências
+    a grupos em rename_to (ex.: "Logitech StreamCam \\1").
+    """
+
+    def __init__(self, pattern: str, rename_to: str, kind: str = "glob"):
+        if kind not in ("glob", "regex"):
+            raise ValueError(f"Tipo de regra inválido: {kind}")
+        self.pattern = pattern
+        self.rename_to = rename_to
+        self.kind = kind
+        if kind == "regex":
+            self._regex = re.compile(pattern, re.IGNORECASE)
+        else:
+            self._regex = re.compile(fnmatch.translate(fold_text(pattern)))
+
+    def apply(self, camera_name: str) -> Optional[str]:
+        """Retorna o novo nome se a regra se aplica ao nome, ou None."""
+        if self.kind == "regex":
+            match = self._regex.fullmatch(camera_name)
+            return match.expand(self.rename_to) if match else None
+        if self._regex.match(fold_text(camera_name)):
+            return self.rename_to
+        return None
+
+    def to_dict(self) -> Dict:
+        return {self.kind: self.pattern, "rename_to": self.rename_to}
+
+    def __repr__(self) -> str:
+        return f"RenameRule({self.pattern!r}, {self.rename_to!r}, kind={self.kind!r})"
+
+
+class RenameProfile:
+    """Lista ordenada de regras; a primeira regra que se aplica a um nome vence."""
+
+    def __init__(self, rules: Iterable[RenameRule], name: str = ""):
+        self.rules: List[RenameRule] = list(rules)
+        self.name = name
+
+    def rename_for(self, camera_name: str) -> Optional[str]:
+        """Retorna o novo nome de uma câmera, ou None se nenhuma regra se aplica."""
+        for rule in self.rules:
+            new_name = rule.apply(camera_name)
+            if new_name is not None:
+                return new_name
+        return None
+
+    def resolve(self, camera_names: Iterable[str]) -> Dict[str, str]:
+        """
+        Aplica o perfil a uma lista de nomes.
+
+        Returns:
+            Dicionário nome atual -> novo nome (apenas nomes que mudam)
+        """
+        renames = {}
+        for camera_name in camera_names:
+            new_name = self.rename_for(camera_name)
+            if new_name is not None and new_name != camera_name:
+                renames[camera_name] = new_name
+        return renames
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RenameProfile":
+        """
+        Cria um perfil a partir de um dicionário no formato:
+        {"name": "...", "rules": [{"glob": "OBS*", "rename_to": "..."},
+                                  {"regex": "NDI (\\\\d+)", "rename_to": "..."}]}
+        """
+        rules = []
+        for rule_data in data.get("rules", []):
+            if "regex" in rule_data:
+                rules.append(RenameRule(rule_data["regex"], rule_data["rename_to"], "regex"))
+            elif "glob" in rule_data:
+                rules.append(RenameRule(rule_data["glob"], rule_data["rename_to"], "glob"))
+            else:
+                raise ValueError(f"Regra sem 'glob' ou 'regex': {rule_data}")
+        return cls(rules, name=data.get("name", ""))
+
+    def to_dict(self) -> Dict:
+        return {"name": self.name, "rules": [rule.to_dict() for rule in self.rules]}
+
+
+def load_profile(path: Union[str, Path]) -> RenameProfile:
+    """Carrega um perfil de renomeação de um arquivo JSON."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return RenameProfile.from_dict(json.load(f))
@@ -0,0 +1,178 @@
+"""
+Camera Spoofer - Tempo de Inicialização
+Mede o custo de importação de cada módulo (via `python -X importtime`) e o tempo
+das fases de inicialização do aplicativo, e verifica o orçamento de importação
+dos módulos sem interface gráfica.
+
+Uso:
+    python -m startup_timing                 # relatório dos módulos sem interface
+    python -m startup_timing gui --top 20    # relatório de outro módulo
+    python -m startup_timing --check         # falha se algum módulo estourar o orçamento
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+
+# Módulos que não podem depender da interface gráfica
+NON_GUI_MODULES = [
+    "admin_utils",
+    "backup_store",
+    "benchmark",
+    "camera_catalog",
+    "camera_sources",
+    "camera_utils",
+    "cli",
+    "directshow_worker",
+    "fleet",
+    "name_matcher",
+    "name_suggestions",
+    "operation_stats",
+    "real_cameras",
+    "registry_backend",
+    "registry_index",
+    "registry_scan",
+    "registry_watcher",
+    "registry_writer",
+    "rename_plan",
+    "rename_profile",
+]
+
+# Tempo máximo de importação (acumulado) de cada módulo sem interface, em ms
+IMPORT_BUDGET_MS = 100.0
+
+# Dependências pesadas ou específicas do Windows que só podem ser
+# importadas quando o caminho de código que as usa é executado
+LAZY_ONLY_MODULES = ["tkinter", "customtkinter", "winreg", "pythoncom", "pygrabber"]
+
+
+class ImportTiming(NamedTuple):
+    """Tempo de importação de um módulo (em microssegundos)."""
+    name: str
+    level: int
+    self_us: int
+    cumulative_us: int
+
+
+def measure_imports(module: str) -> List[ImportTiming]:
+    """
+    Importa um módulo em um interpretador novo e retorna o tempo de cada importação.
+
+    Args:
+        module: Nome do módulo a importar
+
+    Returns:
+        Lista de tempos, na ordem em que as importações terminaram
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Path(__file__).parent,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Falha ao importar {module}: {result.stderr.strip().splitlines()[-1:]}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        timings.append(ImportTiming(name.strip(), level, int(parts[0]), int(parts[1])))
+    return timings
+
+
+def check_import_budget(modules: Optional[List[str]] = None,
+                        budget_ms: float = IMPORT_BUDGET_MS) -> List[str]:
+    """
+    Verifica o orçamento de importação dos módulos sem interface.
+
+    Returns:
+        Lista de violações (vazia se tudo estiver dentro do orçamento)
+    """
+    violations = []
+    for module in modules or NON_GUI_MODULES:
+        timings = measure_imports(module)
+        total_ms = timings[-1].cumulative_us / 1000 if timings else 0.0
+        if total_ms > budget_ms:
+            violations.append(f"{module}: {total_ms:.1f} ms (orçamento {budget_ms:.1f} ms)")
+        for timing in timings:
+            if timing.name.split(".")[0] in LAZY_ONLY_MODULES:
+                violations.append(f"{module}: importa {timing.name} na carga do módulo")
+    return violations
+
+
+class PhaseTimer:
+    """Cronômetro das fases de inicialização (sem custo quando desativado)."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.phases = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def report(self, stream=None):
+        """Imprime o tempo de cada fase e o total desde a criação do cronômetro."""
+        if not self.enabled:
+            return
+        stream = stream or sys.stdout
+        for name, seconds in self.phases:
+            print(f"[tempo] {name:<30} {seconds * 1000:8.1f} ms", file=stream)
+        total = time.perf_counter() - self._start
+        print(f"[tempo] {'total':<30} {total * 1000:8.1f} ms", file=stream, flush=True)
+
+
+def _print_report(module: str, top: int):
+    timings = measure_imports(module)
+    total = timings[-1].cumulative_us if timings else 0
+    print(f"{module}: {total / 1000:.1f} ms")
+    for timing in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]:
+        print(f"  {timing.self_us / 1000:7.1f} ms  {timing.cumulative_us / 1000:7.1f} ms  "
+              f"{'  ' * timing.level}{timing.name}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m startup_timing",
+                                     description="Tempo de importação dos módulos do Camera Spoofer.")
+    parser.add_argument("modules", nargs="*", help="Módulos a medir (padrão: módulos sem interface)")
+    parser.add_argument("--top", type=int, default=10, help="Importações mais caras a listar")
+    parser.add_argument("--check", action="store_true", help="Falha se o orçamento for excedido")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS,
+                        help="Orçamento de importação por módulo, em ms")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or NON_GUI_MODULES
+    if args.check:
+        violations = check_import_budget(modules, args.budget_ms)
+        for violation in violations:
+            print(violation)
+        if not violations:
+            print(f"OK: {len(modules)} módulos dentro de {args.budget_ms:.1f} ms")
+        return 1 if violations else 0
+
+    for module in modules:
+        _print_report(module, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())